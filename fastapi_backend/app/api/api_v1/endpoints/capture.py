@@ -1,19 +1,29 @@
+import asyncio
+import os
+import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, Response
 from fastapi.responses import JSONResponse, FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api import deps
-from app.crud import captures, websites, pages, screenshots, device_profiles
+from app.core.config import settings
+from app.crud import captures, websites, pages, page_links, screenshots, screenshot_diffs, device_profiles
 from app.models.capture import Capture, CaptureStatus
 from app.models.page import Page
 from app.models.screenshot import Screenshot
 from app.schemas.capture import CaptureCreate, CaptureResponse, CaptureWithDetails
-from app.schemas.page import PageCreate, PageResponse
-from app.schemas.screenshot import ScreenshotCreate, ScreenshotResponse
-from app.utils.capture import capture_website
+from app.schemas.link import BrokenLink, LinkedPage, OutboundLink
+from app.schemas.screenshot import ScreenshotDiff, SimilarScreenshot
+from app.utils.asset_cache import asset_cache
+from app.utils.diff import DiffOptions, diff_runner, overlay_path_for
+from app.utils.file_cache import ScreenshotFiles, screenshot_files
+from app.utils.image import file_digest, media_type_for
+from app.utils.similarity import HashKind, similarity_index
+from app.utils.tiles import TILE_CACHE_CONTROL, tile_path
 from app.utils.url import validate_url, extract_domain
 
 router = APIRouter()
@@ -22,51 +32,78 @@ router = APIRouter()
 @router.post("/", response_model=CaptureResponse)
 async def create_capture(
     *,
-    db: Session = Depends(deps.get_db),
-    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(deps.get_async_db),
     capture_in: CaptureCreate
 ) -> Any:
     """
-    새 캡처 작업 생성
+    새 캡처 작업 생성 (pending 상태로 큐에 등록되어 워커가 처리)
     """
+    website = None
+    if capture_in.website_id is not None:
+        website = await websites.aget(db, id=capture_in.website_id)
+        if not website:
+            raise HTTPException(status_code=404, detail="웹사이트를 찾을 수 없습니다")
+    # URL 없이 웹사이트만 지정하면 웹사이트 URL부터 캡처
+    url = capture_in.url or (website.url if website else None)
+    if not url:
+        raise HTTPException(status_code=400, detail="url 또는 website_id 가 필요합니다")
+
     # URL 검증
-    if not validate_url(capture_in.url):
+    if not validate_url(url):
         raise HTTPException(status_code=400, detail="유효하지 않은 URL입니다")
     
     # 웹사이트 존재 확인 또는 생성
-    domain = extract_domain(capture_in.url)
-    website = websites.get_by_url(db, url=domain)
-    
+    if website is None:
+        domain = extract_domain(url)
+        website = await websites.aget_by_domain(db, domain=domain)
+        if not website:
+            website = await websites.aget_by_url(db, url=url)
+
     if not website:
         # 새 웹사이트 생성
         website_create = {
             "name": domain,
-            "url": capture_in.url,
+            "url": url,
             "domain": domain
         }
-        website = websites.create(db, obj_in=website_create)
+        website = await websites.acreate(db, obj_in=website_create)
     
     # 새 캡처 작업 생성
     capture_data = {
         "website_id": website.id,
+        "url": url,
         "status": CaptureStatus.PENDING.value,
         "device_types": capture_in.device_types,
         "capture_full_page": capture_in.capture_full_page,
         "capture_dynamic_elements": capture_in.capture_dynamic_elements,
+        "reuse_render": capture_in.reuse_render,
+        "crawl": capture_in.crawl.dict() if capture_in.crawl else None,
+        "image_format": capture_in.image_format.value if capture_in.image_format else None,
+        "image_quality": capture_in.image_quality,
+        "request_policy": capture_in.request_policy.dict() if capture_in.request_policy else None,
+        "load_strategy": capture_in.load_strategy.value if capture_in.load_strategy else None,
+        "wait_for_selector": capture_in.wait_for_selector,
+        "result_max_age_seconds": capture_in.result_max_age_seconds,
+        "incremental": capture_in.incremental,
         "created_at": datetime.now(),
         "completed_at": None,
         "error": None,
         "progress": 0
     }
     
-    db_capture = captures.create(db, obj_in=capture_data)
-    
-    # 백그라운드 작업으로 캡처 실행
-    background_tasks.add_task(process_capture, db_capture.id, db)
+    db_capture = await captures.acreate(db, obj_in=capture_data)
     
     return db_capture
 
 
+@router.get("/asset-cache/stats", response_model=Dict[str, Any])
+def get_asset_cache_stats() -> Any:
+    """
+    브라우저 리소스 캐시 적중률 통계 (API/워커 프로세스 전체 합계)
+    """
+    return asset_cache.stats()
+
+
 @router.get("/{capture_id}", response_model=CaptureWithDetails)
 def get_capture(
     *,
@@ -119,129 +156,381 @@ def get_capture_status(
     }
 
 
-async def process_capture(capture_id: int, db: Session) -> None:
-    """
-    백그라운드에서 캡처 처리
-    """
-    # 캡처 정보 가져오기
-    capture_obj = captures.get(db, id=capture_id)
-    if not capture_obj:
-        return
-    
-    # 처리 중으로 상태 업데이트
-    captures.update_status(db, id=capture_id, status=CaptureStatus.PROCESSING.value)
-    
+# 버전(내용 해시)이 URL에 포함된 요청은 내용이 절대 바뀌지 않으므로 immutable
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 버전 없는 URL은 매번 ETag 로 재검증 (변경 없으면 304)
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+
+async def _get_screenshot_files(db: AsyncSession, screenshot_id: int) -> ScreenshotFiles:
+    """스크린샷 파일 메타데이터 조회 (캐시에 있으면 DB를 거치지 않음)"""
+    files = screenshot_files.get(screenshot_id)
+    if files is not None:
+        return files
+
+    screenshot = await screenshots.aget(db, id=screenshot_id)
+    if not screenshot:
+        raise HTTPException(status_code=404, detail="스크린샷을 찾을 수 없습니다")
+
+    content_hash = screenshot.content_hash
+    thumbnail_hash = screenshot.thumbnail_hash
     try:
-        website = websites.get(db, id=capture_obj.website_id)
-        if not website:
-            captures.update_error(db, id=capture_id, error="웹사이트 정보를 찾을 수 없습니다")
-            return
-        
-        # 디바이스 프로필 가져오기
-        device_settings = []
-        for device_type in capture_obj.device_types:
-            profile = device_profiles.get_by_name(db, name=device_type)
-            if profile:
-                device_settings.append({
-                    "type": device_type,
-                    "width": profile.width,
-                    "height": profile.height
-                })
-            else:
-                # 기본 설정 사용
-                if device_type.lower() == "desktop":
-                    device_settings.append({"type": device_type, "width": 1920, "height": 1080})
-                elif device_type.lower() == "tablet":
-                    device_settings.append({"type": device_type, "width": 768, "height": 1024})
-                elif device_type.lower() == "mobile":
-                    device_settings.append({"type": device_type, "width": 375, "height": 667})
-                else:
-                    device_settings.append({"type": device_type, "width": 1280, "height": 720})
-        
-        # 디바이스 설정이 없으면 에러
-        if not device_settings:
-            captures.update_error(db, id=capture_id, error="유효한 디바이스 설정이 없습니다")
-            return
-        
-        # 총 처리할 디바이스 수
-        total_devices = len(device_settings)
-        completed_devices = 0
-        
-        # 페이지 생성
-        page_data = {
-            "url": website.url,
-            "website_id": website.id,
-            "created_at": datetime.now(),
-            "title": None  # 캡처 후 업데이트
-        }
-        page = pages.create(db, obj_in=page_data)
-        
-        # 각 디바이스 타입별 캡처 실행
-        for device in device_settings:
-            try:
-                # 진행률 업데이트
-                progress = int((completed_devices / total_devices) * 100)
-                captures.update_progress(db, id=capture_id, progress=progress)
-                
-                # 캡처 실행
-                capture_result = await capture_website(
-                    url=website.url,
-                    device_type=device["type"],
-                    width=device["width"],
-                    height=device["height"],
-                    capture_full_page=capture_obj.capture_full_page,
-                    capture_dynamic_elements=capture_obj.capture_dynamic_elements
-                )
-                
-                # 페이지 제목 업데이트 (첫 캡처에서만)
-                if completed_devices == 0 and capture_result.get("title"):
-                    pages.update(db, db_obj=page, obj_in={"title": capture_result["title"]})
-                
-                # 스크린샷 저장
-                screenshot_data = {
-                    "path": capture_result["screenshot_path"],
-                    "thumbnail_path": capture_result["thumbnail_path"],
-                    "created_at": datetime.now(),
-                    "page_id": page.id,
-                    "capture_id": capture_id,
-                    "device_type": device["type"],
-                    "width": device["width"],
-                    "height": device["height"],
-                    "version": 1,  # 초기 버전
-                    "metadata": capture_result.get("metadata", {})
-                }
-                
-                screenshots.create(db, obj_in=screenshot_data)
-                
-                # 완료된 디바이스 카운트 증가
-                completed_devices += 1
-                
-                # 진행률 업데이트
-                progress = int((completed_devices / total_devices) * 100)
-                captures.update_progress(db, id=capture_id, progress=progress)
-                
-            except Exception as e:
-                captures.update_error(db, id=capture_id, error=f"디바이스 {device['type']} 캡처 중 오류: {str(e)}")
-                return
-        
-        # 모든 캡처 완료
-        captures.update_completed(db, id=capture_id)
-        
-    except Exception as e:
-        captures.update_error(db, id=capture_id, error=f"캡처 처리 중 오류: {str(e)}")
+        # 해시가 없는 이전 스크린샷은 한 번 계산해 캐시에 보관
+        if not content_hash:
+            content_hash = await asyncio.to_thread(file_digest, screenshot.path)
+        if not thumbnail_hash:
+            thumbnail_hash = await asyncio.to_thread(file_digest, screenshot.thumbnail_path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="스크린샷 파일을 찾을 수 없습니다")
+
+    files = ScreenshotFiles(
+        path=screenshot.path,
+        format=screenshot.format,
+        content_hash=content_hash,
+        thumbnail_path=screenshot.thumbnail_path,
+        thumbnail_hash=thumbnail_hash,
+        tiles_path=screenshot.tiles_path,
+    )
+    screenshot_files.set(screenshot_id, files)
+    return files
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag 와 일치하는지 여부 (약한 비교)"""
+    if if_none_match.strip() == "*":
+        return True
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def _file_response(
+    request: Request, path: str, media_type: str, content_hash: str, version: Optional[str]
+) -> Response:
+    """ETag/If-None-Match(304), Range(206), Cache-Control 을 처리하는 파일 응답"""
+    etag = f'"{content_hash}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL if version == content_hash else REVALIDATE_CACHE_CONTROL,
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
+
+    # Range / If-Range 요청은 FileResponse 가 처리 (206 Partial Content)
+    return FileResponse(path, media_type=media_type, headers=headers)
 
 
 @router.get("/screenshots/{screenshot_id}")
-def get_screenshot(
+async def get_screenshot(
     *,
-    db: Session = Depends(deps.get_db),
-    screenshot_id: int = Path(..., title="스크린샷 ID")
+    request: Request,
+    db: AsyncSession = Depends(deps.get_async_db),
+    screenshot_id: int = Path(..., title="스크린샷 ID"),
+    v: Optional[str] = Query(None, title="내용 해시 (지정하면 immutable 캐시)")
 ) -> Any:
     """
     스크린샷 이미지 조회
     """
-    screenshot = screenshots.get(db, id=screenshot_id)
+    files = await _get_screenshot_files(db, screenshot_id)
+    return _file_response(
+        request, files.path, media_type_for(files.format, files.path), files.content_hash, v
+    )
+
+
+@router.get("/screenshots/{screenshot_id}/thumbnail")
+async def get_screenshot_thumbnail(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(deps.get_async_db),
+    screenshot_id: int = Path(..., title="스크린샷 ID"),
+    v: Optional[str] = Query(None, title="내용 해시 (지정하면 immutable 캐시)")
+) -> Any:
+    """
+    스크린샷 썸네일 조회
+    """
+    files = await _get_screenshot_files(db, screenshot_id)
+    return _file_response(
+        request, files.thumbnail_path, media_type_for(None, files.thumbnail_path), files.thumbnail_hash, v
+    )
+
+
+# DZI 뷰어(OpenSeadragon 등)는 {dzi 경로에서 확장자 제외}_files/{level}/{col}_{row}.{format} 으로 타일을 요청
+_TILE_NAME = re.compile(r"^(\d+)_(\d+)\.(png|jpg|webp|avif)$")
+
+
+@router.get("/screenshots/{screenshot_id}/tiles.dzi")
+async def get_screenshot_tiles(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    screenshot_id: int = Path(..., title="스크린샷 ID")
+) -> Any:
+    """
+    스크린샷 Deep Zoom 타일 피라미드 디스크립터 조회
+    """
+    files = await _get_screenshot_files(db, screenshot_id)
+    if not files.tiles_path or not os.path.exists(files.tiles_path):
+        raise HTTPException(status_code=404, detail="타일 피라미드가 없습니다")
+
+    return FileResponse(
+        files.tiles_path,
+        media_type="application/xml",
+        headers={"Cache-Control": TILE_CACHE_CONTROL}
+    )
+
+
+@router.get("/screenshots/{screenshot_id}/tiles_files/{level}/{tile_name}")
+async def get_screenshot_tile(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    screenshot_id: int = Path(..., title="스크린샷 ID"),
+    level: int = Path(..., ge=0, title="줌 레벨"),
+    tile_name: str = Path(..., title="타일 이름 ({col}_{row}.{format})")
+) -> Any:
+    """
+    스크린샷 Deep Zoom 타일 조회 (내용이 바뀌지 않으므로 immutable 캐시)
+    """
+    match = _TILE_NAME.match(tile_name)
+    if not match:
+        raise HTTPException(status_code=404, detail="타일을 찾을 수 없습니다")
+
+    files = await _get_screenshot_files(db, screenshot_id)
+    if not files.tiles_path:
+        raise HTTPException(status_code=404, detail="타일 피라미드가 없습니다")
+
+    col, row, extension = int(match.group(1)), int(match.group(2)), match.group(3)
+    path = tile_path(files.tiles_path, level, col, row, extension)
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail="타일을 찾을 수 없습니다")
+
+    return FileResponse(
+        str(path),
+        media_type=media_type_for(None, str(path)),
+        headers={"Cache-Control": TILE_CACHE_CONTROL}
+    )
+
+
+async def _get_screenshot_diff(
+    db: AsyncSession,
+    screenshot_id: int,
+    base_id: Optional[int],
+    block_size: Optional[int],
+    threshold: Optional[int],
+) -> Any:
+    """스크린샷 비교 결과 조회 (없으면 이미지 프로세스 풀에서 계산 후 저장)"""
+    after = await screenshots.aget(db, id=screenshot_id)
+    if not after:
+        raise HTTPException(status_code=404, detail="스크린샷을 찾을 수 없습니다")
+
+    if base_id is None:
+        before = await screenshots.aget_previous_version(db, screenshot=after)
+        if not before:
+            raise HTTPException(status_code=404, detail="비교할 이전 스크린샷이 없습니다")
+    else:
+        before = await screenshots.aget(db, id=base_id)
+        if not before:
+            raise HTTPException(status_code=404, detail="비교 기준 스크린샷을 찾을 수 없습니다")
+        before_page = await pages.aget(db, id=before.page_id)
+        after_page = await pages.aget(db, id=after.page_id)
+        if (
+            before.device_type != after.device_type
+            or not before_page
+            or not after_page
+            or before_page.url != after_page.url
+        ):
+            raise HTTPException(status_code=400, detail="같은 페이지/디바이스의 스크린샷만 비교할 수 있습니다")
+
+    options = DiffOptions.resolve(block_size, threshold)
+    diff = await screenshot_diffs.aget_by_pair(
+        db, before_id=before.id, after_id=after.id, options_key=options.key
+    )
+    if diff and os.path.exists(diff.overlay_path):
+        return diff
+
+    before_files = await _get_screenshot_files(db, before.id)
+    after_files = await _get_screenshot_files(db, after.id)
+    overlay_path = overlay_path_for(before_files.content_hash, after_files.content_hash, options)
+    try:
+        result = await diff_runner.run(before_files.path, after_files.path, overlay_path, options)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="스크린샷 파일을 찾을 수 없습니다")
+    if diff:
+        # 결과 이미지만 지워진 경우 (같은 내용 쌍이면 같은 경로에 다시 생성됨)
+        return diff
+
+    return await screenshot_diffs.acreate_or_get(db, obj_in={
+        "before_id": before.id,
+        "after_id": after.id,
+        "options_key": options.key,
+        "width": result["width"],
+        "height": result["height"],
+        "changed_pixels": result["changed_pixels"],
+        "changed_ratio": result["changed_ratio"],
+        "changed_blocks": result["changed_blocks"],
+        "total_blocks": result["total_blocks"],
+        "inserted_rows": result["inserted_rows"],
+        "removed_rows": result["removed_rows"],
+        "regions": result["regions"],
+        "overlay_path": result["overlay_path"],
+        "overlay_hash": result["overlay_hash"],
+    })
+
+
+@router.get("/screenshots/{screenshot_id}/diff", response_model=ScreenshotDiff)
+async def get_screenshot_diff(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    screenshot_id: int = Path(..., title="스크린샷 ID"),
+    base: Optional[int] = Query(None, title="비교 기준 스크린샷 ID (없으면 같은 페이지/디바이스의 이전 스크린샷)"),
+    block_size: Optional[int] = Query(None, ge=4, le=256, title="블록 크기 (없으면 DIFF_BLOCK_SIZE)"),
+    threshold: Optional[int] = Query(None, ge=0, le=255, title="픽셀 차이 임계값 (없으면 DIFF_PIXEL_THRESHOLD)")
+) -> Any:
+    """
+    이전 버전 대비 스크린샷 변경률과 바뀐 영역 조회
+    """
+    return await _get_screenshot_diff(db, screenshot_id, base, block_size, threshold)
+
+
+@router.get("/screenshots/{screenshot_id}/diff/overlay")
+async def get_screenshot_diff_overlay(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(deps.get_async_db),
+    screenshot_id: int = Path(..., title="스크린샷 ID"),
+    base: Optional[int] = Query(None, title="비교 기준 스크린샷 ID (없으면 같은 페이지/디바이스의 이전 스크린샷)"),
+    block_size: Optional[int] = Query(None, ge=4, le=256, title="블록 크기 (없으면 DIFF_BLOCK_SIZE)"),
+    threshold: Optional[int] = Query(None, ge=0, le=255, title="픽셀 차이 임계값 (없으면 DIFF_PIXEL_THRESHOLD)"),
+    v: Optional[str] = Query(None, title="내용 해시 (지정하면 immutable 캐시)")
+) -> Any:
+    """
+    바뀐 영역을 표시한 스크린샷 이미지 조회
+    """
+    diff = await _get_screenshot_diff(db, screenshot_id, base, block_size, threshold)
+    return _file_response(
+        request, diff.overlay_path, media_type_for(None, diff.overlay_path), diff.overlay_hash, v
+    )
+
+
+@router.get("/screenshots/{screenshot_id}/similar", response_model=List[SimilarScreenshot])
+async def get_similar_screenshots(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    screenshot_id: int = Path(..., title="스크린샷 ID"),
+    k: int = Query(10, ge=1, le=settings.SIMILARITY_MAX_RESULTS, title="결과 수"),
+    hash_kind: HashKind = Query(HashKind.PHASH, alias="hash", title="비교할 지각 해시 (phash, dhash)"),
+    max_distance: int = Query(settings.SIMILARITY_DEFAULT_MAX_DISTANCE, ge=0, le=64, title="최대 해밍 거리"),
+    other_websites: bool = Query(False, title="다른 웹사이트의 스크린샷만 (템플릿 복제/파킹 도메인 탐지)")
+) -> Any:
+    """
+    첫 화면이 비슷한 스크린샷 조회 (지각 해시 해밍 거리가 가까운 순)
+    """
+    screenshot = await screenshots.aget(db, id=screenshot_id)
     if not screenshot:
         raise HTTPException(status_code=404, detail="스크린샷을 찾을 수 없습니다")
-    
-    return FileResponse(screenshot.path, media_type="image/png")
\ No newline at end of file
+    value = getattr(screenshot, hash_kind.value)
+    if value is None:
+        raise HTTPException(status_code=404, detail="지각 해시가 없는 스크린샷입니다")
+    page = await pages.aget(db, id=screenshot.page_id)
+
+    await similarity_index.refresh(db)
+    neighbors = similarity_index.nearest(
+        hash_kind,
+        value,
+        k,
+        max_distance,
+        exclude_screenshot_id=screenshot.id,
+        exclude_website_id=page.website_id if other_websites and page else None,
+    )
+
+    # 인덱스를 다시 구성하기 전에 삭제된 스크린샷은 제외
+    rows = await screenshots.aget_with_pages(db, ids=[item[0] for _, item in neighbors])
+    results = []
+    for distance, (neighbor_id, _) in neighbors:
+        if neighbor_id not in rows:
+            continue
+        neighbor, neighbor_page = rows[neighbor_id]
+        results.append({
+            "screenshot_id": neighbor.id,
+            "page_id": neighbor_page.id,
+            "capture_id": neighbor.capture_id,
+            "website_id": neighbor_page.website_id,
+            "url": neighbor_page.url,
+            "device_type": neighbor.device_type,
+            "distance": distance,
+        })
+    return results
+
+
+def _linked_page(page: Page) -> Dict[str, Any]:
+    return {
+        "page_id": page.id,
+        "capture_id": page.capture_id,
+        "url": page.url,
+        "title": page.title,
+        "status": page.status,
+    }
+
+
+@router.get("/pages/{page_id}/links", response_model=List[OutboundLink])
+async def get_page_links(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    page_id: int = Path(..., title="페이지 ID")
+) -> Any:
+    """
+    페이지에서 나가는 링크 조회 (같은 캡처에서 캡처한 페이지면 그 상태 포함)
+    """
+    page = await pages.aget(db, id=page_id)
+    if not page:
+        raise HTTPException(status_code=404, detail="페이지를 찾을 수 없습니다")
+    # 내용이 같아 캡처하지 않은 페이지도 링크는 기록되어 있음
+    return await page_links.aget_outbound(db, page=page)
+
+
+@router.get("/pages/{page_id}/backlinks", response_model=List[LinkedPage])
+async def get_page_backlinks(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    page_id: int = Path(..., title="페이지 ID")
+) -> Any:
+    """
+    같은 캡처에서 이 페이지로 링크하는 페이지 조회
+    """
+    page = await pages.aget(db, id=page_id)
+    if not page:
+        raise HTTPException(status_code=404, detail="페이지를 찾을 수 없습니다")
+    return [_linked_page(source) for source in await page_links.aget_inbound(db, page=page)]
+
+
+@router.get("/{capture_id}/orphans", response_model=List[LinkedPage])
+async def get_capture_orphans(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    capture_id: int = Path(..., title="캡처 ID")
+) -> Any:
+    """
+    고아 페이지 조회 (웹사이트에서 캡처한 적 있지만 이 캡처의 어떤 페이지도 링크하지 않는 URL)
+    """
+    capture = await captures.aget(db, id=capture_id)
+    if not capture:
+        raise HTTPException(status_code=404, detail="캡처를 찾을 수 없습니다")
+    orphans = await page_links.aget_orphans(db, capture_id=capture.id, website_id=capture.website_id)
+    return [_linked_page(page) for page in orphans]
+
+
+@router.get("/{capture_id}/broken-links", response_model=List[BrokenLink])
+async def get_capture_broken_links(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    capture_id: int = Path(..., title="캡처 ID")
+) -> Any:
+    """
+    깨진 링크 조회 (이 캡처에서 실패/오류 응답/접근 불가였던 페이지와 그 페이지로 링크한 페이지)
+    """
+    capture = await captures.aget(db, id=capture_id)
+    if not capture:
+        raise HTTPException(status_code=404, detail="캡처를 찾을 수 없습니다")
+    return await page_links.aget_broken(db, capture_id=capture.id)
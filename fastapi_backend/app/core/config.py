@@ -17,6 +17,142 @@ class Settings(BaseSettings):
     # CORS
     BACKEND_CORS_ORIGINS: list[str] = ["*"]
     
+    # Capture
+    BROWSER_POOL_SIZE: int = 2  # 앱 수명 동안 유지할 Chromium 브라우저 수
+    CAPTURE_MAX_CONCURRENCY: int = 6  # 프로세스 전체 동시 캡처 수
+    CAPTURE_JOB_CONCURRENCY: int = 3  # 캡처 작업 하나당 동시 디바이스 캡처 수
+    IMAGE_PROCESS_WORKERS: int = 2  # 썸네일 등 이미지 후처리 프로세스 수 (0이면 스레드에서 실행)
+    SCREENSHOT_FORMAT: str = "png"  # png, jpeg, webp, avif (손실 형식은 배포에서 선택, WebP 한도를 넘는 긴 페이지는 JPEG)
+    SCREENSHOT_QUALITY: int = 80  # 손실 압축 형식의 품질 (1-100)
+    THUMBNAIL_FORMAT: str = "webp"
+    THUMBNAIL_QUALITY: int = 75
+    CAPTURE_TILED_MIN_HEIGHT: int = 8000  # 이보다 긴 페이지는 뷰포트 높이 스트립으로 나눠 캡처 (0이면 항상)
+    CAPTURE_MAX_PAGE_HEIGHT: int = 30000  # 전체 페이지 캡처 최대 높이 (초과분은 잘라냄)
+    CAPTURE_SETTLE_BUDGET_MS: int = 10000  # 동적 요소 대기(스크롤 + 렌더링 안정화) 전체 시간 예산
+    CAPTURE_SCROLL_BUDGET_RATIO: float = 0.7  # 예산 중 스크롤에 쓸 수 있는 최대 비율
+    CAPTURE_SCROLL_STEP_WAIT_MS: int = 1000  # 스크롤 한 단계에서 화면에 들어온 이미지를 기다리는 최대 시간
+    CAPTURE_SCROLL_GROWTH_WAIT_MS: int = 500  # 바닥에서 페이지가 더 늘어나는지 기다리는 시간
+    CAPTURE_LAYOUT_STABLE_MS: int = 300  # 이 시간 동안 레이아웃 변화가 없으면 안정된 것으로 판단
+    CAPTURE_RESULT_TTL_SECONDS: int = 0  # 같은 URL/뷰포트/옵션의 캡처 결과를 재사용할 기본 시간 (0이면 재사용 안 함, 요청별로는 result_max_age_seconds)
+    CAPTURE_RESULT_CACHE_SIZE: int = 10000  # 프로세스 내 완료 결과 보관 수
+
+    # Load strategy
+    CAPTURE_LOAD_STRATEGY: str = "auto"  # auto, load, domcontentloaded, networkidle (auto 는 도메인별 기록으로 선택)
+    CAPTURE_NETWORKIDLE_CAP_MS: int = 5000  # networkidle 전략에서 load 이후 네트워크 유휴를 기다리는 최대 시간
+    CAPTURE_SELECTOR_TIMEOUT_MS: int = 10000  # wait_for_selector 최대 대기 시간
+    LOAD_PROFILE_PATH: str = "storage/load_profiles.sqlite3"  # 도메인별 로드 전략 기록
+    LOAD_PROFILE_MIN_SAMPLES: int = 3  # 전략을 판단하기 전에 모을 표본 수
+    LOAD_PROFILE_MIN_COMPLETE_RATIO: float = 0.9  # 렌더링이 완전했던 비율이 이 이상인 전략만 사용
+    LOAD_PROFILE_EWMA_ALPHA: float = 0.3
+    LOAD_PROFILE_TTL_SECONDS: int = 7 * 86400  # 이보다 오래된 기록은 무시하고 다시 시험
+
+    # Request policy
+    CAPTURE_REQUEST_POLICY_ENABLED: bool = True  # 캡처 중 불필요한 요청 차단 (page.route)
+    CAPTURE_BLOCK_RESOURCE_TYPES: list[str] = ["media", "websocket", "eventsource"]
+    CAPTURE_BLOCK_DOMAINS: list[str] = [
+        "google-analytics.com", "googletagmanager.com", "googleadservices.com", "googlesyndication.com",
+        "doubleclick.net", "adservice.google.com", "connect.facebook.net", "analytics.twitter.com",
+        "ads-twitter.com", "analytics.tiktok.com", "bat.bing.com", "clarity.ms", "hotjar.com",
+        "segment.io", "mixpanel.com", "amplitude.com", "scorecardresearch.com", "criteo.com",
+        "criteo.net", "taboola.com", "outbrain.com", "amazon-adsystem.com", "adnxs.com",
+        "wcs.naver.net", "wcs.naver.com",
+    ]  # 광고/분석/트래커 도메인 (하위 도메인 포함)
+    CAPTURE_BLOCK_URL_PATTERNS: list[str] = []  # 차단할 URL glob 패턴 (예: "*/collect?*")
+
+    # Asset cache
+    ASSET_CACHE_ENABLED: bool = True  # 브라우저 컨텍스트 간 공유 디스크 HTTP 리소스 캐시
+    ASSET_CACHE_DIR: str = "storage/asset_cache"
+    ASSET_CACHE_MAX_BYTES: int = 1024 ** 3  # 캐시 전체 크기 상한 (초과 시 LRU 삭제)
+    ASSET_CACHE_MAX_ENTRY_BYTES: int = 20 * 1024 ** 2  # 이보다 큰 응답은 저장하지 않음
+    ASSET_CACHE_HEURISTIC_MAX_SECONDS: int = 86400  # 만료 정보 없이 Last-Modified 만 있는 응답의 최대 신선도
+    ASSET_CACHE_RESOURCE_TYPES: list[str] = ["stylesheet", "script", "font", "image"]
+
+    # Preflight
+    PREFLIGHT_ENABLED: bool = True  # 브라우저에 할당하기 전 HTTP 요청으로 URL 확인
+    PREFLIGHT_USER_AGENT: str = ""  # 비워두면 캡처 브라우저와 같은 User-Agent
+    PREFLIGHT_TIMEOUT_SECONDS: float = 10.0
+    PREFLIGHT_CACHE_TTL_SECONDS: int = 600  # URL별 확인 결과 캐시 유지 시간
+    PREFLIGHT_ERROR_TTL_SECONDS: int = 60  # 접근 불가/5xx 결과 캐시 유지 시간
+    PREFLIGHT_FAIL_STATUS_CODES: list[int] = [404, 410, 451]  # 브라우저로 다시 시도하지 않을 응답 (5xx 는 일시적일 수 있어 제외)
+    PREFLIGHT_LOGIN_URL_PATTERNS: list[str] = [
+        "*/login*", "*/signin*", "*/sign-in*", "*/sign_in*", "*/auth/*", "*/sso/*",
+        "*://accounts.google.com/*", "*://nid.naver.com/*", "*://accounts.kakao.com/*",
+    ]  # 리다이렉트된 최종 URL이 이 패턴이면 로그인 벽으로 판단
+
+    # Incremental recapture
+    FINGERPRINT_TIMEOUT_SECONDS: float = 10.0  # 변경 확인 요청 타임아웃
+    FINGERPRINT_MAX_BYTES: int = 5 * 1024 * 1024  # 이보다 큰 HTML 은 해시하지 않고 새로 캡처
+    FINGERPRINT_ATTRIBUTES: list[str] = [
+        "class", "style", "src", "srcset", "href", "alt", "width", "height", "hidden",
+    ]  # DOM 해시에 포함할 속성 (nonce, data-* 등 요청마다 바뀌는 값은 제외)
+
+    # Visual diff
+    DIFF_DIR: str = "storage/diffs"  # 스크린샷 비교 결과 이미지 저장 위치
+    DIFF_BLOCK_SIZE: int = 16  # 바뀐 영역을 판단하는 블록 크기 (픽셀)
+    DIFF_PIXEL_THRESHOLD: int = 24  # RGB 채널 차이가 이보다 커야 바뀐 픽셀 (압축 잡음 무시)
+    DIFF_MAX_REGIONS: int = 50  # 결과에 포함할 최대 변경 영역 수 (넓은 영역부터)
+    DIFF_OVERLAY_FORMAT: str = "webp"  # 비교 결과 이미지 형식
+    DIFF_OVERLAY_QUALITY: int = 75
+
+    # Similarity search
+    SIMILARITY_REBUILD_SECONDS: int = 3600  # 유사 화면 인덱스를 DB에서 전체로 다시 읽는 주기 (삭제 반영)
+    SIMILARITY_MAX_RESULTS: int = 100  # 한 번에 조회할 수 있는 최대 결과 수
+    SIMILARITY_DEFAULT_MAX_DISTANCE: int = 16  # 기본 최대 해밍 거리 (64비트 중)
+
+    # Deep Zoom 타일
+    DZI_ENABLED: bool = True  # 스크린샷마다 DZI 타일 피라미드 생성
+    DZI_MIN_HEIGHT: int = 0  # 이보다 짧은 스크린샷은 타일을 만들지 않음
+    DZI_TILE_SIZE: int = 254
+    DZI_TILE_OVERLAP: int = 1
+    DZI_TILE_FORMAT: str = "webp"
+    DZI_TILE_QUALITY: int = 80
+
+    # Blob store
+    BLOB_STORE_DIR: str = "storage/blobs"  # 스크린샷/썸네일을 내용 해시 경로로 저장 (같은 이미지는 한 번만)
+    BLOB_GC_ENABLED: bool = True  # 워커에서 참조되지 않는 파일 주기적으로 삭제
+    BLOB_GC_INTERVAL_SECONDS: int = 3600
+    BLOB_GC_GRACE_SECONDS: int = 3600  # 이보다 최근에 저장/재사용된 파일은 참조가 없어도 삭제하지 않음
+    BLOB_GC_BATCH_SIZE: int = 500
+
+    # Serving
+    SCREENSHOT_META_CACHE_TTL_SECONDS: int = 300  # 스크린샷 파일 메타데이터 캐시 유지 시간
+    SCREENSHOT_META_CACHE_SIZE: int = 10000
+    
+    # Crawl
+    CRAWL_MAX_DEPTH: int = 10  # 요청에서 지정할 수 있는 최대 크롤링 깊이
+    CRAWL_MAX_PAGES: int = 10000  # 요청에서 지정할 수 있는 캡처당 최대 페이지 수
+    CRAWL_FRONTIER_DIR: str = "storage/frontier"  # 크롤링 프론티어(대기열/방문 집합) 저장 위치
+    CRAWL_BLOOM_CAPACITY: int = 1_000_000  # 방문 집합 블룸 필터 크기 (1백만 URL / 1% ≈ 1.2MB)
+    CRAWL_BLOOM_ERROR_RATE: float = 0.01
+    CRAWL_TRACKING_PARAMS: list[str] = [
+        "utm_*", "gclid", "dclid", "fbclid", "msclkid", "yclid", "mc_cid", "mc_eid", "_ga", "_gl",
+    ]  # URL 정규화 시 제거할 추적용 쿼리 파라미터
+    
+    # Link graph
+    LINK_MAX_PER_PAGE: int = 5000  # 페이지당 저장할 최대 링크 수 (문서 순서로 앞에서부터)
+    LINK_MAX_URL_LENGTH: int = 2048  # 이보다 긴 링크(data: URI 성격의 긴 쿼리 등)는 저장하지 않음
+    LINK_WRITE_CHUNK_SIZE: int = 1000  # URL 인터닝/간선 INSERT 를 나눠 실행할 행 수
+    
+    # Politeness
+    DOMAIN_MAX_CONCURRENCY: int = 3  # 도메인당 동시 페이지 로드 수
+    DOMAIN_MIN_DELAY_SECONDS: float = 0.5  # 같은 도메인 페이지 로드 시작 사이 최소 간격
+    DOMAIN_STATE_MAX_ENTRIES: int = 10000  # 대기 상태를 기억할 최대 도메인 수 (초과 시 쉬고 있는 도메인부터 제거)
+    CRAWL_RESPECT_ROBOTS: bool = True  # 크롤링 시 robots.txt Disallow/Crawl-delay 준수
+    ROBOTS_USER_AGENT: str = "WebCapturePro"
+    ROBOTS_CACHE_TTL_SECONDS: int = 3600
+    ROBOTS_MAX_CRAWL_DELAY_SECONDS: float = 30.0
+    
+    # Worker
+    EMBEDDED_WORKER: bool = True  # API 프로세스 안에서도 캡처 워커 실행 (별도 워커만 쓸 경우 False)
+    WORKER_CONCURRENCY: int = 2  # 워커 하나가 동시에 처리할 캡처 작업 수
+    WORKER_LEASE_SECONDS: int = 60  # 하트비트 없이 리스가 유지되는 시간
+    WORKER_HEARTBEAT_SECONDS: int = 15
+    WORKER_POLL_SECONDS: float = 2.0
+    WORKER_MAX_ATTEMPTS: int = 3  # 워커 중단으로 회수된 작업의 최대 시도 횟수
+    CAPTURE_PROGRESS_INTERVAL_SECONDS: float = 2.0  # 진행률 DB 기록 최소 간격
+    CAPTURE_WRITE_BATCH_SIZE: int = 50  # 스크린샷/페이지 결과를 모아서 기록할 행 수
+    CAPTURE_FLUSH_INTERVAL_SECONDS: float = 5.0  # 결과가 모이지 않아도 기록하는 최대 간격
+    
     class Config:
         case_sensitive = True
 
@@ -1 +1,7 @@
-# This file is intentionally left empty for package initialization
\ No newline at end of file
+from app.crud.capture import captures
+from app.crud.device_profile import device_profiles
+from app.crud.link import page_links
+from app.crud.page import pages
+from app.crud.screenshot import screenshots, screenshot_diffs
+from app.crud.user import user
+from app.crud.website import websites
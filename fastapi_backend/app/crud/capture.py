@@ -0,0 +1,237 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, case, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.crud.base import CRUDBase
+from app.models.capture import Capture, CaptureStatus
+from app.models.page import Page, PageStatus
+from app.schemas.capture import CaptureCreate, CaptureUpdate
+
+
+class CRUDCapture(CRUDBase[Capture, CaptureCreate, CaptureUpdate]):
+    def get_with_details(self, db: Session, *, id: int) -> Optional[Dict[str, Any]]:
+        capture = self.get(db, id=id)
+        if not capture:
+            return None
+        return self._with_details(db, capture)
+
+    def get_multi_with_details(
+        self, db: Session, *, skip: int = 0, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        items = (
+            db.query(Capture)
+            .order_by(Capture.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        return [self._with_details(db, capture) for capture in items]
+
+    def get_by_website(
+        self, db: Session, *, website_id: int, skip: int = 0, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        items = (
+            db.query(Capture)
+            .filter(Capture.website_id == website_id)
+            .order_by(Capture.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        return [self._with_details(db, capture) for capture in items]
+
+    def _with_details(self, db: Session, capture: Capture) -> Dict[str, Any]:
+        capture_pages = (
+            db.query(Page)
+            .filter(Page.capture_id == capture.id)
+            .order_by(Page.depth, Page.id)
+            .all()
+        )
+        completed_pages = [p for p in capture_pages if p.status == PageStatus.COMPLETE.value]
+        unchanged_pages = [p for p in capture_pages if p.status == PageStatus.UNCHANGED.value]
+        website = capture.website
+        return {
+            "id": capture.id,
+            "website_id": capture.website_id,
+            "url": capture.url,
+            "device_types": capture.device_types,
+            "capture_full_page": capture.capture_full_page,
+            "capture_dynamic_elements": capture.capture_dynamic_elements,
+            "reuse_render": capture.reuse_render,
+            "crawl": capture.crawl,
+            "incremental": capture.incremental,
+            "status": capture.status,
+            "progress": capture.progress,
+            "created_at": capture.created_at,
+            "completed_at": capture.completed_at,
+            "error": capture.error,
+            "website": {
+                "id": website.id,
+                "name": website.name,
+                "domain": website.domain,
+                "url": website.url,
+            } if website else None,
+            "pages": [
+                {
+                    "id": page.id,
+                    "url": page.url,
+                    "title": page.title,
+                    "status": page.status,
+                    "error": page.error,
+                    "http_status": page.http_status,
+                    "depth": page.depth,
+                    "previous_page_id": page.previous_page_id,
+                }
+                for page in capture_pages
+            ],
+            "pageCount": len(capture_pages),
+            "completedPageCount": len(completed_pages),
+            "unchangedPageCount": len(unchanged_pages),
+        }
+
+    async def aupdate_status(self, db: AsyncSession, *, id: int, status: str) -> Optional[Capture]:
+        capture = await self.aget(db, id=id)
+        if not capture:
+            return None
+        return await self.aupdate(db, db_obj=capture, obj_in={"status": status})
+
+    async def aupdate_progress(self, db: AsyncSession, *, id: int, progress: float) -> Optional[Capture]:
+        capture = await self.aget(db, id=id)
+        if not capture:
+            return None
+        return await self.aupdate(db, db_obj=capture, obj_in={"progress": progress})
+
+    async def aupdate_error(self, db: AsyncSession, *, id: int, error: str) -> Optional[Capture]:
+        capture = await self.aget(db, id=id)
+        if not capture:
+            return None
+        return await self.aupdate(
+            db,
+            db_obj=capture,
+            obj_in={"status": CaptureStatus.FAILED.value, "error": error, "completed_at": datetime.now()},
+        )
+
+    async def aupdate_completed(self, db: AsyncSession, *, id: int) -> Optional[Capture]:
+        capture = await self.aget(db, id=id)
+        if not capture:
+            return None
+        return await self.aupdate(
+            db,
+            db_obj=capture,
+            obj_in={"status": CaptureStatus.COMPLETE.value, "progress": 100, "completed_at": datetime.now()},
+        )
+
+    async def aclaim_next(
+        self, db: AsyncSession, *, worker_id: str, lease_seconds: int
+    ) -> Optional[Capture]:
+        """대기 중이거나 리스가 만료된 캡처 하나를 잠그고 리스 획득
+
+        FOR UPDATE SKIP LOCKED 로 다른 워커가 잠근 행은 건너뛰므로
+        여러 노드의 워커가 동시에 호출해도 같은 작업을 가져가지 않는다.
+        """
+        now = datetime.utcnow()
+        result = await db.execute(
+            select(Capture)
+            .where(
+                or_(
+                    Capture.status == CaptureStatus.PENDING.value,
+                    and_(
+                        Capture.status == CaptureStatus.PROCESSING.value,
+                        or_(Capture.lease_expires_at.is_(None), Capture.lease_expires_at < now),
+                    ),
+                )
+            )
+            .order_by(Capture.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        capture = result.scalars().first()
+        if not capture:
+            await db.rollback()
+            return None
+
+        capture.status = CaptureStatus.PROCESSING.value
+        capture.lease_owner = worker_id
+        capture.lease_expires_at = now + timedelta(seconds=lease_seconds)
+        capture.heartbeat_at = now
+        capture.attempts = (capture.attempts or 0) + 1
+        await db.commit()
+        await db.refresh(capture)
+        return capture
+
+    async def aheartbeat(
+        self, db: AsyncSession, *, id: int, worker_id: str, lease_seconds: int
+    ) -> bool:
+        """리스 연장. 리스를 잃었으면 (다른 워커가 회수) False 반환"""
+        now = datetime.utcnow()
+        result = await db.execute(
+            update(Capture)
+            .where(Capture.id == id, Capture.lease_owner == worker_id)
+            .values(lease_expires_at=now + timedelta(seconds=lease_seconds), heartbeat_at=now)
+        )
+        await db.commit()
+        return result.rowcount > 0
+
+    async def arelease(
+        self, db: AsyncSession, *, id: int, worker_id: str, max_attempts: int
+    ) -> None:
+        """작업 종료 후 리스 해제
+
+        완료/실패로 끝나지 않은 작업 (취소, 리스 상실 직전 종료 등) 은 다시 대기 상태로
+        돌려 다른 워커가 가져가게 하고, 시도 횟수를 모두 소진했으면 실패 처리한다.
+        """
+        await db.execute(
+            update(Capture)
+            .where(
+                Capture.id == id,
+                Capture.lease_owner == worker_id,
+                Capture.status.in_([CaptureStatus.COMPLETE.value, CaptureStatus.FAILED.value]),
+            )
+            .values(lease_owner=None, lease_expires_at=None)
+        )
+        exhausted = Capture.attempts >= max_attempts
+        await db.execute(
+            update(Capture)
+            .where(
+                Capture.id == id,
+                Capture.lease_owner == worker_id,
+                Capture.status.notin_([CaptureStatus.COMPLETE.value, CaptureStatus.FAILED.value]),
+            )
+            .values(
+                status=case(
+                    (exhausted, CaptureStatus.FAILED.value), else_=CaptureStatus.PENDING.value
+                ),
+                error=case((exhausted, "작업이 완료되지 않은 채 재시도 횟수를 초과했습니다"), else_=Capture.error),
+                completed_at=case((exhausted, datetime.now()), else_=Capture.completed_at),
+                lease_owner=None,
+                lease_expires_at=None,
+            )
+        )
+        await db.commit()
+
+    async def afail_exhausted(self, db: AsyncSession, *, max_attempts: int) -> int:
+        """재시도 횟수를 모두 소진한 채 리스가 만료된 캡처를 실패 처리"""
+        now = datetime.utcnow()
+        result = await db.execute(
+            update(Capture)
+            .where(
+                Capture.status == CaptureStatus.PROCESSING.value,
+                or_(Capture.lease_expires_at.is_(None), Capture.lease_expires_at < now),
+                Capture.attempts >= max_attempts,
+            )
+            .values(
+                status=CaptureStatus.FAILED.value,
+                error="워커 중단으로 재시도 횟수를 초과했습니다",
+                completed_at=now,
+                lease_owner=None,
+                lease_expires_at=None,
+            )
+        )
+        await db.commit()
+        return result.rowcount
+
+
+captures = CRUDCapture(Capture)
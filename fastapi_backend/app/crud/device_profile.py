@@ -0,0 +1,21 @@
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.crud.base import CRUDBase
+from app.models.device_profile import DeviceProfile
+from app.schemas.device_profile import DeviceProfileCreate, DeviceProfileUpdate
+
+
+class CRUDDeviceProfile(CRUDBase[DeviceProfile, DeviceProfileCreate, DeviceProfileUpdate]):
+    def get_by_name(self, db: Session, *, name: str) -> Optional[DeviceProfile]:
+        return db.query(DeviceProfile).filter(DeviceProfile.name == name).first()
+
+    async def aget_by_name(self, db: AsyncSession, *, name: str) -> Optional[DeviceProfile]:
+        result = await db.execute(select(DeviceProfile).where(DeviceProfile.name == name))
+        return result.scalars().first()
+
+
+device_profiles = CRUDDeviceProfile(DeviceProfile)
@@ -0,0 +1,188 @@
+import hashlib
+from typing import Any, Dict, List
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.core.config import settings
+from app.crud.base import CRUDBase
+from app.models.link import PageLink, Url
+from app.models.page import Page, PageStatus
+from app.schemas.link import PageLinkCreate
+from app.utils.crawl import link_keys
+
+
+def url_hash(url: str) -> str:
+    """정규화한 URL의 인터닝 키"""
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def _chunks(items: List[Any], size: int = settings.LINK_WRITE_CHUNK_SIZE) -> List[List[Any]]:
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+class CRUDPageLink(CRUDBase[PageLink, PageLinkCreate, PageLinkCreate]):
+    """페이지 링크 그래프 (페이지 -> 인터닝한 URL 간선)
+
+    쓰기 메서드는 commit 하지 않는다 (CaptureWriter 가 한 트랜잭션으로 묶어 커밋).
+    """
+
+    async def aintern_urls(self, db: AsyncSession, *, urls: List[str]) -> Dict[str, int]:
+        """정규화한 URL들을 Url 행으로 등록하고 URL별 ID 반환 (이미 있으면 기존 ID)
+
+        여러 워커가 같은 URL을 동시에 등록할 때 교착되지 않도록 해시 순서로 INSERT 한다.
+        """
+        by_hash = {url_hash(url): url for url in urls}
+        if not by_hash:
+            return {}
+        hashes = sorted(by_hash)
+        for chunk in _chunks(hashes):
+            await db.execute(
+                pg_insert(Url).on_conflict_do_nothing(index_elements=[Url.hash]),
+                [{"hash": value, "url": by_hash[value]} for value in chunk],
+            )
+        ids: Dict[str, int] = {}
+        for chunk in _chunks(hashes):
+            result = await db.execute(select(Url.hash, Url.id).where(Url.hash.in_(chunk)))
+            ids.update({by_hash[value]: url_id for value, url_id in result.all()})
+        return ids
+
+    async def aadd(self, db: AsyncSession, *, links_by_page: Dict[int, List[str]]) -> int:
+        """페이지별 수집 링크를 정규화/인터닝해 간선으로 일괄 저장 (이미 있는 간선은 무시)
+
+        Returns:
+            저장을 시도한 간선 수
+        """
+        keys_by_page = {
+            page_id: link_keys(links, settings.LINK_MAX_PER_PAGE) for page_id, links in links_by_page.items()
+        }
+        url_ids = await self.aintern_urls(
+            db, urls=list({url for keys in keys_by_page.values() for url in keys})
+        )
+        edges = sorted(
+            (page_id, url_ids[url], position)
+            for page_id, keys in keys_by_page.items()
+            for position, url in enumerate(keys)
+        )
+        for chunk in _chunks(edges):
+            await db.execute(
+                pg_insert(PageLink).on_conflict_do_nothing(index_elements=[PageLink.page_id, PageLink.url_id]),
+                [{"page_id": page_id, "url_id": url_id, "position": position} for page_id, url_id, position in chunk],
+            )
+        return len(edges)
+
+    async def aget_outbound_urls(self, db: AsyncSession, *, page_ids: List[int]) -> Dict[int, List[str]]:
+        """페이지별 저장된 링크 URL (수집 순서). 링크가 없는 페이지는 포함되지 않음"""
+        if not page_ids:
+            return {}
+        result = await db.execute(
+            select(PageLink.page_id, Url.url)
+            .join(Url, PageLink.url_id == Url.id)
+            .where(PageLink.page_id.in_(page_ids))
+            .order_by(PageLink.page_id, PageLink.position)
+        )
+        links: Dict[int, List[str]] = {}
+        for page_id, url in result.all():
+            links.setdefault(page_id, []).append(url)
+        return links
+
+    async def aget_outbound(self, db: AsyncSession, *, page: Page) -> List[Dict[str, Any]]:
+        """페이지에서 나가는 링크와 같은 캡처에서 그 URL을 캡처한 페이지 (수집 순서)"""
+        target = aliased(Page)
+        result = await db.execute(
+            select(Url.url, target.id, target.status, target.http_status)
+            .select_from(PageLink)
+            .join(Url, PageLink.url_id == Url.id)
+            .outerjoin(target, and_(target.url_id == PageLink.url_id, target.capture_id == page.capture_id))
+            .where(PageLink.page_id == page.id)
+            .order_by(PageLink.position)
+        )
+        return [
+            {"url": url, "page_id": page_id, "status": status, "http_status": http_status}
+            for url, page_id, status, http_status in result.all()
+        ]
+
+    async def aget_inbound(self, db: AsyncSession, *, page: Page) -> List[Page]:
+        """같은 캡처에서 이 페이지로 링크하는 페이지"""
+        if page.url_id is None:
+            return []
+        result = await db.execute(
+            select(Page)
+            .join(PageLink, PageLink.page_id == Page.id)
+            .where(PageLink.url_id == page.url_id, Page.capture_id == page.capture_id, Page.id != page.id)
+            .order_by(Page.depth, Page.id)
+        )
+        return list(result.scalars().all())
+
+    async def aget_orphans(self, db: AsyncSession, *, capture_id: int, website_id: int) -> List[Page]:
+        """고아 페이지: 웹사이트에서 캡처한 적 있는 URL 중 이 캡처의 어떤 페이지도 링크하지 않는 URL
+
+        URL별로 가장 최근 페이지를 반환한다. 캡처 시작 페이지와 자기 자신으로의
+        링크는 제외한다.
+        """
+        source = aliased(Page)
+        linked = (
+            select(PageLink.url_id)
+            .join(source, PageLink.page_id == source.id)
+            .where(source.capture_id == capture_id, PageLink.url_id != source.url_id)
+        )
+        roots = select(Page.url_id).where(
+            Page.capture_id == capture_id, Page.depth == 0, Page.url_id.is_not(None)
+        )
+        latest = (
+            select(Page.url_id, Page.id)
+            .distinct(Page.url_id)
+            .where(
+                Page.website_id == website_id,
+                Page.url_id.is_not(None),
+                Page.status.in_([PageStatus.COMPLETE.value, PageStatus.UNCHANGED.value]),
+                Page.url_id.not_in(linked),
+                Page.url_id.not_in(roots),
+            )
+            .order_by(Page.url_id, Page.id.desc())
+            .subquery()
+        )
+        result = await db.execute(
+            select(Page).join(latest, Page.id == latest.c.id).order_by(Page.url)
+        )
+        return list(result.scalars().all())
+
+    async def aget_broken(self, db: AsyncSession, *, capture_id: int) -> List[Dict[str, Any]]:
+        """깨진 링크: 이 캡처의 페이지가 링크한 URL 중 같은 캡처에서 실패/오류 응답/접근 불가였던 페이지
+
+        캡처 범위 밖이라 방문하지 않은 URL은 판단할 수 없으므로 포함하지 않는다.
+        """
+        source = aliased(Page)
+        result = await db.execute(
+            select(Page, source.id)
+            .join(PageLink, PageLink.url_id == Page.url_id)
+            .join(source, and_(source.id == PageLink.page_id, source.capture_id == capture_id))
+            .where(
+                Page.capture_id == capture_id,
+                source.id != Page.id,
+                or_(
+                    Page.status == PageStatus.FAILED.value,
+                    Page.http_status >= 400,
+                    # 사전 확인에서 응답을 받지 못함 (DNS/연결 오류 등)
+                    and_(Page.status == PageStatus.SKIPPED.value, Page.http_status.is_(None)),
+                ),
+            )
+            .order_by(Page.url, source.id)
+        )
+        broken: Dict[int, Dict[str, Any]] = {}
+        for page, source_id in result.all():
+            entry = broken.setdefault(page.id, {
+                "url": page.url,
+                "page_id": page.id,
+                "status": page.status,
+                "http_status": page.http_status,
+                "error": page.error,
+                "source_page_ids": [],
+            })
+            entry["source_page_ids"].append(source_id)
+        return list(broken.values())
+
+
+page_links = CRUDPageLink(PageLink)
@@ -0,0 +1,39 @@
+from typing import List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import CRUDBase
+from app.models.page import Page, PageStatus
+from app.schemas.page import PageCreate, PageUpdate
+
+
+class CRUDPage(CRUDBase[Page, PageCreate, PageUpdate]):
+    async def aget_by_capture(self, db: AsyncSession, *, capture_id: int) -> List[Page]:
+        result = await db.execute(
+            select(Page)
+            .where(Page.capture_id == capture_id)
+            .order_by(Page.depth, Page.id)
+        )
+        return list(result.scalars().all())
+
+    async def aget_latest_version(
+        self, db: AsyncSession, *, website_id: int, url: str, exclude_capture_id: int
+    ) -> Optional[Page]:
+        """다른 캡처에서 지문과 함께 처리된 같은 URL의 가장 최근 페이지"""
+        result = await db.execute(
+            select(Page)
+            .where(
+                Page.website_id == website_id,
+                Page.url == url,
+                Page.capture_id != exclude_capture_id,
+                Page.dom_hash.is_not(None),
+                Page.status.in_([PageStatus.COMPLETE.value, PageStatus.UNCHANGED.value]),
+            )
+            .order_by(Page.id.desc())
+            .limit(1)
+        )
+        return result.scalars().first()
+
+
+pages = CRUDPage(Page)
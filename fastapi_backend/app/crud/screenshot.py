@@ -0,0 +1,117 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import CRUDBase
+from app.models.page import Page
+from app.models.screenshot import Screenshot, ScreenshotDiff
+from app.schemas.screenshot import ScreenshotCreate, ScreenshotDiffCreate, ScreenshotUpdate
+
+
+class CRUDScreenshot(CRUDBase[Screenshot, ScreenshotCreate, ScreenshotUpdate]):
+    async def aget_recent_by_render_keys(
+        self, db: AsyncSession, *, render_keys: List[str], since: datetime
+    ) -> Dict[str, Screenshot]:
+        """렌더링 키별로 since 이후 생성된 가장 최근 스크린샷"""
+        if not render_keys:
+            return {}
+        result = await db.execute(
+            select(Screenshot)
+            .where(Screenshot.render_key.in_(render_keys), Screenshot.created_at >= since)
+            .order_by(Screenshot.created_at.desc())
+        )
+        recent: Dict[str, Screenshot] = {}
+        for screenshot in result.scalars().all():
+            recent.setdefault(screenshot.render_key, screenshot)
+        return recent
+
+    async def aget_by_page(self, db: AsyncSession, *, page_id: int) -> List[Screenshot]:
+        result = await db.execute(
+            select(Screenshot).where(Screenshot.page_id == page_id).order_by(Screenshot.id)
+        )
+        return list(result.scalars().all())
+
+    async def aget_latest_versions(
+        self, db: AsyncSession, *, website_id: int, url: str, exclude_capture_id: int
+    ) -> Dict[str, int]:
+        """같은 웹사이트/URL의 다른 캡처에서 저장된 디바이스별 최신 스크린샷 버전"""
+        result = await db.execute(
+            select(Screenshot.device_type, func.max(Screenshot.version))
+            .join(Page, Screenshot.page_id == Page.id)
+            .where(Page.website_id == website_id, Page.url == url, Page.capture_id != exclude_capture_id)
+            .group_by(Screenshot.device_type)
+        )
+        return {device_type: version or 0 for device_type, version in result.all()}
+
+    async def aget_previous_version(self, db: AsyncSession, *, screenshot: Screenshot) -> Optional[Screenshot]:
+        """같은 웹사이트/URL/디바이스의 바로 이전 스크린샷"""
+        page = await db.get(Page, screenshot.page_id)
+        if page is None:
+            return None
+        result = await db.execute(
+            select(Screenshot)
+            .join(Page, Screenshot.page_id == Page.id)
+            .where(
+                Page.website_id == page.website_id,
+                Page.url == page.url,
+                Screenshot.device_type == screenshot.device_type,
+                Screenshot.id < screenshot.id,
+            )
+            .order_by(Screenshot.id.desc())
+            .limit(1)
+        )
+        return result.scalars().first()
+
+    async def aget_hashes_after(
+        self, db: AsyncSession, *, after_id: int
+    ) -> List[Tuple[int, int, int, int]]:
+        """after_id 이후 스크린샷의 (ID, 웹사이트 ID, dHash, pHash) - ID 순"""
+        result = await db.execute(
+            select(Screenshot.id, Page.website_id, Screenshot.dhash, Screenshot.phash)
+            .join(Page, Screenshot.page_id == Page.id)
+            .where(Screenshot.id > after_id, Screenshot.dhash.is_not(None), Screenshot.phash.is_not(None))
+            .order_by(Screenshot.id)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def aget_with_pages(self, db: AsyncSession, *, ids: List[int]) -> Dict[int, Tuple[Screenshot, Page]]:
+        """스크린샷 ID별 (스크린샷, 페이지)"""
+        if not ids:
+            return {}
+        result = await db.execute(
+            select(Screenshot, Page).join(Page, Screenshot.page_id == Page.id).where(Screenshot.id.in_(ids))
+        )
+        return {screenshot.id: (screenshot, page) for screenshot, page in result.all()}
+
+
+class CRUDScreenshotDiff(CRUDBase[ScreenshotDiff, ScreenshotDiffCreate, ScreenshotDiffCreate]):
+    async def aget_by_pair(
+        self, db: AsyncSession, *, before_id: int, after_id: int, options_key: str
+    ) -> Optional[ScreenshotDiff]:
+        result = await db.execute(
+            select(ScreenshotDiff).where(
+                ScreenshotDiff.before_id == before_id,
+                ScreenshotDiff.after_id == after_id,
+                ScreenshotDiff.options_key == options_key,
+            )
+        )
+        return result.scalars().first()
+
+    async def acreate_or_get(self, db: AsyncSession, *, obj_in: Dict[str, Any]) -> ScreenshotDiff:
+        """비교 결과 저장 (다른 요청이 먼저 저장했으면 그 결과 반환)"""
+        await db.execute(
+            pg_insert(ScreenshotDiff)
+            .values(created_at=datetime.now(), **obj_in)
+            .on_conflict_do_nothing(index_elements=["before_id", "after_id", "options_key"])
+        )
+        await db.commit()
+        return await self.aget_by_pair(
+            db, before_id=obj_in["before_id"], after_id=obj_in["after_id"], options_key=obj_in["options_key"]
+        )
+
+
+screenshots = CRUDScreenshot(Screenshot)
+screenshot_diffs = CRUDScreenshotDiff(ScreenshotDiff)
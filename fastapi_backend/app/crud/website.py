@@ -0,0 +1,25 @@
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.crud.base import CRUDBase
+from app.models.website import Website
+from app.schemas.website import WebsiteCreate, WebsiteUpdate
+
+
+class CRUDWebsite(CRUDBase[Website, WebsiteCreate, WebsiteUpdate]):
+    def get_by_url(self, db: Session, *, url: str) -> Optional[Website]:
+        return db.query(Website).filter(Website.url == url).first()
+
+    async def aget_by_url(self, db: AsyncSession, *, url: str) -> Optional[Website]:
+        result = await db.execute(select(Website).where(Website.url == url))
+        return result.scalars().first()
+
+    async def aget_by_domain(self, db: AsyncSession, *, domain: str) -> Optional[Website]:
+        result = await db.execute(select(Website).where(Website.domain == domain).order_by(Website.id))
+        return result.scalars().first()
+
+
+websites = CRUDWebsite(Website)
@@ -1,4 +1,6 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
@@ -13,6 +15,25 @@ if database_url and database_url.startswith("postgres://"):
 engine = create_engine(database_url or settings.DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def _async_engine_args(url: str):
+    """동기 DB URL을 asyncpg 용 URL과 connect_args 로 변환
+
+    asyncpg 는 libpq 의 sslmode 쿼리 파라미터를 모르므로 ssl 인자로 옮긴다.
+    """
+    async_url = make_url(url)
+    query = dict(async_url.query)
+    sslmode = query.pop("sslmode", None)
+    async_url = async_url.set(drivername="postgresql+asyncpg", query=query)
+    connect_args = {"ssl": sslmode} if sslmode and sslmode != "disable" else {}
+    return async_url, connect_args
+
+
+# 이벤트 루프를 막지 않는 비동기 엔진 (캡처 작업 처리 및 async 엔드포인트용)
+_async_url, _async_connect_args = _async_engine_args(database_url or settings.DATABASE_URL)
+async_engine = create_async_engine(_async_url, connect_args=_async_connect_args, pool_pre_ping=True)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 # Dependency
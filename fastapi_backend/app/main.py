@@ -1,18 +1,48 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 
 from app.api.api_v1.api import api_router
+from app.core.config import settings
 from app.db.base import Base
-from app.db.session import engine
+from app.db.session import async_engine, engine
+from app.utils.asset_cache import asset_cache
+from app.utils.browser_pool import browser_pool
+from app.utils.image import image_pool
+from app.utils.load_strategy import load_profiles
+from app.worker.worker import CaptureWorker
 
 # 데이터베이스 테이블 생성
 Base.metadata.create_all(bind=engine)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 수명 주기: 공유 브라우저 풀과 내장 캡처 워커 시작 및 종료"""
+    await browser_pool.start()
+    worker = CaptureWorker() if settings.EMBEDDED_WORKER else None
+    worker_task = asyncio.create_task(worker.run()) if worker else None
+    try:
+        yield
+    finally:
+        if worker:
+            worker.stop()
+            await worker_task
+        await browser_pool.close()
+        image_pool.close()
+        asset_cache.close()
+        load_profiles.close()
+        await async_engine.dispose()
+
+
 app = FastAPI(
     title="WebCapture Pro API",
     description="웹사이트 캡처 및 분석 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -3,5 +3,7 @@ from app.models.tag import Tag
 from app.models.website import Website, WebsiteTag
 from app.models.capture import Capture
 from app.models.page import Page, PageTag
-from app.models.screenshot import Screenshot
+from app.models.screenshot import Screenshot, ScreenshotDiff
+from app.models.blob import Blob
+from app.models.link import Url, PageLink
 from app.models.device_profile import DeviceProfile
\ No newline at end of file
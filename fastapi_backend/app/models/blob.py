@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime
+from datetime import datetime
+
+from app.db.base_class import Base
+
+
+class Blob(Base):
+    """내용 주소 방식으로 저장된 파일 (같은 내용은 한 번만 저장)"""
+    id = Column(Integer, primary_key=True, index=True)
+    hash = Column(String(64), unique=True, nullable=False)  # 파일 SHA-256
+    path = Column(String, nullable=False)  # 저장 경로 (해시로 결정)
+    size = Column(BigInteger, nullable=False, default=0)
+    ref_count = Column(Integer, nullable=False, default=0)  # 이 파일을 가리키는 스크린샷/썸네일 수
+    created_at = Column(DateTime, default=datetime.utcnow)
+    checked_at = Column(DateTime, nullable=True, index=True)  # GC가 참조 수를 마지막으로 확인한 시각
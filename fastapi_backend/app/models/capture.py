@@ -1,14 +1,24 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Float, ARRAY, Text
+import enum
+
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Float, ARRAY, Text, JSON
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
 from app.db.base_class import Base
 
 
+class CaptureStatus(str, enum.Enum):
+    PENDING = "pending"
+    PROCESSING = "in_progress"
+    COMPLETE = "complete"
+    FAILED = "failed"
+
+
 class Capture(Base):
     id = Column(Integer, primary_key=True, index=True)
     website_id = Column(Integer, ForeignKey("website.id", ondelete="CASCADE"))
-    status = Column(String, default="pending")  # pending, in_progress, complete, failed
+    url = Column(String, nullable=True)  # 캡처 시작 URL (없으면 웹사이트 URL)
+    status = Column(String, default="pending", index=True)  # pending, in_progress, complete, failed
     progress = Column(Float, default=0.0)
     created_at = Column(DateTime, default=datetime.utcnow)
     completed_at = Column(DateTime, nullable=True)
@@ -16,8 +26,23 @@ class Capture(Base):
     device_types = Column(ARRAY(String), nullable=False)
     capture_full_page = Column(Boolean, default=True)
     capture_dynamic_elements = Column(Boolean, default=False)
+    reuse_render = Column(Boolean, default=False)  # 한 번 렌더링 후 뷰포트만 변경하여 캡처
+    crawl = Column(JSON, nullable=True)  # 크롤링 옵션 (없으면 시작 URL만 캡처)
+    image_format = Column(String, nullable=True)  # png, jpeg, webp, avif (없으면 배포 설정)
+    image_quality = Column(Integer, nullable=True)  # 손실 압축 품질 (없으면 배포 설정)
+    request_policy = Column(JSON, nullable=True)  # 요청 차단 정책 캡처별 설정 (없으면 배포 설정)
+    load_strategy = Column(String, nullable=True)  # auto, load, domcontentloaded, networkidle (없으면 배포 설정)
+    wait_for_selector = Column(String, nullable=True)  # 로드 후 기다릴 CSS 선택자
+    result_max_age_seconds = Column(Integer, nullable=True)  # 이 시간 안의 같은 캡처 결과 재사용 (없으면 배포 설정)
+    incremental = Column(Boolean, default=False)  # 이전 캡처와 내용이 같은 페이지는 다시 캡처하지 않음
+    
+    # 작업 큐 리스 (워커가 작업을 점유한 상태)
+    lease_owner = Column(String, nullable=True)  # 작업을 점유한 워커 ID
+    lease_expires_at = Column(DateTime, nullable=True, index=True)  # 하트비트가 끊기면 이 시각 이후 회수
+    heartbeat_at = Column(DateTime, nullable=True)
+    attempts = Column(Integer, default=0)
     
     # 관계 설정
     website = relationship("Website", back_populates="captures")
     pages = relationship("Page", back_populates="capture")
-    screenshots = relationship("Screenshot", back_populates="capture")
\ No newline at end of file
+    screenshots = relationship("Screenshot", back_populates="capture")
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from datetime import datetime
+
+from app.db.base_class import Base
+
+
+class Url(Base):
+    """정규화한 URL 인터닝 테이블 (같은 URL은 한 번만 저장)"""
+    id = Column(Integer, primary_key=True, index=True)
+    hash = Column(String(64), unique=True, nullable=False)  # 정규화한 URL의 SHA-256 (긴 URL도 고정 길이로 색인)
+    url = Column(Text, nullable=False)  # crawl_key 로 정규화한 URL
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class PageLink(Base):
+    """페이지에서 수집한 링크 (페이지 -> URL 간선)"""
+    page_id = Column(Integer, ForeignKey("page.id", ondelete="CASCADE"), primary_key=True)
+    url_id = Column(Integer, ForeignKey("url.id", ondelete="CASCADE"), primary_key=True, index=True)
+    position = Column(Integer, nullable=False, default=0)  # 페이지 안에서 처음 나온 순서
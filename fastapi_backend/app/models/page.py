@@ -1,3 +1,5 @@
+import enum
+
 from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -5,14 +7,34 @@ from datetime import datetime
 from app.db.base_class import Base
 
 
+class PageStatus(str, enum.Enum):
+    PENDING = "pending"
+    COMPLETE = "complete"
+    FAILED = "failed"
+    SKIPPED = "skipped"  # 사전 확인에서 렌더링할 수 없는 URL로 판단 (PDF, 404, 로그인 벽 등)
+    UNCHANGED = "unchanged"  # 증분 캡처에서 이전 버전과 내용이 같아 캡처하지 않음 (previous_page_id 참조)
+
+
 class Page(Base):
     id = Column(Integer, primary_key=True, index=True)
     url = Column(String, index=True)
+    url_id = Column(Integer, ForeignKey("url.id"), nullable=True, index=True)  # 링크 그래프에서 이 페이지를 가리키는 URL
     title = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    status = Column(String, default="pending")  # pending, complete, failed, skipped, unchanged
+    error = Column(Text, nullable=True)  # 실패/건너뛴 이유
+    http_status = Column(Integer, nullable=True)  # 사전 확인/캡처 시 HTTP 응답 코드
+    depth = Column(Integer, default=0)  # 크롤링 시작 페이지로부터의 링크 깊이
     website_id = Column(Integer, ForeignKey("website.id", ondelete="CASCADE"))
     capture_id = Column(Integer, ForeignKey("capture.id", ondelete="CASCADE"))
     
+    # 증분 캡처용 지문 (HTTP 검증자 + 정규화한 HTML 해시)
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
+    dom_hash = Column(String(64), nullable=True)
+    # 내용이 같아 캡처하지 않은 경우 스크린샷이 있는 이전 버전 페이지
+    previous_page_id = Column(Integer, ForeignKey("page.id", ondelete="SET NULL"), nullable=True)
+    
     # 관계 설정
     website = relationship("Website", back_populates="pages")
     capture = relationship("Capture", back_populates="pages")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Float, ForeignKey, JSON, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -9,6 +9,13 @@ class Screenshot(Base):
     id = Column(Integer, primary_key=True, index=True)
     path = Column(String, nullable=False)  # 저장 경로
     thumbnail_path = Column(String, nullable=False)  # 썸네일 경로
+    format = Column(String, default="png")  # 저장 형식 (png, jpeg, webp, avif)
+    tiles_path = Column(String, nullable=True)  # DZI 타일 피라미드 디스크립터 경로
+    content_hash = Column(String(64), nullable=True, index=True)  # 스크린샷 파일 SHA-256 (ETag, Blob.hash)
+    thumbnail_hash = Column(String(64), nullable=True, index=True)  # 썸네일 파일 SHA-256 (ETag, Blob.hash)
+    render_key = Column(String(64), nullable=True, index=True)  # 같은 결과를 내는 캡처 요청 식별 키 (결과 재사용)
+    dhash = Column(BigInteger, nullable=True)  # 첫 화면 dHash (64비트, 유사 화면 검색)
+    phash = Column(BigInteger, nullable=True)  # 첫 화면 pHash (64비트, 유사 화면 검색)
     width = Column(Integer, nullable=False)
     height = Column(Integer, nullable=False)
     version = Column(Integer, default=1)
@@ -20,4 +27,26 @@ class Screenshot(Base):
     
     # 관계 설정
     page = relationship("Page", back_populates="screenshots")
-    capture = relationship("Capture", back_populates="screenshots")
\ No newline at end of file
+    capture = relationship("Capture", back_populates="screenshots")
+
+
+class ScreenshotDiff(Base):
+    """같은 페이지/디바이스의 두 스크린샷 비교 결과"""
+    __table_args__ = (UniqueConstraint("before_id", "after_id", "options_key"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    before_id = Column(Integer, ForeignKey("screenshot.id", ondelete="CASCADE"), nullable=False)
+    after_id = Column(Integer, ForeignKey("screenshot.id", ondelete="CASCADE"), nullable=False, index=True)
+    options_key = Column(String, nullable=False)  # 블록 크기/픽셀 임계값 (DiffOptions.key)
+    width = Column(Integer, nullable=False)  # after 기준
+    height = Column(Integer, nullable=False)
+    changed_pixels = Column(BigInteger, nullable=False, default=0)
+    changed_ratio = Column(Float, nullable=False, default=0.0)  # 0.0 ~ 1.0
+    changed_blocks = Column(Integer, nullable=False, default=0)
+    total_blocks = Column(Integer, nullable=False, default=0)
+    inserted_rows = Column(Integer, nullable=False, default=0)  # after 에만 있는 행 수
+    removed_rows = Column(Integer, nullable=False, default=0)  # before 에만 있던 행 수
+    regions = Column(JSON, nullable=True)  # 바뀐 영역 경계 상자 목록 (x, y, width, height, blocks)
+    overlay_path = Column(String, nullable=False)  # 바뀐 영역을 표시한 after 이미지
+    overlay_hash = Column(String(64), nullable=True)  # 비교 결과 이미지 SHA-256 (ETag)
+    created_at = Column(DateTime, default=datetime.utcnow)
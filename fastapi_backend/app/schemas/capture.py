@@ -1,17 +1,61 @@
+import re
 from typing import Optional, List, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 
+from app.core.config import settings
+from app.utils.image import ImageFormat
+from app.utils.load_strategy import LoadStrategy
+
+
+class CrawlOptions(BaseModel):
+    max_depth: int = Field(1, ge=0, le=settings.CRAWL_MAX_DEPTH)
+    max_pages: int = Field(20, ge=1, le=settings.CRAWL_MAX_PAGES)
+    same_domain: bool = True
+    include_patterns: List[str] = []  # URL 정규식
+    exclude_patterns: List[str] = []
+
+    @field_validator("include_patterns", "exclude_patterns")
+    @classmethod
+    def check_patterns(cls, patterns: List[str]) -> List[str]:
+        # 워커에서 크롤링 도중 실패하지 않도록 요청 시점에 컴파일해 확인
+        for pattern in patterns:
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"잘못된 정규식입니다 ({pattern}): {e}")
+        return patterns
+
+
+class RequestPolicyOptions(BaseModel):
+    enabled: bool = True
+    use_defaults: bool = True  # False 면 배포 설정의 차단 도메인/패턴을 쓰지 않음
+    block_resource_types: Optional[List[str]] = None  # 지정하면 배포 설정 대신 사용
+    block_domains: List[str] = []
+    block_url_patterns: List[str] = []
+    allow_domains: List[str] = []
+
 
 class CaptureBase(BaseModel):
     website_id: int
+    url: Optional[str] = None  # 캡처 시작 URL (없으면 웹사이트 URL)
     device_types: List[str]
     capture_full_page: bool = True
     capture_dynamic_elements: bool = False
+    reuse_render: bool = False
+    crawl: Optional[CrawlOptions] = None  # 지정하면 발견한 링크를 따라가며 여러 페이지 캡처
+    image_format: Optional[ImageFormat] = None  # 없으면 배포 설정(SCREENSHOT_FORMAT)
+    image_quality: Optional[int] = Field(None, ge=1, le=100)
+    request_policy: Optional[RequestPolicyOptions] = None  # 없으면 배포 설정(CAPTURE_BLOCK_*)
+    load_strategy: Optional[LoadStrategy] = None  # 없으면 배포 설정(CAPTURE_LOAD_STRATEGY)
+    wait_for_selector: Optional[str] = None  # 로드 후 화면에 나타날 때까지 기다릴 CSS 선택자
+    result_max_age_seconds: Optional[int] = Field(None, ge=0)  # 이 시간 안에 끝난 같은 캡처 결과 재사용 (없으면 CAPTURE_RESULT_TTL_SECONDS, 기본 재사용 안 함)
+    incremental: bool = False  # 이전 캡처와 내용이 같은 페이지는 스크린샷 없이 이전 버전을 가리킴
 
 
 class CaptureCreate(CaptureBase):
-    pass
+    # url 또는 website_id 중 하나는 필요 (url 이 있으면 도메인으로 웹사이트를 찾거나 생성)
+    website_id: Optional[int] = None
 
 
 class CaptureUpdate(BaseModel):
@@ -37,6 +81,10 @@ class Capture(CaptureInDBBase):
     pass
 
 
+class CaptureResponse(Capture):
+    pass
+
+
 class WebsiteDetail(BaseModel):
     id: int
     name: str
@@ -48,6 +96,11 @@ class PageDetail(BaseModel):
     id: int
     url: str
     title: Optional[str] = None
+    status: Optional[str] = None
+    error: Optional[str] = None
+    http_status: Optional[int] = None
+    depth: Optional[int] = 0
+    previous_page_id: Optional[int] = None
 
 
 class CaptureWithDetails(Capture):
@@ -55,6 +108,7 @@ class CaptureWithDetails(Capture):
     pages: Optional[List[PageDetail]] = []
     pageCount: Optional[int] = 0
     completedPageCount: Optional[int] = 0
+    unchangedPageCount: Optional[int] = 0
 
 
 class CaptureConfig(BaseModel):
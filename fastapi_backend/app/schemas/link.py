@@ -0,0 +1,44 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class PageLinkBase(BaseModel):
+    page_id: int
+    url_id: int
+    position: int = 0
+
+
+class PageLinkCreate(PageLinkBase):
+    pass
+
+
+class PageLink(PageLinkBase):
+    class Config:
+        orm_mode = True
+
+
+class OutboundLink(BaseModel):
+    """페이지에서 나가는 링크 (같은 캡처에서 캡처한 페이지면 그 상태 포함)"""
+    url: str
+    page_id: Optional[int] = None
+    status: Optional[str] = None
+    http_status: Optional[int] = None
+
+
+class LinkedPage(BaseModel):
+    """링크 그래프의 페이지 (들어오는 링크, 고아 페이지)"""
+    page_id: int
+    capture_id: int
+    url: str
+    title: Optional[str] = None
+    status: Optional[str] = None
+
+
+class BrokenLink(BaseModel):
+    """캡처 안에서 깨진 링크 대상과 그 링크가 있는 페이지"""
+    url: str
+    page_id: int
+    status: str
+    http_status: Optional[int] = None
+    error: Optional[str] = None
+    source_page_ids: List[int] = []
@@ -9,8 +9,16 @@ from app.schemas.screenshot import Screenshot
 class PageBase(BaseModel):
     url: str
     title: Optional[str] = None
+    status: str = "pending"
+    depth: int = 0
+    error: Optional[str] = None
+    http_status: Optional[int] = None
     website_id: int
     capture_id: int
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    dom_hash: Optional[str] = None
+    previous_page_id: Optional[int] = None
 
 
 class PageCreate(PageBase):
@@ -20,12 +28,21 @@ class PageCreate(PageBase):
 class PageUpdate(PageBase):
     url: Optional[str] = None
     title: Optional[str] = None
+    status: Optional[str] = None
+    depth: Optional[int] = None
+    error: Optional[str] = None
+    http_status: Optional[int] = None
     website_id: Optional[int] = None
     capture_id: Optional[int] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    dom_hash: Optional[str] = None
+    previous_page_id: Optional[int] = None
 
 
 class PageInDBBase(PageBase):
     id: int
+    url_id: Optional[int] = None
     created_at: datetime
 
     class Config:
@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from pydantic import BaseModel
 from datetime import datetime
 
@@ -10,6 +10,13 @@ class ScreenshotBase(BaseModel):
     height: int
     device_type: str
     version: int = 1
+    format: str = "png"
+    tiles_path: Optional[str] = None
+    content_hash: Optional[str] = None
+    thumbnail_hash: Optional[str] = None
+    render_key: Optional[str] = None
+    dhash: Optional[int] = None
+    phash: Optional[int] = None
     metadata: Optional[Dict[str, Any]] = None
     page_id: int
     capture_id: int
@@ -26,6 +33,13 @@ class ScreenshotUpdate(ScreenshotBase):
     height: Optional[int] = None
     device_type: Optional[str] = None
     version: Optional[int] = None
+    format: Optional[str] = None
+    tiles_path: Optional[str] = None
+    content_hash: Optional[str] = None
+    thumbnail_hash: Optional[str] = None
+    render_key: Optional[str] = None
+    dhash: Optional[int] = None
+    phash: Optional[int] = None
     metadata: Optional[Dict[str, Any]] = None
     page_id: Optional[int] = None
     capture_id: Optional[int] = None
@@ -40,4 +54,55 @@ class ScreenshotInDBBase(ScreenshotBase):
 
 
 class Screenshot(ScreenshotInDBBase):
-    pass
\ No newline at end of file
+    pass
+
+
+class DiffRegion(BaseModel):
+    x: int
+    y: int
+    width: int
+    height: int
+    blocks: int
+
+
+class SimilarScreenshot(BaseModel):
+    screenshot_id: int
+    page_id: int
+    capture_id: int
+    website_id: int
+    url: str
+    device_type: str
+    distance: int  # 해밍 거리 (0-64)
+
+
+class ScreenshotDiffBase(BaseModel):
+    before_id: int
+    after_id: int
+    options_key: str
+    width: int
+    height: int
+    changed_pixels: int = 0
+    changed_ratio: float = 0.0
+    changed_blocks: int = 0
+    total_blocks: int = 0
+    inserted_rows: int = 0
+    removed_rows: int = 0
+    regions: List[DiffRegion] = []
+    overlay_path: str
+    overlay_hash: Optional[str] = None
+
+
+class ScreenshotDiffCreate(ScreenshotDiffBase):
+    pass
+
+
+class ScreenshotDiffInDBBase(ScreenshotDiffBase):
+    id: int
+    created_at: datetime
+
+    class Config:
+        orm_mode = True
+
+
+class ScreenshotDiff(ScreenshotDiffInDBBase):
+    pass
@@ -0,0 +1,446 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 캐시할 수 있는 응답 상태 코드 (RFC 9111 기본 캐시 가능 상태 중 정적 리소스에 해당하는 것)
+CACHEABLE_STATUS = {200, 203, 301, 308, 404, 410}
+
+# 저장/재생하지 않는 응답 헤더 (본문은 디코딩된 상태로 저장되므로 인코딩/길이 관련 헤더 제외)
+_DROP_HEADERS = {
+    "content-encoding", "content-length", "transfer-encoding", "connection",
+    "keep-alive", "set-cookie", "set-cookie2",
+}
+
+# 조회 시각(last_access)은 모아 두었다가 이 개수마다 한 번에 기록
+ACCESS_FLUSH_SIZE = 256
+
+# 공유 인덱스의 stats 테이블에 누적하는 카운터 (모든 프로세스 합계)
+COUNTERS = ("hits", "revalidated", "misses", "stale", "errors", "stores", "evictions", "bytes_served")
+
+
+def _parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    directives: Dict[str, Optional[str]] = {}
+    for part in (value or "").split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
+
+
+def _parse_http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _int_or_none(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def freshness_lifetime(headers: Dict[str, str], now: float, heuristic_max: int) -> Optional[float]:
+    """응답의 신선도 유지 시간(초). 저장하면 안 되는 응답이면 None
+
+    s-maxage > max-age > Expires - Date 순으로 사용하고, 명시적인 만료가 없으면
+    Last-Modified 기준 휴리스틱(경과 시간의 10%, heuristic_max 이하)을 쓴다.
+    no-cache 응답은 저장하되 매번 재검증하도록 0을 반환한다.
+    """
+    cache_control = _parse_cache_control(headers.get("cache-control"))
+    if "no-store" in cache_control or "private" in cache_control:
+        return None
+    if headers.get("vary", "").strip() == "*":
+        return None
+    if "no-cache" in cache_control:
+        return 0
+
+    for directive in ("s-maxage", "max-age"):
+        seconds = _int_or_none(cache_control.get(directive))
+        if seconds is not None:
+            return max(0, seconds)
+
+    date = _parse_http_date(headers.get("date")) or now
+    expires = headers.get("expires")
+    if expires is not None:
+        expires_at = _parse_http_date(expires)
+        return max(0.0, expires_at - date) if expires_at else 0
+
+    last_modified = _parse_http_date(headers.get("last-modified"))
+    if last_modified is not None:
+        return min(heuristic_max, max(0.0, (date - last_modified) * 0.1))
+    return 0
+
+
+@dataclass
+class CachedResponse:
+    key: str
+    status: int
+    headers: Dict[str, str]
+    body_path: Path
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at > time.time()
+
+    def validators(self) -> Dict[str, str]:
+        """재검증 요청에 붙일 조건부 헤더"""
+        result = {}
+        if self.headers.get("etag"):
+            result["if-none-match"] = self.headers["etag"]
+        if self.headers.get("last-modified"):
+            result["if-modified-since"] = self.headers["last-modified"]
+        return result
+
+
+class AssetCache:
+    """브라우저 컨텍스트 간에 공유하는 디스크 HTTP 리소스 캐시
+
+    page.route 에서 정적 리소스 요청을 가로채 URL과 응답의 Vary 헤더에 지정된
+    요청 헤더 값으로 키를 만들어 저장한다. 신선한 항목은 네트워크 없이 바로
+    응답하고, 만료된 항목은 ETag/Last-Modified 로 조건부 요청을 보내 304 면
+    저장된 본문을 재사용한다. 전체 크기가 max_bytes 를 넘으면 가장 오래 사용하지
+    않은 항목부터 지운다.
+
+    인덱스는 SQLite(WAL), 본문은 파일로 저장하므로 API 프로세스와 워커 프로세스가
+    같은 디렉터리를 함께 사용할 수 있다. 인덱스 접근은 모두 스레드에서 실행해
+    이벤트 루프를 막지 않고, 조회 시각은 모아서 기록한다 (삭제 직전에는 반드시 기록).
+    적중률 카운터도 조회 시각과 함께 인덱스에 누적하므로 어느 프로세스에서든
+    전체 통계를 볼 수 있다.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int = 1024 ** 3,
+        max_entry_bytes: int = 20 * 1024 ** 2,
+        heuristic_max_seconds: int = 86400,
+    ):
+        """캐시 초기화 (첫 사용 시 디렉터리와 인덱스 생성)
+
+        Args:
+            directory: 캐시 저장 위치
+            max_bytes: 본문 파일 전체 크기 상한
+            max_entry_bytes: 저장할 응답 하나의 최대 크기
+            heuristic_max_seconds: Last-Modified 휴리스틱 신선도 상한 (초)
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.heuristic_max_seconds = heuristic_max_seconds
+        self._db: Optional[sqlite3.Connection] = None
+        # 인덱스 접근은 스레드에서 실행되므로 연결 사용을 직렬화
+        self._lock = threading.RLock()
+        # 아직 기록하지 않은 조회 시각 (키 -> 시각)
+        self._accessed: Dict[str, float] = {}
+
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.stale = 0
+        self.errors = 0
+        self.stores = 0
+        self.evictions = 0
+        self.bytes_served = 0
+        # 인덱스에 이미 누적한 카운터 값
+        self._flushed_counts: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._db is None:
+            (self.directory / "bodies").mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(
+                str(self.directory / "index.sqlite3"), timeout=10, check_same_thread=False
+            )
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, url TEXT NOT NULL, vary TEXT NOT NULL, status INTEGER NOT NULL, "
+                "headers TEXT NOT NULL, size INTEGER NOT NULL, expires_at REAL NOT NULL, "
+                "last_access REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS entries_url ON entries (url)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+            self._db.commit()
+        return self._db
+
+    @staticmethod
+    def _key(url: str, vary: List[str], request_headers: Dict[str, str]) -> str:
+        parts = [url] + [f"{name}:{request_headers.get(name, '')}" for name in vary]
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _vary_names(headers: Dict[str, str]) -> List[str]:
+        return sorted({name.strip().lower() for name in headers.get("vary", "").split(",") if name.strip()})
+
+    def _body_path(self, key: str) -> Path:
+        return self.directory / "bodies" / key[:2] / key
+
+    def lookup(self, url: str, request_headers: Dict[str, str]) -> Optional[CachedResponse]:
+        """요청에 맞는 저장된 응답 (신선도와 무관하게 반환)"""
+        with self._lock:
+            rows = self.db.execute(
+                "SELECT DISTINCT vary FROM entries WHERE url = ?", (url,)
+            ).fetchall()
+            for (vary_json,) in rows:
+                key = self._key(url, json.loads(vary_json), request_headers)
+                row = self.db.execute(
+                    "SELECT status, headers, expires_at FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    continue
+                self._accessed[key] = time.time()
+                if len(self._accessed) >= ACCESS_FLUSH_SIZE:
+                    self._flush_access()
+                return CachedResponse(
+                    key=key, status=row[0], headers=json.loads(row[1]), body_path=self._body_path(key), expires_at=row[2]
+                )
+        return None
+
+    def store(self, url: str, request_headers: Dict[str, str], status: int, headers: Dict[str, str], body: bytes) -> bool:
+        """응답 저장 (캐시할 수 없는 응답이면 False)"""
+        if status not in CACHEABLE_STATUS or len(body) > self.max_entry_bytes:
+            return False
+        headers = {k.lower(): v for k, v in headers.items()}
+        now = time.time()
+        lifetime = freshness_lifetime(headers, now, self.heuristic_max_seconds)
+        if lifetime is None:
+            return False
+        age = _int_or_none(headers.get("age")) or 0
+        if lifetime == 0 and not (headers.get("etag") or headers.get("last-modified")):
+            # 재검증할 수단이 없는 즉시 만료 응답은 저장해도 쓸모없음
+            return False
+
+        vary = self._vary_names(headers)
+        key = self._key(url, vary, request_headers)
+        body_path = self._body_path(key)
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = body_path.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(body)
+        os.replace(tmp_path, body_path)
+
+        stored_headers = {k: v for k, v in headers.items() if k not in _DROP_HEADERS}
+        with self._lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO entries (key, url, vary, status, headers, size, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, json.dumps(vary), status, json.dumps(stored_headers), len(body), now + lifetime - age, now),
+            )
+            self.db.commit()
+            self.stores += 1
+            self._flush_access()
+            self._evict()
+        return True
+
+    def refresh(self, entry: CachedResponse, headers: Dict[str, str]) -> None:
+        """304 응답의 헤더로 저장된 항목의 신선도 갱신"""
+        headers = {k.lower(): v for k, v in headers.items()}
+        merged = {**entry.headers, **{k: v for k, v in headers.items() if k not in _DROP_HEADERS}}
+        now = time.time()
+        lifetime = freshness_lifetime(merged, now, self.heuristic_max_seconds) or 0
+        entry.headers = merged
+        entry.expires_at = now + lifetime
+        with self._lock:
+            self._accessed.pop(entry.key, None)
+            self.db.execute(
+                "UPDATE entries SET headers = ?, expires_at = ?, last_access = ? WHERE key = ?",
+                (json.dumps(merged), entry.expires_at, now, entry.key),
+            )
+            self.db.commit()
+
+    def _flush_access(self) -> None:
+        """모아 둔 조회 시각과 카운터 증가분을 한 트랜잭션으로 기록"""
+        with self._lock:
+            accessed, self._accessed = self._accessed, {}
+            if accessed:
+                self.db.executemany(
+                    "UPDATE entries SET last_access = MAX(last_access, ?) WHERE key = ?",
+                    [(at, key) for key, at in accessed.items()],
+                )
+            counts = {name: getattr(self, name) for name in COUNTERS}
+            deltas = [(name, value - self._flushed_counts[name]) for name, value in counts.items()]
+            deltas = [(name, delta) for name, delta in deltas if delta]
+            if deltas:
+                self.db.executemany(
+                    "INSERT INTO stats (name, value) VALUES (?, ?) "
+                    "ON CONFLICT (name) DO UPDATE SET value = value + excluded.value",
+                    deltas,
+                )
+                self._flushed_counts = counts
+            if accessed or deltas:
+                self.db.commit()
+
+    def _evict(self) -> None:
+        """전체 크기가 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (잠금을 잡은 상태에서 호출)"""
+        total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self.db.execute(
+            "SELECT key, size FROM entries ORDER BY last_access"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self.db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            try:
+                self._body_path(key).unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            self.evictions += 1
+        self.db.commit()
+
+    async def handle(self, route) -> str:
+        """page.route 핸들러에서 호출. 요청을 캐시 또는 네트워크로 응답하고 결과 반환
+
+        Returns:
+            "hit" (저장된 응답), "revalidated" (304 후 저장된 응답), "miss" (네트워크 응답),
+            "stale" (네트워크 오류로 만료된 저장 응답), "error" (네트워크 오류, 저장된 응답 없음)
+        """
+        request = route.request
+        url = request.url
+        request_headers = await request.all_headers()
+
+        try:
+            entry = await asyncio.to_thread(self.lookup, url, request_headers)
+        except sqlite3.Error as e:
+            logger.warning(f"리소스 캐시 조회 오류 ({url}): {str(e)}")
+            entry = None
+        if entry is not None and entry.fresh:
+            body = await self._read_body(entry)
+            if body is not None:
+                await self._fulfill(route, entry, body)
+                self.hits += 1
+                return "hit"
+
+        conditional = entry is not None and bool(entry.validators())
+        try:
+            if conditional:
+                response = await route.fetch(headers={**request_headers, **entry.validators()})
+            else:
+                response = await route.fetch()
+        except Exception as e:
+            return await self._fetch_failed(route, url, entry, e, fetched=False)
+
+        if conditional and response.status == 304:
+            body = await self._read_body(entry)
+            if body is not None:
+                await asyncio.to_thread(self.refresh, entry, response.headers)
+                await self._fulfill(route, entry, body)
+                self.revalidated += 1
+                return "revalidated"
+            # 본문 파일이 사라졌으면 조건 없이 다시 요청
+            try:
+                response = await route.fetch()
+            except Exception as e:
+                return await self._fetch_failed(route, url, entry, e, fetched=True)
+
+        try:
+            body = await response.body()
+        except Exception as e:
+            return await self._fetch_failed(route, url, entry, e, fetched=True)
+
+        self.misses += 1
+        await route.fulfill(
+            status=response.status,
+            headers={k: v for k, v in response.headers.items() if k.lower() not in _DROP_HEADERS},
+            body=body,
+        )
+        if request.method == "GET":
+            try:
+                await asyncio.to_thread(self.store, url, request_headers, response.status, response.headers, body)
+            except Exception as e:
+                logger.warning(f"리소스 캐시 저장 오류 ({url}): {str(e)}")
+        return "miss"
+
+    async def _fetch_failed(
+        self, route, url: str, entry: Optional[CachedResponse], error: Exception, *, fetched: bool
+    ) -> str:
+        """네트워크 요청 실패 처리. 만료됐더라도 저장된 응답이 있으면 그것으로 응답
+
+        저장된 응답이 없으면 아직 아무것도 받지 못한 경우 브라우저가 직접 요청하도록
+        넘기고, 응답을 받다가 실패한 경우 요청을 실패 처리한다.
+        """
+        logger.warning(f"리소스 요청 오류 ({url}): {str(error)}")
+        if entry is not None:
+            body = await self._read_body(entry)
+            if body is not None:
+                await self._fulfill(route, entry, body)
+                self.stale += 1
+                return "stale"
+        self.errors += 1
+        if fetched:
+            await route.abort("failed")
+        else:
+            await route.continue_()
+        return "error"
+
+    async def _read_body(self, entry: CachedResponse) -> Optional[bytes]:
+        try:
+            return await asyncio.to_thread(entry.body_path.read_bytes)
+        except FileNotFoundError:
+            return None
+
+    async def _fulfill(self, route, entry: CachedResponse, body: bytes) -> None:
+        await route.fulfill(status=entry.status, headers=entry.headers, body=body)
+        self.bytes_served += len(body)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중률 통계 (같은 캐시 디렉터리를 쓰는 모든 프로세스 합계)"""
+        counts = dict.fromkeys(COUNTERS, 0)
+        entries, size = (0, 0)
+        if self._db is not None or (self.directory / "index.sqlite3").exists():
+            with self._lock:
+                self._flush_access()
+                counts.update(self.db.execute("SELECT name, value FROM stats").fetchall())
+                entries, size = self.db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        lookups = counts["hits"] + counts["revalidated"] + counts["misses"] + counts["stale"] + counts["errors"]
+        return {
+            "hits": counts["hits"],
+            "revalidated": counts["revalidated"],
+            "misses": counts["misses"],
+            "stale": counts["stale"],
+            "errors": counts["errors"],
+            "hitRatio": (counts["hits"] + counts["revalidated"]) / lookups if lookups else 0.0,
+            "stores": counts["stores"],
+            "evictions": counts["evictions"],
+            "bytesServed": counts["bytes_served"],
+            "entries": entries,
+            "sizeBytes": size,
+            "maxBytes": self.max_bytes,
+        }
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._flush_access()
+            self._db.close()
+            self._db = None
+
+
+asset_cache = AssetCache(
+    Path(settings.ASSET_CACHE_DIR),
+    max_bytes=settings.ASSET_CACHE_MAX_BYTES,
+    max_entry_bytes=settings.ASSET_CACHE_MAX_ENTRY_BYTES,
+    heuristic_max_seconds=settings.ASSET_CACHE_HEURISTIC_MAX_SECONDS,
+)
@@ -0,0 +1,120 @@
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+from app.core.config import settings
+from app.utils.image import file_digest
+from app.utils.tiles import tiles_dir_for
+
+logger = logging.getLogger(__name__)
+
+
+class BlobStore:
+    """내용 주소 방식 파일 저장소
+
+    파일은 SHA-256 해시로 정해지는 경로(root/ab/cd/<hash>.<ext>)에 저장되므로 같은
+    이미지는 한 번만 저장된다. 참조 수는 DB의 Blob 행이 관리하고, 참조가 없어진
+    파일은 워커의 GC(app.worker.blob_gc)가 지운다.
+    """
+
+    def __init__(self, root: Path):
+        """저장소 초기화
+
+        Args:
+            root: 저장 위치
+        """
+        self.root = Path(root)
+
+    def path_for(self, content_hash: str, extension: str) -> Path:
+        """해시와 확장자로 저장 경로 결정"""
+        return self.root / content_hash[:2] / content_hash[2:4] / f"{content_hash}{extension}"
+
+    def owns(self, path: Union[str, Path]) -> bool:
+        """저장소 안의 파일 경로인지 여부"""
+        try:
+            Path(path).resolve().relative_to(self.root.resolve())
+            return True
+        except ValueError:
+            return False
+
+    def adopt(self, source: Union[str, Path], content_hash: Optional[str] = None) -> Tuple[Path, str]:
+        """파일을 저장소로 옮기고 (저장 경로, 해시) 반환
+
+        같은 내용이 이미 있으면 원본을 지우고 기존 파일을 사용하며, GC가 지우지
+        않도록 수정 시각을 갱신한다.
+        """
+        source = Path(source)
+        content_hash = content_hash or file_digest(source)
+        target = self.path_for(content_hash, source.suffix)
+        if source == target:
+            return target, content_hash
+
+        if target.exists():
+            os.remove(source)
+            os.utime(target)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.replace(source, target)
+            except OSError:
+                # 다른 파일 시스템이면 복사 후 교체
+                tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+                shutil.copyfile(source, tmp_path)
+                os.replace(tmp_path, target)
+                os.remove(source)
+        return target, content_hash
+
+    def adopt_result(self, capture_result: Dict[str, Any]) -> Dict[str, Any]:
+        """캡처 결과의 스크린샷/썸네일을 저장소로 옮긴 결과 (경로와 해시 갱신)"""
+        screenshot_path, content_hash = self.adopt(
+            capture_result["screenshot_path"], capture_result.get("content_hash")
+        )
+        thumbnail_path, thumbnail_hash = self.adopt(
+            capture_result["thumbnail_path"], capture_result.get("thumbnail_hash")
+        )
+        return {
+            **capture_result,
+            "screenshot_path": str(screenshot_path),
+            "content_hash": content_hash,
+            "thumbnail_path": str(thumbnail_path),
+            "thumbnail_hash": thumbnail_hash,
+        }
+
+    def delete(self, path: Union[str, Path]) -> int:
+        """파일과 해당 타일 피라미드 삭제 후 삭제한 바이트 수 반환"""
+        path = Path(path)
+        try:
+            size = path.stat().st_size
+            os.remove(path)
+        except FileNotFoundError:
+            size = 0
+        shutil.rmtree(tiles_dir_for(path), ignore_errors=True)
+        return size
+
+    def is_recent(self, path: Union[str, Path], grace_seconds: float) -> bool:
+        """grace_seconds 안에 저장/재사용된 파일인지 여부"""
+        try:
+            return Path(path).stat().st_mtime > time.time() - grace_seconds
+        except FileNotFoundError:
+            return False
+
+    def iter_files(self, older_than: float) -> Iterator[Tuple[str, Path]]:
+        """older_than(초) 보다 오래된 저장소 파일 (해시, 경로)"""
+        cutoff = time.time() - older_than
+        if not self.root.exists():
+            return
+        for path in self.root.glob("*/*/*"):
+            if path.suffix == ".tmp" or not path.is_file():
+                continue
+            try:
+                if path.stat().st_mtime > cutoff:
+                    continue
+            except FileNotFoundError:
+                continue
+            yield path.name.split(".", 1)[0], path
+
+
+blob_store = BlobStore(Path(settings.BLOB_STORE_DIR))
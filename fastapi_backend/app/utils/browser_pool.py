@@ -0,0 +1,101 @@
+import asyncio
+import itertools
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """프로세스 전역 Chromium 브라우저 풀
+
+    앱 시작 시 N개의 브라우저를 미리 띄워두고, 캡처마다 격리된
+    BrowserContext만 새로 만들어 넘겨준다.
+    """
+
+    def __init__(self, size: int = 2, headless: bool = True):
+        """브라우저 풀 초기화
+
+        Args:
+            size: 유지할 브라우저 수
+            headless: 헤드리스 모드 여부
+        """
+        self.size = max(1, size)
+        self.headless = headless
+        self.playwright: Optional[Playwright] = None
+        self.browsers: List[Optional[Browser]] = []
+        self._cycle = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def started(self) -> bool:
+        """풀이 시작되어 사용 가능한지 여부"""
+        return self.playwright is not None
+
+    async def start(self) -> None:
+        """Playwright를 시작하고 브라우저를 미리 띄움"""
+        async with self._lock:
+            if self.started:
+                return
+            self.playwright = await async_playwright().start()
+            self.browsers = [await self._launch() for _ in range(self.size)]
+            self._cycle = itertools.cycle(range(self.size))
+            logger.info(f"브라우저 풀 시작: {self.size}개")
+
+    async def close(self) -> None:
+        """모든 브라우저와 Playwright 종료"""
+        async with self._lock:
+            for browser in self.browsers:
+                if browser is None:
+                    continue
+                try:
+                    await browser.close()
+                except Exception as e:
+                    logger.warning(f"브라우저 종료 오류: {str(e)}")
+            self.browsers = []
+            if self.playwright:
+                await self.playwright.stop()
+                self.playwright = None
+            logger.info("브라우저 풀 종료")
+
+    async def _launch(self) -> Browser:
+        """헤드리스 Chromium 실행"""
+        return await self.playwright.chromium.launch(headless=self.headless)
+
+    async def _acquire_browser(self) -> Browser:
+        """라운드 로빈으로 브라우저 선택 (죽은 브라우저는 다시 띄움)"""
+        if not self.started:
+            raise RuntimeError("브라우저 풀이 시작되지 않았습니다")
+        async with self._lock:
+            index = next(self._cycle)
+            browser = self.browsers[index]
+            if browser is None or not browser.is_connected():
+                logger.warning(f"브라우저 #{index} 연결 끊김, 재실행")
+                browser = await self._launch()
+                self.browsers[index] = browser
+            return browser
+
+    @asynccontextmanager
+    async def new_context(self, **kwargs) -> AsyncIterator[BrowserContext]:
+        """격리된 BrowserContext 생성 후 사용이 끝나면 닫음
+
+        Args:
+            **kwargs: Browser.new_context 에 전달할 옵션 (viewport, user_agent 등)
+        """
+        browser = await self._acquire_browser()
+        context = await browser.new_context(**kwargs)
+        try:
+            yield context
+        finally:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug(f"컨텍스트 종료 오류: {str(e)}")
+
+
+browser_pool = BrowserPool(size=settings.BROWSER_POOL_SIZE)
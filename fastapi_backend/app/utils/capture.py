@@ -1,37 +1,62 @@
 import asyncio
 import logging
 import os
+import time
 from datetime import datetime
-from io import BytesIO
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from PIL import Image
-from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
 from slugify import slugify
 
+from app.core.config import settings
+from app.utils.asset_cache import asset_cache
+from app.utils.browser_pool import BrowserPool, browser_pool
+from app.utils.image import FORMAT_EXTENSIONS, ImageFormat, ImageOptions, StripImageWriter, image_pool, process_screenshot_file
+from app.utils.load_strategy import LoadPlan, LoadStrategy, load_profiles
+from app.utils.request_policy import RequestPolicy, install_request_policy
+from app.utils.url import extract_domain
+
 logger = logging.getLogger(__name__)
 
 SCREENSHOTS_DIR = Path("storage/screenshots")
 THUMBNAILS_DIR = Path("storage/thumbnails")
 
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+MOBILE_USER_AGENT = "Mozilla/5.0 (iPhone; CPU iPhone OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Mobile/15E148 Safari/604.1"
+TABLET_USER_AGENT = "Mozilla/5.0 (iPad; CPU OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Mobile/15E148 Safari/604.1"
+
 # 캡처 경로가 존재하지 않으면 생성
 SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
 THUMBNAILS_DIR.mkdir(parents=True, exist_ok=True)
 
+# 프로세스 전체 동시 캡처 수 제한
+_capture_semaphore = asyncio.Semaphore(settings.CAPTURE_MAX_CONCURRENCY)
+
+
+def _elapsed_ms(started: float) -> int:
+    return int((time.monotonic() - started) * 1000)
+
 
 class CaptureTool:
     """웹사이트 캡처 도구"""
 
-    def __init__(self):
-        """캡처 도구 초기화"""
+    def __init__(self, pool: Optional[BrowserPool] = None):
+        """캡처 도구 초기화
+
+        Args:
+            pool: 공유 브라우저 풀 (없으면 자체적으로 브라우저를 실행)
+        """
+        self.pool = pool
         self.browser = None
         self.playwright = None
 
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입"""
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=True)
+        if self.pool is None:
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(headless=True)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -41,6 +66,19 @@ class CaptureTool:
         if self.playwright:
             await self.playwright.stop()
 
+    @asynccontextmanager
+    async def _new_context(self, **kwargs):
+        """브라우저 컨텍스트 생성 (풀이 있으면 풀에서 할당)"""
+        if self.pool is not None:
+            async with self.pool.new_context(**kwargs) as context:
+                yield context
+            return
+        context = await self.browser.new_context(**kwargs)
+        try:
+            yield context
+        finally:
+            await context.close()
+
     async def capture_website(
         self,
         url: str,
@@ -50,6 +88,14 @@ class CaptureTool:
         capture_full_page: bool = True,
         capture_dynamic_elements: bool = True,
         version: int = 1,
+        user_agent: Optional[str] = None,
+        is_mobile: bool = False,
+        has_touch: bool = False,
+        image_format: Optional[str] = None,
+        image_quality: Optional[int] = None,
+        request_policy: Optional[Dict] = None,
+        load_strategy: Optional[str] = None,
+        wait_for_selector: Optional[str] = None,
     ) -> Dict:
         """
         웹사이트 캡처 실행
@@ -62,155 +108,590 @@ class CaptureTool:
             capture_full_page: 전체 페이지 캡처 여부
             capture_dynamic_elements: 동적 요소 캡처 여부
             version: 캡처 버전
+            user_agent: 사용할 User-Agent (없으면 기본 데스크톱 UA)
+            is_mobile: 모바일 뷰포트(meta viewport) 에뮬레이션 여부
+            has_touch: 터치 이벤트 에뮬레이션 여부
+            image_format: 저장 형식 (png, jpeg, webp, avif, 없으면 SCREENSHOT_FORMAT)
+            image_quality: 손실 압축 품질 (없으면 SCREENSHOT_QUALITY)
+            request_policy: 요청 차단 정책의 캡처별 설정 (RequestPolicy.resolve 참고)
+            load_strategy: 페이지 로드 전략 (auto, load, domcontentloaded, networkidle,
+                없으면 CAPTURE_LOAD_STRATEGY)
+            wait_for_selector: 로드 후 화면에 나타날 때까지 기다릴 CSS 선택자
             
         Returns:
             캡처 결과 정보
         """
         try:
-            # 날짜 기반 폴더 생성
-            today = datetime.now().strftime("%Y-%m-%d")
-            date_dir = SCREENSHOTS_DIR / today
-            date_dir.mkdir(exist_ok=True)
-            thumbs_date_dir = THUMBNAILS_DIR / today
-            thumbs_date_dir.mkdir(exist_ok=True)
-
-            # 파일 이름 생성
-            domain = url.replace("http://", "").replace("https://", "").split("/")[0]
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{slugify(domain)}_{device_type}_{timestamp}_v{version}.png"
-            thumb_filename = f"{slugify(domain)}_{device_type}_{timestamp}_v{version}_thumb.png"
-            
-            screenshot_path = date_dir / filename
-            thumbnail_path = thumbs_date_dir / thumb_filename
+            options = ImageOptions.resolve(image_format, image_quality)
+            screenshot_path, thumbnail_path = self._build_paths(url, device_type, version, options)
             
             # 컨텍스트 및 페이지 생성
-            context = await self.browser.new_context(
+            async with self._new_context(
                 viewport={"width": width, "height": height},
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            )
-            
-            # 동적 요소 처리를 위한 타임아웃 설정
-            if capture_dynamic_elements:
-                # 느린 네트워크와 스크립트 로딩을 고려한 타임아웃
-                context.set_default_timeout(30000)  # 30초
-            
-            page = await context.new_page()
-            
-            # JavaScript 콘솔 로그 이벤트 핸들러
-            page.on("console", lambda msg: logger.debug(f"Browser console: {msg.text}"))
-            
-            # 페이지 로드
-            response = await page.goto(url, wait_until="networkidle")
-            
-            # 페이지 타이틀과 링크 추출
-            title = await page.title()
-            
-            # 페이지 내 모든 링크 수집
-            links = await page.evaluate("""() => {
-                const links = Array.from(document.querySelectorAll('a[href]'));
-                return links.map(link => link.href);
-            }""")
-            
-            # 스크롤링 페이지 또는 동적 컨텐츠를 위한 대기
-            if capture_dynamic_elements:
-                # 페이지 하단까지 스크롤
-                await self._scroll_page(page)
-                
-                # 이미지와 폰트 로딩 대기
-                await page.wait_for_load_state("networkidle")
-                
-                # 추가 렌더링을 위한 짧은 대기
-                await asyncio.sleep(2)
-            
-            # 스크린샷 찍기
-            if capture_full_page:
-                screenshot = await page.screenshot(
-                    full_page=True, 
-                    type="png",
-                    path=str(screenshot_path)
-                )
-            else:
-                screenshot = await page.screenshot(
-                    full_page=False,
-                    type="png",
-                    path=str(screenshot_path)
+                user_agent=user_agent or DEFAULT_USER_AGENT,
+                is_mobile=is_mobile,
+                has_touch=has_touch
+            ) as context:
+                # 동적 요소 처리를 위한 타임아웃 설정
+                if capture_dynamic_elements:
+                    # 느린 네트워크와 스크립트 로딩을 고려한 타임아웃
+                    context.set_default_timeout(30000)  # 30초
+
+                page = await context.new_page()
+                plan = await asyncio.to_thread(load_profiles.plan, url, load_strategy, wait_for_selector)
+                response, title, links, load = await self._load_page(
+                    page, url, capture_dynamic_elements, RequestPolicy.resolve(request_policy), plan
                 )
+                started = time.monotonic()
+                image = await self._save_screenshot(page, screenshot_path, thumbnail_path, capture_full_page, options)
+                timings = {**load["timings"], "screenshot": _elapsed_ms(started)}
             
-            # 썸네일 생성
-            thumbnail = await self._create_thumbnail(screenshot)
-            with open(thumbnail_path, "wb") as f:
-                f.write(thumbnail)
-            
-            # 페이지 메타데이터 수집
-            metadata = {
-                "title": title,
-                "url": url,
-                "captureTime": datetime.now().isoformat(),
-                "deviceType": device_type,
-                "width": width,
-                "height": height,
-                "fullPage": capture_full_page,
-                "links": links,
-                "statusCode": response.status if response else None,
-            }
-            
-            await context.close()
-            
-            return {
-                "screenshot_path": str(screenshot_path),
-                "thumbnail_path": str(thumbnail_path),
-                "title": title,
-                "links": links,
-                "metadata": metadata
-            }
+            return self._build_result(
+                url, device_type, width, height, capture_full_page,
+                image, title, links, response, timings, load
+            )
             
         except Exception as e:
             logger.error(f"캡처 오류: {str(e)}")
             raise
 
-    async def _scroll_page(self, page):
-        """페이지를 천천히 스크롤하여 모든 레이지 로딩 요소 로드"""
-        await page.evaluate("""async () => {
-            await new Promise((resolve) => {
-                let totalHeight = 0;
-                const distance = 300;
-                const scrollInterval = setInterval(() => {
-                    const scrollHeight = document.body.scrollHeight;
-                    window.scrollBy(0, distance);
-                    totalHeight += distance;
-                    
-                    if (totalHeight >= scrollHeight) {
-                        clearInterval(scrollInterval);
-                        window.scrollTo(0, 0);  // 맨 위로 스크롤 복귀
-                        resolve();
-                    }
-                }, 200);
-            });
-        }""")
-
-    async def _create_thumbnail(self, screenshot_bytes: bytes) -> bytes:
-        """스크린샷에서 썸네일 생성"""
-        image = Image.open(BytesIO(screenshot_bytes))
+    async def capture_viewports(
+        self,
+        url: str,
+        devices: List[Dict],
+        capture_full_page: bool = True,
+        capture_dynamic_elements: bool = True,
+        version: int = 1,
+        image_format: Optional[str] = None,
+        image_quality: Optional[int] = None,
+        request_policy: Optional[Dict] = None,
+        load_strategy: Optional[str] = None,
+        wait_for_selector: Optional[str] = None,
+    ) -> List[Dict]:
+        """
+        페이지를 한 번만 로드한 뒤 뷰포트 크기만 바꿔가며 여러 디바이스 캡처
         
-        # 이미지 비율 유지하며 크기 조정
-        width, height = image.size
-        max_size = 300
+        User-Agent 나 터치/모바일 에뮬레이션이 다른 디바이스는 뷰포트 변경만으로
+        재현할 수 없으므로 해당 디바이스만 새 컨텍스트에서 다시 로드한다.
         
-        if width > height:
-            new_width = max_size
-            new_height = int(height * (max_size / width))
-        else:
-            new_height = max_size
-            new_width = int(width * (max_size / height))
+        Args:
+            url: 캡처할 웹사이트 URL
+            devices: 디바이스 설정 목록 (type, width, height, 선택적으로
+                user_agent, is_mobile, has_touch)
+            capture_full_page: 전체 페이지 캡처 여부
+            capture_dynamic_elements: 동적 요소 캡처 여부
+            version: 캡처 버전
+            image_format: 저장 형식 (없으면 SCREENSHOT_FORMAT)
+            image_quality: 손실 압축 품질 (없으면 SCREENSHOT_QUALITY)
+            request_policy: 요청 차단 정책의 캡처별 설정
+            load_strategy: 페이지 로드 전략 (없으면 CAPTURE_LOAD_STRATEGY)
+            wait_for_selector: 로드 후 화면에 나타날 때까지 기다릴 CSS 선택자
             
-        thumbnail = image.resize((new_width, new_height), Image.LANCZOS)
+        Returns:
+            devices 순서와 같은 순서의 캡처 결과 목록
+        """
+        results: List[Optional[Dict]] = [None] * len(devices)
+        options = ImageOptions.resolve(image_format, image_quality)
+        shared = [i for i, device in enumerate(devices) if self._can_reuse_render(device)]
         
-        # 바이트로 변환
-        output = BytesIO()
-        thumbnail.save(output, format="PNG", optimize=True)
-        output.seek(0)
+        if shared:
+            try:
+                first = devices[shared[0]]
+                async with self._new_context(
+                    viewport={"width": first["width"], "height": first["height"]},
+                    user_agent=DEFAULT_USER_AGENT
+                ) as context:
+                    if capture_dynamic_elements:
+                        context.set_default_timeout(30000)  # 30초
+                    
+                    page = await context.new_page()
+                    plan = await asyncio.to_thread(load_profiles.plan, url, load_strategy, wait_for_selector)
+                    response, title, links, load = await self._load_page(
+                        page, url, capture_dynamic_elements, RequestPolicy.resolve(request_policy), plan
+                    )
+                    
+                    for i in shared:
+                        device = devices[i]
+                        screenshot_path, thumbnail_path = self._build_paths(url, device["type"], version, options)
+                        
+                        # 뷰포트 변경 후 레이아웃이 다시 잡힐 때까지 대기
+                        started = time.monotonic()
+                        await page.set_viewport_size({"width": device["width"], "height": device["height"]})
+                        await self._wait_for_relayout(page)
+                        timings = {**load["timings"], "relayout": _elapsed_ms(started)}
+                        
+                        started = time.monotonic()
+                        image = await self._save_screenshot(
+                            page, screenshot_path, thumbnail_path, capture_full_page, options
+                        )
+                        timings["screenshot"] = _elapsed_ms(started)
+                        results[i] = self._build_result(
+                            url, device["type"], device["width"], device["height"], capture_full_page,
+                            image, title, links, response, timings, load
+                        )
+            except Exception as e:
+                logger.error(f"캡처 오류: {str(e)}")
+                raise
         
-        return output.getvalue()
+        # 뷰포트 변경만으로 재현할 수 없는 디바이스는 전체 다시 로드
+        for i, device in enumerate(devices):
+            if results[i] is None:
+                results[i] = await self.capture_website(
+                    url=url,
+                    device_type=device["type"],
+                    width=device["width"],
+                    height=device["height"],
+                    capture_full_page=capture_full_page,
+                    capture_dynamic_elements=capture_dynamic_elements,
+                    version=version,
+                    user_agent=device.get("user_agent"),
+                    is_mobile=device.get("is_mobile", False),
+                    has_touch=device.get("has_touch", False),
+                    image_format=image_format,
+                    image_quality=image_quality,
+                    request_policy=request_policy,
+                    load_strategy=load_strategy,
+                    wait_for_selector=wait_for_selector
+                )
+        
+        return results
+
+    @staticmethod
+    def _can_reuse_render(device: Dict) -> bool:
+        """기본 렌더링을 뷰포트 변경만으로 재사용할 수 있는 디바이스인지 여부"""
+        return (
+            device.get("user_agent") in (None, DEFAULT_USER_AGENT)
+            and not device.get("is_mobile", False)
+            and not device.get("has_touch", False)
+        )
+
+    def _build_paths(self, url: str, device_type: str, version: int, options: ImageOptions) -> Tuple[Path, Path]:
+        """스크린샷/썸네일 저장 경로 생성"""
+        # 날짜 기반 폴더 생성
+        today = datetime.now().strftime("%Y-%m-%d")
+        date_dir = SCREENSHOTS_DIR / today
+        date_dir.mkdir(exist_ok=True)
+        thumbs_date_dir = THUMBNAILS_DIR / today
+        thumbs_date_dir.mkdir(exist_ok=True)
+
+        # 파일 이름 생성 (크롤링 시 같은 도메인의 여러 페이지가 겹치지 않도록 경로 포함)
+        domain, _, path = url.replace("http://", "").replace("https://", "").partition("/")
+        name = slugify(domain)
+        if slugify(path):
+            name = f"{name}_{slugify(path, max_length=60)}"
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        extension = FORMAT_EXTENSIONS[options.format]
+        thumb_extension = FORMAT_EXTENSIONS[options.thumbnail_format]
+        filename = f"{name}_{device_type}_{timestamp}_v{version}{extension}"
+        thumb_filename = f"{name}_{device_type}_{timestamp}_v{version}_thumb{thumb_extension}"
+        
+        return date_dir / filename, thumbs_date_dir / thumb_filename
+
+    async def _load_page(
+        self,
+        page,
+        url: str,
+        capture_dynamic_elements: bool,
+        policy: Optional[RequestPolicy] = None,
+        plan: Optional[LoadPlan] = None,
+    ):
+        """페이지 로드 후 동적 요소 대기, 타이틀과 링크 수집
+
+        로드 전략(plan)에 따라 기다린 직후(스크롤/안정화 대기 전) 렌더링이 완전한지
+        확인해 도메인별 로드 기록에 남긴다 (선택자 대기가 있는 로드는 기록하지 않음).
+
+        Returns:
+            (response, title, links, load) - load 는 단계별 소요 시간(ms), 렌더링
+            안정화 결과, 요청 통계, 로드 전략 결과
+            {"timings": {...}, "settle": {...}, "requests": RequestStats, "strategy": {...}}
+        """
+        plan = plan or LoadPlan(strategy=LoadStrategy.NETWORKIDLE)
+        timings: Dict[str, int] = {}
+        settle: Dict[str, Any] = {}
+
+        # JavaScript 콘솔 로그 이벤트 핸들러
+        page.on("console", lambda msg: logger.debug(f"Browser console: {msg.text}"))
+
+        # 광고/트래커/미디어 등 불필요한 요청 차단, 정적 리소스는 공유 캐시로 응답
+        request_stats = await install_request_policy(
+            page, policy, asset_cache if settings.ASSET_CACHE_ENABLED else None
+        )
+
+        # 페이지 로드
+        started = time.monotonic()
+        response = await page.goto(url, wait_until=plan.wait_until)
+        strategy = plan.as_dict()
+        if plan.strategy == LoadStrategy.NETWORKIDLE:
+            # 롱폴링 등으로 유휴 상태가 오지 않는 사이트에서 전체 타임아웃을 쓰지 않도록 상한을 둠
+            try:
+                await page.wait_for_load_state("networkidle", timeout=settings.CAPTURE_NETWORKIDLE_CAP_MS)
+                strategy["networkIdle"] = True
+            except PlaywrightTimeoutError:
+                strategy["networkIdle"] = False
+        if plan.selector:
+            try:
+                await page.wait_for_selector(
+                    plan.selector, state="visible", timeout=settings.CAPTURE_SELECTOR_TIMEOUT_MS
+                )
+                strategy["selectorFound"] = True
+            except PlaywrightTimeoutError:
+                strategy["selectorFound"] = False
+        timings["navigation"] = _elapsed_ms(started)
+
+        # 로드 전략만으로 렌더링이 완전한지 확인 (문서/이미지/웹폰트 로드 완료).
+        # 스크롤/안정화 대기가 채워 주는 부분이 섞이지 않도록 그 전에 확인하고,
+        # 스크롤해야 로드되는 lazy 이미지는 제외한다.
+        render = await page.evaluate("""() => ({
+            readyState: document.readyState,
+            pendingImages: Array.from(document.images)
+                .filter((img) => !img.complete && img.loading !== 'lazy').length,
+            fontsLoaded: !document.fonts || document.fonts.status === 'loaded',
+        })""")
+        strategy["complete"] = (
+            render["readyState"] == "complete" and render["pendingImages"] == 0 and render["fontsLoaded"]
+        )
+        if not plan.selector:
+            try:
+                await asyncio.to_thread(
+                    load_profiles.record,
+                    extract_domain(url), plan.strategy, timings["navigation"], strategy["complete"],
+                )
+            except Exception as e:
+                logger.warning(f"로드 전략 기록 오류 ({url}): {str(e)}")
+
+        # 스크롤링 페이지 또는 동적 컨텐츠를 위한 대기 (전체 시간 예산 안에서)
+        if capture_dynamic_elements:
+            budget_ms = settings.CAPTURE_SETTLE_BUDGET_MS
+            started = time.monotonic()
+            settle.update(await self._scroll_page(page, budget_ms))
+            timings["scroll"] = _elapsed_ms(started)
+
+            started = time.monotonic()
+            settle.update(await self._wait_for_settle(page, max(0, budget_ms - timings["scroll"])))
+            timings["settle"] = _elapsed_ms(started)
+
+        # 페이지 타이틀과 링크 추출 (레이지 로딩으로 추가된 링크 포함)
+        title = await page.title()
+
+        # 페이지 내 모든 링크 수집
+        links = await page.evaluate("""() => {
+            const links = Array.from(document.querySelectorAll('a[href]'));
+            return links.map(link => link.href);
+        }""")
+
+        logger.debug(f"페이지 로드 소요 시간 ({url}, {plan.strategy.value}): {timings}")
+        return response, title, links, {
+            "timings": timings, "settle": settle, "requests": request_stats, "strategy": strategy
+        }
+
+    async def _save_screenshot(
+        self, page, screenshot_path: Path, thumbnail_path: Path, capture_full_page: bool, options: ImageOptions
+    ) -> Dict:
+        """스크린샷과 썸네일을 파일로 저장
+
+        PNG/JPEG 는 브라우저가 바로 저장하고, WebP/AVIF 는 PNG 로 받은 뒤
+        이미지 프로세스 풀에서 변환한다. CAPTURE_TILED_MIN_HEIGHT 보다 긴 페이지는
+        스트립 단위로 나눠 캡처한다.
+
+        Returns:
+            실제 저장된 경로와 형식 (process_screenshot_file 반환값)
+        """
+        if capture_full_page:
+            page_width, page_height = await page.evaluate("""() => [
+                Math.max(document.documentElement.scrollWidth, document.body ? document.body.scrollWidth : 0),
+                Math.max(document.documentElement.scrollHeight, document.body ? document.body.scrollHeight : 0),
+            ]""")
+            if page_height > settings.CAPTURE_TILED_MIN_HEIGHT:
+                return await self._save_tiled_screenshot(
+                    page, screenshot_path, thumbnail_path, options, page_width, page_height
+                )
+
+        if options.format == ImageFormat.JPEG:
+            source_path = screenshot_path
+            await page.screenshot(
+                full_page=capture_full_page,
+                type="jpeg",
+                quality=options.quality,
+                path=str(source_path)
+            )
+        else:
+            source_path = screenshot_path if options.format == ImageFormat.PNG else screenshot_path.with_suffix(".capture.png")
+            await page.screenshot(
+                full_page=capture_full_page,
+                type="png",
+                path=str(source_path)
+            )
+
+        # 변환 및 썸네일 생성 (저장된 파일에서 이미지 프로세스 풀로)
+        return await self._create_thumbnail(source_path, screenshot_path, thumbnail_path, options)
+
+    async def _save_tiled_screenshot(
+        self,
+        page,
+        screenshot_path: Path,
+        thumbnail_path: Path,
+        options: ImageOptions,
+        page_width: int,
+        page_height: int,
+    ) -> Dict:
+        """긴 페이지를 뷰포트 높이 스트립으로 나눠 캡처하고 디스크에서 이어 붙임
+
+        한 번의 full_page 스크린샷은 전체 이미지를 메모리에 올리고 Chromium 텍스처
+        한도에 걸릴 수 있으므로, clip 영역으로 스트립을 하나씩 받아
+        StripImageWriter 로 바로 기록한다. 높이는 CAPTURE_MAX_PAGE_HEIGHT 로
+        제한되며, 스트리밍 기록이 가능한 PNG 로만 저장된다.
+        """
+        viewport = page.viewport_size or {"width": page_width, "height": 1080}
+        strip_height = max(1, viewport["height"])
+        width = max(1, page_width)
+        height = min(page_height, settings.CAPTURE_MAX_PAGE_HEIGHT)
+
+        writer = StripImageWriter(
+            screenshot_path.with_suffix(FORMAT_EXTENSIONS[ImageFormat.PNG]), width, height, thumbnail_path, options
+        )
+        try:
+            for top in range(0, height, strip_height):
+                strip = await page.screenshot(
+                    type="png",
+                    full_page=True,
+                    clip={"x": 0, "y": top, "width": width, "height": min(strip_height, height - top)}
+                )
+                # 디코딩/압축은 이벤트 루프 밖에서
+                await asyncio.to_thread(writer.add_strip, strip)
+            result = await asyncio.to_thread(writer.close)
+        except BaseException:
+            writer.abort()
+            raise
+
+        result["tiled"] = True
+        result["truncated"] = page_height > height
+        return result
+
+    async def _wait_for_relayout(self, page) -> None:
+        """뷰포트 변경 후 리플로우와 반응형 이미지 로딩 대기"""
+        await page.evaluate("""async () => {
+            window.scrollTo(0, 0);
+            // 두 프레임을 넘겨 레이아웃과 페인트가 끝나도록 함
+            await new Promise((resolve) => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+            const pending = Array.from(document.images).filter((img) => !img.complete);
+            const loaded = Promise.all(pending.map((img) => new Promise((resolve) => {
+                img.addEventListener('load', resolve, { once: true });
+                img.addEventListener('error', resolve, { once: true });
+            })));
+            await Promise.race([loaded, new Promise((resolve) => setTimeout(resolve, 3000))]);
+        }""")
+
+    def _build_result(
+        self,
+        url: str,
+        device_type: str,
+        width: int,
+        height: int,
+        capture_full_page: bool,
+        image: Dict,
+        title: str,
+        links: List[str],
+        response,
+        timings: Dict[str, int],
+        load: Dict[str, Any],
+    ) -> Dict:
+        """캡처 결과 및 메타데이터 구성"""
+        # 페이지 메타데이터 수집
+        metadata = {
+            "title": title,
+            "url": url,
+            "captureTime": datetime.now().isoformat(),
+            "deviceType": device_type,
+            "width": width,
+            "height": height,
+            "fullPage": capture_full_page,
+            "format": image["format"],
+            "tiled": image.get("tiled", False),
+            "truncated": image.get("truncated", False),
+            "linkCount": len(links),  # 링크 자체는 페이지 링크 그래프에 한 번만 저장
+            "statusCode": response.status if response else None,
+            "timings": timings,  # 단계별 소요 시간 (ms)
+            "settle": load["settle"],  # 스크롤/렌더링 안정화 결과
+            "loadStrategy": load["strategy"],  # 사용한 로드 전략과 렌더링 완전성
+            "requests": load["requests"].as_dict(),  # 허용/차단된 요청 수, 리소스 캐시 적중
+        }
+        
+        return {
+            "screenshot_path": image["path"],
+            "thumbnail_path": image["thumbnail_path"],
+            "format": image["format"],
+            "content_hash": image["content_hash"],
+            "thumbnail_hash": image["thumbnail_hash"],
+            "dhash": image.get("dhash"),
+            "phash": image.get("phash"),
+            "title": title,
+            "links": links,
+            "metadata": metadata
+        }
+
+    async def _scroll_page(self, page, budget_ms: int) -> Dict[str, Any]:
+        """레이지 로딩 요소가 모두 로드되도록 페이지 끝까지 스크롤
+
+        뷰포트 높이 단위로 크게 스크롤하고, 매 단계마다 IntersectionObserver 로
+        화면에 들어온 이미지의 load/error 이벤트만 기다린다. 바닥에 닿은 뒤
+        scrollHeight 가 더 늘어나지 않거나 (무한 스크롤은 CAPTURE_MAX_PAGE_HEIGHT 까지)
+        시간 예산을 넘기면 멈춘다.
+        """
+        scroll_budget = int(budget_ms * settings.CAPTURE_SCROLL_BUDGET_RATIO)
+        return await asyncio.wait_for(page.evaluate("""async ({ budgetMs, stepWaitMs, growthWaitMs, maxHeight }) => {
+            const start = performance.now();
+            const remaining = () => budgetMs - (performance.now() - start);
+            const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, Math.max(0, ms)));
+            const frame = () => new Promise((resolve) => requestAnimationFrame(() => resolve()));
+            const docHeight = () => Math.max(
+                document.documentElement.scrollHeight, document.body ? document.body.scrollHeight : 0
+            );
+
+            // 화면(과 바로 아래)에 들어왔지만 아직 로드되지 않은 이미지
+            const visible = new Set();
+            const observer = new IntersectionObserver((entries) => {
+                for (const entry of entries) {
+                    if (entry.isIntersecting && !entry.target.complete) visible.add(entry.target);
+                }
+            }, { rootMargin: '0px 0px 50% 0px' });
+            const observed = new WeakSet();
+            const observeImages = () => {
+                for (const img of document.images) {
+                    if (!observed.has(img)) {
+                        observed.add(img);
+                        observer.observe(img);
+                    }
+                }
+            };
+            const waitVisibleImages = (timeout) => {
+                const waiting = Array.from(visible).filter((img) => !img.complete);
+                visible.clear();
+                if (!waiting.length) return Promise.resolve();
+                return Promise.race([
+                    Promise.all(waiting.map((img) => new Promise((resolve) => {
+                        img.addEventListener('load', resolve, { once: true });
+                        img.addEventListener('error', resolve, { once: true });
+                    }))),
+                    sleep(timeout),
+                ]);
+            };
+            // 바닥에서 무한 스크롤 로더가 내용을 붙이는지 잠시 관찰
+            const waitForGrowth = async (height, timeout) => {
+                const until = performance.now() + timeout;
+                while (performance.now() < until) {
+                    await sleep(50);
+                    if (docHeight() > height) return true;
+                }
+                return false;
+            };
+
+            let steps = 0;
+            let reason = 'bottom';
+            while (true) {
+                if (remaining() <= 0) { reason = 'budget'; break; }
+                observeImages();
+                window.scrollBy(0, Math.max(window.innerHeight, 1));
+                steps++;
+                // IntersectionObserver 콜백이 실행되도록 두 프레임 대기
+                await frame();
+                await frame();
+                await waitVisibleImages(Math.min(stepWaitMs, remaining()));
+
+                const height = docHeight();
+                if (height >= maxHeight) { reason = 'maxHeight'; break; }
+                if (window.scrollY + window.innerHeight >= height - 1) {
+                    observeImages();
+                    await waitVisibleImages(Math.min(stepWaitMs, remaining()));
+                    if (!(await waitForGrowth(height, Math.min(growthWaitMs, remaining())))) break;
+                }
+            }
+
+            observer.disconnect();
+            window.scrollTo(0, 0);  // 맨 위로 스크롤 복귀
+            return { scrollSteps: steps, scrollStopReason: reason, pageHeight: docHeight() };
+        }""", {
+            "budgetMs": scroll_budget,
+            "stepWaitMs": settings.CAPTURE_SCROLL_STEP_WAIT_MS,
+            "growthWaitMs": settings.CAPTURE_SCROLL_GROWTH_WAIT_MS,
+            "maxHeight": settings.CAPTURE_MAX_PAGE_HEIGHT,
+        }), timeout=scroll_budget / 1000 + 5)
+
+    async def _wait_for_settle(self, page, budget_ms: int) -> Dict[str, Any]:
+        """렌더링이 안정될 때까지 대기 (고정 sleep 대신)
+
+        웹폰트(document.fonts.ready), 남은 이미지 로딩, 레이아웃 안정
+        (layout-shift 와 scrollHeight 변화가 CAPTURE_LAYOUT_STABLE_MS 동안 없음)을
+        순서대로 확인하며, 전체가 budget_ms 를 넘지 않는다.
+        """
+        return await asyncio.wait_for(page.evaluate("""async ({ budgetMs, stableMs }) => {
+            const start = performance.now();
+            const remaining = () => budgetMs - (performance.now() - start);
+            const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, Math.max(0, ms)));
+            const frame = () => new Promise((resolve) => requestAnimationFrame(() => resolve()));
+            const docHeight = () => Math.max(
+                document.documentElement.scrollHeight, document.body ? document.body.scrollHeight : 0
+            );
+
+            // 1. 웹폰트
+            if (document.fonts) await Promise.race([document.fonts.ready, sleep(remaining())]);
+            const fontsLoaded = !document.fonts || document.fonts.status === 'loaded';
+
+            // 2. 아직 로드 중인 이미지
+            const pending = Array.from(document.images).filter((img) => !img.complete);
+            if (pending.length) {
+                await Promise.race([
+                    Promise.all(pending.map((img) => new Promise((resolve) => {
+                        img.addEventListener('load', resolve, { once: true });
+                        img.addEventListener('error', resolve, { once: true });
+                    }))),
+                    sleep(remaining()),
+                ]);
+            }
+            const pendingImages = Array.from(document.images).filter((img) => !img.complete).length;
+
+            // 3. 레이아웃 안정
+            let lastChange = performance.now();
+            let observer = null;
+            try {
+                observer = new PerformanceObserver((list) => {
+                    if (list.getEntries().length) lastChange = performance.now();
+                });
+                observer.observe({ type: 'layout-shift' });
+            } catch (e) {
+                observer = null;
+            }
+            let lastHeight = docHeight();
+            let layoutStable = false;
+            while (remaining() > 0) {
+                await frame();
+                const height = docHeight();
+                if (height !== lastHeight) {
+                    lastHeight = height;
+                    lastChange = performance.now();
+                }
+                if (performance.now() - lastChange >= stableMs) {
+                    layoutStable = true;
+                    break;
+                }
+            }
+            if (observer) observer.disconnect();
+
+            return { fontsLoaded, pendingImages, layoutStable, settleTimedOut: remaining() <= 0 };
+        }""", {
+            "budgetMs": budget_ms,
+            "stableMs": settings.CAPTURE_LAYOUT_STABLE_MS,
+        }), timeout=budget_ms / 1000 + 5)
+
+    async def _create_thumbnail(
+        self, source_path: Path, screenshot_path: Path, thumbnail_path: Path, options: ImageOptions
+    ) -> Dict:
+        """스크린샷 형식 변환 및 썸네일 생성
+
+        디코딩과 인코딩은 CPU 작업이므로 이벤트 루프가 아닌 이미지 프로세스 풀에서 실행한다.
+        """
+        return await image_pool.run(
+            process_screenshot_file, str(source_path), str(screenshot_path), str(thumbnail_path), options
+        )
 
 
 async def capture_website(
@@ -220,16 +701,63 @@ async def capture_website(
     height: int = 1080,
     capture_full_page: bool = True,
     capture_dynamic_elements: bool = True,
-    version: int = 1
+    version: int = 1,
+    image_format: Optional[str] = None,
+    image_quality: Optional[int] = None,
+    request_policy: Optional[Dict] = None,
+    load_strategy: Optional[str] = None,
+    wait_for_selector: Optional[str] = None
 ) -> Dict:
-    """웹사이트 캡처 실행 헬퍼 함수"""
-    async with CaptureTool() as capture_tool:
-        return await capture_tool.capture_website(
-            url=url,
-            device_type=device_type,
-            width=width,
-            height=height,
-            capture_full_page=capture_full_page,
-            capture_dynamic_elements=capture_dynamic_elements,
-            version=version
-        )
\ No newline at end of file
+    """웹사이트 캡처 실행 헬퍼 함수
+
+    앱 수명 주기에서 공유 브라우저 풀이 시작되어 있으면 풀의 브라우저를
+    재사용하고, 그렇지 않으면 (스크립트 등) 브라우저를 직접 실행한다.
+    동시 실행 수는 CAPTURE_MAX_CONCURRENCY 로 제한된다.
+    """
+    pool = browser_pool if browser_pool.started else None
+    async with _capture_semaphore:
+        async with CaptureTool(pool=pool) as capture_tool:
+            return await capture_tool.capture_website(
+                url=url,
+                device_type=device_type,
+                width=width,
+                height=height,
+                capture_full_page=capture_full_page,
+                capture_dynamic_elements=capture_dynamic_elements,
+                version=version,
+                image_format=image_format,
+                image_quality=image_quality,
+                request_policy=request_policy,
+                load_strategy=load_strategy,
+                wait_for_selector=wait_for_selector
+            )
+
+
+async def capture_website_viewports(
+    url: str,
+    devices: List[Dict],
+    capture_full_page: bool = True,
+    capture_dynamic_elements: bool = True,
+    version: int = 1,
+    image_format: Optional[str] = None,
+    image_quality: Optional[int] = None,
+    request_policy: Optional[Dict] = None,
+    load_strategy: Optional[str] = None,
+    wait_for_selector: Optional[str] = None
+) -> List[Dict]:
+    """한 번 렌더링한 페이지로 여러 디바이스를 캡처하는 헬퍼 함수"""
+    pool = browser_pool if browser_pool.started else None
+    async with _capture_semaphore:
+        async with CaptureTool(pool=pool) as capture_tool:
+            return await capture_tool.capture_viewports(
+                url=url,
+                devices=devices,
+                capture_full_page=capture_full_page,
+                capture_dynamic_elements=capture_dynamic_elements,
+                version=version,
+                image_format=image_format,
+                image_quality=image_quality,
+                request_policy=request_policy,
+                load_strategy=load_strategy,
+                wait_for_selector=wait_for_selector
+            )
\ No newline at end of file
@@ -0,0 +1,85 @@
+import re
+from typing import Iterable, List, Optional
+from urllib.parse import urlparse
+
+from app.core.config import settings
+from app.utils.url import canonicalize_url, extract_domain
+
+
+class CrawlScope:
+    """크롤링 범위 판단 (도메인 제한, 포함/제외 패턴)"""
+
+    def __init__(
+        self,
+        root_url: str,
+        same_domain: bool = True,
+        include_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+    ):
+        """크롤링 범위 초기화
+
+        Args:
+            root_url: 크롤링 시작 URL
+            same_domain: 시작 URL과 같은 도메인만 허용할지 여부
+            include_patterns: URL이 하나 이상 일치해야 하는 정규식 목록 (비어 있으면 모두 허용)
+            exclude_patterns: URL이 하나라도 일치하면 제외할 정규식 목록
+        """
+        self.root_domain = extract_domain(root_url)
+        self.same_domain = same_domain
+        self.include = [re.compile(p) for p in include_patterns or []]
+        self.exclude = [re.compile(p) for p in exclude_patterns or []]
+
+    def accepts(self, url: str) -> bool:
+        """URL이 크롤링 범위에 포함되는지 여부"""
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or not parsed.netloc:
+            return False
+        if self.same_domain and extract_domain(url) != self.root_domain:
+            return False
+        if self.include and not any(p.search(url) for p in self.include):
+            return False
+        if any(p.search(url) for p in self.exclude):
+            return False
+        return True
+
+    def filter_links(self, links: Iterable[str]) -> List[str]:
+        """수집된 링크에서 범위 안의 URL만 정규화하여 순서대로 반환 (페이지 내 중복 제거)"""
+        result = []
+        seen = set()
+        for link in links:
+            try:
+                url = crawl_key(link)
+            except ValueError:
+                # 잘못된 형식의 링크 하나 때문에 크롤링 전체가 실패하지 않도록 건너뜀
+                continue
+            if url in seen or not self.accepts(url):
+                continue
+            seen.add(url)
+            result.append(url)
+        return result
+
+
+def crawl_key(url: str) -> str:
+    """크롤링 중복 판단용 URL 키 (정규화 + 추적 파라미터 제거)"""
+    return canonicalize_url(url, settings.CRAWL_TRACKING_PARAMS)
+
+
+def link_keys(links: Iterable[str], limit: Optional[int] = None) -> List[str]:
+    """링크 그래프에 저장할 http(s) 링크를 정규화하여 순서대로 반환 (중복 제거, 최대 limit 개)"""
+    result = []
+    seen = set()
+    for link in links:
+        try:
+            if urlparse(link).scheme not in ("http", "https"):
+                continue
+            url = crawl_key(link)
+        except ValueError:
+            # 잘못된 형식 (예: 닫히지 않은 IPv6 대괄호)
+            continue
+        if url in seen or len(url) > settings.LINK_MAX_URL_LENGTH:
+            continue
+        seen.add(url)
+        result.append(url)
+        if limit is not None and len(result) >= limit:
+            break
+    return result
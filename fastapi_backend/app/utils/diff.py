@@ -0,0 +1,254 @@
+import asyncio
+import hashlib
+import math
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from app.core.config import settings
+from app.utils.image import FORMAT_EXTENSIONS, ImageFormat, choose_format, file_digest, image_pool, save_image
+
+# 픽셀 비교를 나눠 처리할 행 수 (메모리 사용량 제한)
+_ROW_CHUNK = 512
+# 바뀐 영역 표시 색과 불투명도
+_HIGHLIGHT = np.array([255, 0, 0], dtype=np.float32)
+_HIGHLIGHT_ALPHA = 0.4
+
+
+@dataclass(frozen=True)
+class DiffOptions:
+    """스크린샷 비교 옵션 (프로세스 풀로 넘기므로 pickle 가능해야 함)"""
+    block_size: int = 16
+    pixel_threshold: int = 24
+    max_regions: int = 50
+    overlay_format: ImageFormat = ImageFormat.WEBP
+    overlay_quality: int = 75
+
+    @classmethod
+    def resolve(cls, block_size: Optional[int] = None, pixel_threshold: Optional[int] = None) -> "DiffOptions":
+        """요청별 설정이 없으면 배포 설정(DIFF_*) 사용"""
+        return cls(
+            block_size=block_size or settings.DIFF_BLOCK_SIZE,
+            pixel_threshold=settings.DIFF_PIXEL_THRESHOLD if pixel_threshold is None else pixel_threshold,
+            max_regions=settings.DIFF_MAX_REGIONS,
+            overlay_format=ImageFormat(settings.DIFF_OVERLAY_FORMAT),
+            overlay_quality=settings.DIFF_OVERLAY_QUALITY,
+        )
+
+    @property
+    def key(self) -> str:
+        """결과에 영향을 주는 옵션 식별자"""
+        return f"b{self.block_size}t{self.pixel_threshold}"
+
+
+def overlay_path_for(before_hash: str, after_hash: str, options: DiffOptions) -> Path:
+    """비교 결과 이미지 저장 경로 (확장자는 저장할 때 결정). 같은 내용 쌍은 같은 경로"""
+    name = f"{before_hash[:16]}_{after_hash[:16]}_{options.key}"
+    return Path(settings.DIFF_DIR) / after_hash[:2] / name
+
+
+def _row_signatures(pixels: np.ndarray) -> List[bytes]:
+    """행 정렬에 사용할 행별 내용 해시"""
+    return [hashlib.blake2b(row.tobytes(), digest_size=8).digest() for row in pixels]
+
+
+def align_rows(before_rows: List[bytes], after_rows: List[bytes]) -> Tuple[np.ndarray, np.ndarray, int]:
+    """after 의 각 행에 대응하는 before 행 찾기
+
+    페이지 중간에 내용이 추가/삭제되면 아래쪽 행이 모두 밀리므로, 행 해시를
+    텍스트 diff 처럼 정렬해 밀린 행은 같은 행끼리 비교한다.
+
+    Returns:
+        (after 행별 before 행 번호 - 새로 생긴 행은 -1,
+         내용이 그대로인 것으로 확인된 행 여부, 삭제된 before 행 수)
+    """
+    mapping = np.full(len(after_rows), -1, dtype=np.int64)
+    identical = np.zeros(len(after_rows), dtype=bool)
+    removed = 0
+    matcher = SequenceMatcher(None, before_rows, after_rows, autojunk=True)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            mapping[j1:j2] = np.arange(i1, i2)
+            identical[j1:j2] = True
+        elif tag == "replace":
+            # 같은 위치의 바뀐 구간은 위에서부터 짝지어 픽셀 비교
+            count = min(i2 - i1, j2 - j1)
+            mapping[j1:j1 + count] = np.arange(i1, i1 + count)
+            removed += (i2 - i1) - count
+        elif tag == "delete":
+            removed += i2 - i1
+    return mapping, identical, removed
+
+
+def _changed_mask(before: np.ndarray, after: np.ndarray, options: DiffOptions) -> Tuple[np.ndarray, int, int]:
+    """after 기준 바뀐 픽셀 마스크, 새로 생긴 after 행 수, 삭제된 before 행 수"""
+    after_height, after_width = after.shape[:2]
+    width = min(before.shape[1], after_width)
+    # 너비가 달라도 밀린 행을 찾을 수 있도록 겹치는 열만으로 행을 비교
+    mapping, identical, removed = align_rows(_row_signatures(before[:, :width]), _row_signatures(after[:, :width]))
+
+    mask = np.zeros((after_height, after_width), dtype=bool)
+    # 새로 생긴 행과 이전보다 넓어진 열은 모두 바뀐 것으로 처리
+    inserted = mapping < 0
+    mask[inserted] = True
+    mask[:, width:] = True
+
+    rows = np.flatnonzero((mapping >= 0) & ~identical)
+    for start in range(0, len(rows), _ROW_CHUNK):
+        index = rows[start:start + _ROW_CHUNK]
+        a = after[index, :width].astype(np.int16)
+        b = before[mapping[index], :width].astype(np.int16)
+        mask[index, :width] = np.abs(a - b).max(axis=2) > options.pixel_threshold
+    return mask, int(np.count_nonzero(inserted)), removed
+
+
+def _changed_blocks(mask: np.ndarray, block_size: int) -> np.ndarray:
+    """block_size 정사각형 블록별로 바뀐 픽셀이 있는지 여부"""
+    height, width = mask.shape
+    grid_height, grid_width = math.ceil(height / block_size), math.ceil(width / block_size)
+    padded = np.zeros((grid_height * block_size, grid_width * block_size), dtype=bool)
+    padded[:height, :width] = mask
+    return padded.reshape(grid_height, block_size, grid_width, block_size).any(axis=(1, 3))
+
+
+def _regions(blocks: np.ndarray, options: DiffOptions, width: int, height: int) -> List[Dict[str, int]]:
+    """바뀐 블록을 8방향으로 이어진 영역으로 묶은 경계 상자 (넓은 영역부터 max_regions 개)"""
+    remaining = set(map(tuple, np.argwhere(blocks).tolist()))
+    size = options.block_size
+    regions = []
+    while remaining:
+        start = remaining.pop()
+        stack = [start]
+        top = bottom = start[0]
+        left = right = start[1]
+        count = 0
+        while stack:
+            row, col = stack.pop()
+            count += 1
+            top, bottom = min(top, row), max(bottom, row)
+            left, right = min(left, col), max(right, col)
+            for neighbor in (
+                (row - 1, col - 1), (row - 1, col), (row - 1, col + 1),
+                (row, col - 1), (row, col + 1),
+                (row + 1, col - 1), (row + 1, col), (row + 1, col + 1),
+            ):
+                if neighbor in remaining:
+                    remaining.remove(neighbor)
+                    stack.append(neighbor)
+        x, y = left * size, top * size
+        regions.append({
+            "x": x,
+            "y": y,
+            "width": min(width, (right + 1) * size) - x,
+            "height": min(height, (bottom + 1) * size) - y,
+            "blocks": count,
+        })
+    regions.sort(key=lambda region: region["width"] * region["height"], reverse=True)
+    return regions[:options.max_regions]
+
+
+def _write_overlay(
+    after: np.ndarray, blocks: np.ndarray, regions: List[Dict[str, int]], path: Path, options: DiffOptions
+) -> Tuple[Path, ImageFormat]:
+    """after 이미지에 바뀐 블록을 반투명하게 칠하고 영역 경계 상자를 그려 저장"""
+    height, width = after.shape[:2]
+    size = options.block_size
+    highlight = np.repeat(np.repeat(blocks, size, axis=0), size, axis=1)[:height, :width]
+
+    overlay = after.copy()
+    overlay[highlight] = (
+        overlay[highlight] * (1 - _HIGHLIGHT_ALPHA) + _HIGHLIGHT * _HIGHLIGHT_ALPHA
+    ).astype(np.uint8)
+
+    image = Image.fromarray(overlay)
+    draw = ImageDraw.Draw(image)
+    for region in regions:
+        draw.rectangle(
+            (region["x"], region["y"], region["x"] + region["width"] - 1, region["y"] + region["height"] - 1),
+            outline=(255, 0, 0),
+            width=2,
+        )
+
+    fmt = choose_format(options.overlay_format, width, height)
+    path = path.with_suffix(FORMAT_EXTENSIONS[fmt])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.stem}.tmp{path.suffix}")
+    save_image(image, tmp_path, fmt, options.overlay_quality)
+    tmp_path.replace(path)
+    return path, fmt
+
+
+def diff_images(
+    before_path: Union[str, Path],
+    after_path: Union[str, Path],
+    overlay_path: Union[str, Path],
+    options: DiffOptions,
+) -> Dict[str, Any]:
+    """두 스크린샷을 블록 단위로 비교 (프로세스 풀에서 실행)
+
+    높이가 다르면 행 정렬로 추가/삭제된 구간을 찾아 나머지 행끼리 비교한다.
+    채널 차이가 pixel_threshold 이하인 픽셀은 (압축 잡음 등) 같은 것으로 본다.
+    변경률은 after 의 바뀐 픽셀과 삭제된 before 행을 합쳐 계산한다.
+
+    Returns:
+        width, height(after 기준), before_width, before_height, changed_pixels,
+        changed_ratio, changed_blocks, total_blocks, inserted_rows, removed_rows,
+        regions(x, y, width, height, blocks), overlay_path, overlay_format, overlay_hash
+    """
+    with Image.open(before_path) as image:
+        before = np.asarray(image.convert("RGB"))
+    with Image.open(after_path) as image:
+        after = np.asarray(image.convert("RGB"))
+
+    height, width = after.shape[:2]
+    mask, inserted, removed = _changed_mask(before, after, options)
+    blocks = _changed_blocks(mask, options.block_size)
+    regions = _regions(blocks, options, width, height)
+    path, fmt = _write_overlay(after, blocks, regions, Path(overlay_path), options)
+
+    changed_pixels = int(mask.sum()) + removed * before.shape[1]
+    total_pixels = height * width + removed * before.shape[1]
+    return {
+        "width": width,
+        "height": height,
+        "before_width": before.shape[1],
+        "before_height": before.shape[0],
+        "changed_pixels": changed_pixels,
+        "changed_ratio": changed_pixels / total_pixels if total_pixels else 0.0,
+        "changed_blocks": int(blocks.sum()),
+        "total_blocks": int(blocks.size),
+        "inserted_rows": inserted,
+        "removed_rows": removed,
+        "regions": regions,
+        "overlay_path": str(path),
+        "overlay_format": fmt.value,
+        "overlay_hash": file_digest(path),
+    }
+
+
+class DiffRunner:
+    """스크린샷 비교를 이미지 프로세스 풀에서 실행 (같은 쌍의 동시 요청은 한 번만 계산)"""
+
+    def __init__(self):
+        self._flights: Dict[str, asyncio.Future] = {}
+
+    async def run(
+        self, before_path: str, after_path: str, overlay_path: Path, options: DiffOptions
+    ) -> Dict[str, Any]:
+        key = str(overlay_path)
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(
+                image_pool.run(diff_images, before_path, after_path, overlay_path, options)
+            )
+            self._flights[key] = flight
+            flight.add_done_callback(lambda _: self._flights.pop(key, None))
+        # 요청이 취소되어도 같은 비교를 기다리는 다른 요청을 위해 계산은 계속
+        return await asyncio.shield(flight)
+
+
+diff_runner = DiffRunner()
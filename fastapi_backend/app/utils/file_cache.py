@@ -0,0 +1,61 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class ScreenshotFiles:
+    """스크린샷 파일 서빙에 필요한 메타데이터 (DB 조회 없이 응답하기 위해 캐시)"""
+    path: str
+    format: Optional[str]
+    content_hash: Optional[str]
+    thumbnail_path: str
+    thumbnail_hash: Optional[str]
+    tiles_path: Optional[str]
+
+
+class ScreenshotFileCache:
+    """스크린샷 ID별 파일 메타데이터 LRU 캐시 (TTL 만료 시 다시 조회)
+
+    스크린샷 파일은 생성 후 바뀌지 않으므로 짧은 TTL 로도 자주 조회되는
+    이미지는 거의 DB를 거치지 않는다.
+    """
+
+    def __init__(self, ttl_seconds: int = 300, max_entries: int = 10000):
+        """캐시 초기화
+
+        Args:
+            ttl_seconds: 항목 유지 시간 (초)
+            max_entries: 최대 항목 수 (초과 시 가장 오래 안 쓴 항목 제거)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, Tuple[float, ScreenshotFiles]]" = OrderedDict()
+
+    def get(self, screenshot_id: int) -> Optional[ScreenshotFiles]:
+        entry = self._entries.get(screenshot_id)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[screenshot_id]
+            return None
+        self._entries.move_to_end(screenshot_id)
+        return entry[1]
+
+    def set(self, screenshot_id: int, files: ScreenshotFiles) -> None:
+        self._entries[screenshot_id] = (time.monotonic() + self.ttl_seconds, files)
+        self._entries.move_to_end(screenshot_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, screenshot_id: int) -> None:
+        self._entries.pop(screenshot_id, None)
+
+
+screenshot_files = ScreenshotFileCache(
+    ttl_seconds=settings.SCREENSHOT_META_CACHE_TTL_SECONDS,
+    max_entries=settings.SCREENSHOT_META_CACHE_SIZE,
+)
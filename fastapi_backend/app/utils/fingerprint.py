@@ -0,0 +1,163 @@
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+from app.core.config import settings
+from app.utils.capture import DEFAULT_USER_AGENT
+
+logger = logging.getLogger(__name__)
+
+# 내용을 해시에 넣지 않는 태그 (스크립트의 nonce/추적 값 등은 요청마다 바뀜)
+_SKIP_TAGS = {"script", "noscript", "template"}
+
+
+class _DomNormalizer(HTMLParser):
+    """HTML 을 태그 구조 + 선택한 속성 + 공백을 정리한 텍스트로 바꿔 해시"""
+
+    def __init__(self, attributes: Iterable[str]):
+        super().__init__(convert_charrefs=True)
+        self.attributes = set(attributes)
+        self.digest = hashlib.sha256()
+        self._skip_depth = 0
+
+    def _update(self, token: str) -> None:
+        self.digest.update(token.encode("utf-8"))
+        self.digest.update(b"\x00")
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+            return
+        if self._skip_depth:
+            return
+        values = dict(attrs)
+        if tag == "input" and (values.get("type") or "").lower() == "hidden":
+            # CSRF 토큰 등
+            return
+        parts = [tag] + [
+            f"{name}={' '.join((value or '').split())}"
+            for name, value in sorted(values.items())
+            if name in self.attributes
+        ]
+        self._update("<" + " ".join(parts) + ">")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+            return
+        if not self._skip_depth:
+            self._update(f"</{tag}>")
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        text = " ".join(data.split())
+        if text:
+            self._update(text)
+
+
+def dom_hash(html: str, attributes: Iterable[str] = settings.FINGERPRINT_ATTRIBUTES) -> str:
+    """정규화한 HTML 의 SHA-256 해시
+
+    주석, 스크립트, 숨은 입력, 지정하지 않은 속성, 공백 차이는 무시하므로
+    요청마다 바뀌는 값 때문에 내용이 같은 페이지가 다르게 판단되지 않는다.
+    """
+    normalizer = _DomNormalizer(attributes)
+    normalizer.feed(html)
+    normalizer.close()
+    return normalizer.digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class PageFingerprint:
+    """페이지 내용 지문"""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    dom_hash: Optional[str] = None
+    not_modified: bool = False  # 조건부 요청에 304 응답
+
+    def matches(self, previous_dom_hash: Optional[str]) -> bool:
+        """이전 버전과 내용이 같은지 여부"""
+        return self.not_modified or (self.dom_hash is not None and self.dom_hash == previous_dom_hash)
+
+    def as_values(self) -> Dict[str, Any]:
+        """Page 행에 기록할 값"""
+        return {"etag": self.etag, "last_modified": self.last_modified, "dom_hash": self.dom_hash}
+
+
+class PageFingerprinter:
+    """브라우저 없이 HTTP 요청으로 페이지 지문을 만드는 도구
+
+    이전 버전의 ETag/Last-Modified 가 있으면 조건부 요청을 보내 304 면 본문을
+    받지 않고, 그렇지 않으면 HTML 을 받아 정규화 해시를 계산한다. 서버가 보낸
+    HTML 기준이므로 스크립트가 나중에 불러오는 내용의 변경은 감지하지 못한다.
+    """
+
+    def __init__(self, user_agent: str, timeout: float = 10.0, max_bytes: int = 5 * 1024 * 1024):
+        """지문 도구 초기화
+
+        Args:
+            user_agent: 요청에 사용할 User-Agent
+            timeout: 요청 타임아웃 (초)
+            max_bytes: 해시할 최대 HTML 크기 (초과하면 지문 없음)
+        """
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+
+    async def fetch(
+        self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None
+    ) -> Optional[PageFingerprint]:
+        """URL의 지문 (HTML 이 아니거나 요청이 실패하면 None)"""
+        headers = {
+            "User-Agent": self.user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        }
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True, headers=headers) as client:
+                async with client.stream("GET", url) as response:
+                    new_etag = response.headers.get("etag")
+                    new_last_modified = response.headers.get("last-modified")
+                    if response.status_code == 304:
+                        return PageFingerprint(
+                            etag=new_etag or etag,
+                            last_modified=new_last_modified or last_modified,
+                            not_modified=True,
+                        )
+                    content_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
+                    if response.status_code != 200 or (content_type and "html" not in content_type):
+                        return None
+
+                    body = bytearray()
+                    async for chunk in response.aiter_bytes():
+                        body += chunk
+                        if len(body) > self.max_bytes:
+                            return None
+                    encoding = response.encoding or "utf-8"
+        except httpx.HTTPError as e:
+            logger.debug(f"지문 요청 실패 ({url}): {str(e)}")
+            return None
+
+        try:
+            html = body.decode(encoding, errors="replace")
+        except LookupError:
+            html = body.decode("utf-8", errors="replace")
+        digest = await asyncio.to_thread(dom_hash, html)
+        return PageFingerprint(etag=new_etag, last_modified=new_last_modified, dom_hash=digest)
+
+
+fingerprinter = PageFingerprinter(
+    user_agent=settings.PREFLIGHT_USER_AGENT or DEFAULT_USER_AGENT,
+    timeout=settings.FINGERPRINT_TIMEOUT_SECONDS,
+    max_bytes=settings.FINGERPRINT_MAX_BYTES,
+)
@@ -0,0 +1,209 @@
+import hashlib
+import json
+import logging
+import math
+import os
+import sqlite3
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+_BLOOM_HEADER = struct.Struct("<4sQQQ")  # magic, 비트 수, 해시 수, 추가된 항목 수
+_BLOOM_MAGIC = b"BLM1"
+
+
+def url_fingerprint(url: str) -> bytes:
+    """정규화된 URL의 16바이트 지문"""
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=16).digest()
+
+
+class BloomFilter:
+    """고정 크기 블룸 필터
+
+    오탐(false positive)은 있을 수 있지만 미탐은 없다. 항목 수 n, 오탐률 p에 대해
+    약 -n·ln(p)/ln(2)² 비트를 사용하므로 1천만 URL / 1% 기준 약 12MB 이다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """블룸 필터 초기화
+
+        Args:
+            capacity: 예상 최대 항목 수
+            error_rate: 목표 오탐률
+        """
+        capacity = max(1, capacity)
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, fingerprint: bytes) -> Iterable[int]:
+        # 더블 해싱: 지문의 두 64비트 값으로 k개의 위치 생성
+        h1, h2 = struct.unpack("<QQ", fingerprint[:16])
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, fingerprint: bytes) -> None:
+        for pos in self._positions(fingerprint):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, fingerprint: bytes) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(fingerprint))
+
+    def save(self, path: Path) -> None:
+        """파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_BLOOM_HEADER.pack(_BLOOM_MAGIC, self.num_bits, self.num_hashes, self.count))
+            f.write(self.bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["BloomFilter"]:
+        """저장된 필터 로드 (없거나 손상되었으면 None)"""
+        try:
+            with open(path, "rb") as f:
+                magic, num_bits, num_hashes, count = _BLOOM_HEADER.unpack(f.read(_BLOOM_HEADER.size))
+                bits = bytearray(f.read())
+        except (OSError, struct.error):
+            return None
+        if magic != _BLOOM_MAGIC or len(bits) != (num_bits + 7) // 8:
+            return None
+        bloom = cls.__new__(cls)
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.bits = bits
+        bloom.count = count
+        return bloom
+
+
+@dataclass
+class FrontierItem:
+    id: int
+    url: str
+    depth: int
+    data: Dict[str, Any]
+
+
+class URLFrontier:
+    """디스크 기반 크롤링 프론티어
+
+    - 대기열: SQLite 테이블에 FIFO 로 저장되어 메모리를 쓰지 않고, 워커가
+      재시작되어도 그대로 이어서 처리할 수 있다.
+    - 방문 집합: 메모리에는 블룸 필터만 두고, 블룸 필터가 "있을 수도 있음"이라고
+      답한 경우에만 SQLite 의 정확한 지문 테이블을 조회한다.
+
+    URL 은 호출하는 쪽에서 canonicalize_url 로 정규화해 넘겨야 한다.
+    변경은 commit()/checkpoint() 때 한 트랜잭션으로 기록되며, 동기 SQLite 호출이므로
+    이벤트 루프에서는 asyncio.to_thread 로 호출한다 (한 번에 한 스레드에서만 사용).
+    """
+
+    def __init__(self, path: Path, bloom_capacity: int = 1_000_000, bloom_error_rate: float = 0.01):
+        """프론티어 열기 (파일이 있으면 이어서 사용)
+
+        Args:
+            path: SQLite 파일 경로 (블룸 필터는 같은 이름의 .bloom 파일에 저장)
+            bloom_capacity: 블룸 필터 예상 최대 URL 수
+            bloom_error_rate: 블룸 필터 목표 오탐률
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.bloom_path = self.path.with_suffix(".bloom")
+
+        self.db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("CREATE TABLE IF NOT EXISTS seen (fp BLOB PRIMARY KEY) WITHOUT ROWID")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS queue ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, url TEXT NOT NULL, depth INTEGER NOT NULL, "
+            "data TEXT, taken INTEGER NOT NULL DEFAULT 0)"
+        )
+        # 이전 프로세스가 꺼내 간 채 끝내지 못한 항목은 다시 대기열로
+        self.db.execute("UPDATE queue SET taken = 0 WHERE taken = 1")
+        self.db.commit()
+
+        self.seen_count = self.db.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+        self.bloom = BloomFilter.load(self.bloom_path)
+        if self.bloom is None or self.bloom.count != self.seen_count:
+            self.bloom = BloomFilter(max(bloom_capacity, self.seen_count * 2), bloom_error_rate)
+            self._rebuild_bloom()
+
+    def _rebuild_bloom(self) -> None:
+        """정확한 방문 집합에서 블룸 필터 재구성"""
+        for (fp,) in self.db.execute("SELECT fp FROM seen"):
+            self.bloom.add(fp)
+        if self.seen_count:
+            logger.info(f"프론티어 블룸 필터 재구성: {self.seen_count}개")
+
+    def is_new(self, url: str) -> bool:
+        """아직 본 적 없는 URL인지 여부"""
+        fp = url_fingerprint(url)
+        if fp not in self.bloom:
+            return True
+        # 블룸 필터 양성은 오탐일 수 있으므로 정확한 집합으로 확인
+        return self.db.execute("SELECT 1 FROM seen WHERE fp = ?", (fp,)).fetchone() is None
+
+    def mark_seen(self, url: str) -> bool:
+        """URL을 방문 집합에 추가. 새로 추가되었으면 True"""
+        if not self.is_new(url):
+            return False
+        fp = url_fingerprint(url)
+        self.db.execute("INSERT OR IGNORE INTO seen (fp) VALUES (?)", (fp,))
+        self.bloom.add(fp)
+        self.seen_count += 1
+        return True
+
+    def push(self, url: str, depth: int, data: Optional[Dict[str, Any]] = None) -> bool:
+        """처음 보는 URL이면 대기열에 추가하고 True 반환"""
+        if not self.mark_seen(url):
+            return False
+        self.db.execute(
+            "INSERT INTO queue (url, depth, data) VALUES (?, ?, ?)",
+            (url, depth, json.dumps(data or {})),
+        )
+        return True
+
+    def pop(self) -> Optional[FrontierItem]:
+        """가장 먼저 들어온 항목 꺼내기 (done() 호출 전까지는 재시작 시 다시 나옴)"""
+        row = self.db.execute(
+            "SELECT id, url, depth, data FROM queue WHERE taken = 0 ORDER BY id LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+        self.db.execute("UPDATE queue SET taken = 1 WHERE id = ?", (row[0],))
+        return FrontierItem(id=row[0], url=row[1], depth=row[2], data=json.loads(row[3] or "{}"))
+
+    def done(self, item: FrontierItem) -> None:
+        """처리 완료된 항목 삭제"""
+        self.db.execute("DELETE FROM queue WHERE id = ?", (item.id,))
+
+    def __len__(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM queue").fetchone()[0]
+
+    def commit(self) -> None:
+        """지금까지의 변경(추가/꺼내기/완료)을 한 트랜잭션으로 기록"""
+        self.db.commit()
+
+    def checkpoint(self) -> None:
+        """변경을 기록하고 블룸 필터를 디스크에 저장"""
+        self.db.commit()
+        self.bloom.save(self.bloom_path)
+
+    def close(self) -> None:
+        """블룸 필터 저장 후 닫기"""
+        self.checkpoint()
+        self.db.close()
+
+    def destroy(self) -> None:
+        """프론티어 파일 삭제 (크롤링 완료 시)"""
+        self.db.close()
+        for path in (self.path, self.bloom_path, Path(f"{self.path}-wal"), Path(f"{self.path}-shm")):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,400 @@
+import asyncio
+import enum
+import functools
+import hashlib
+import logging
+import multiprocessing
+import os
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import numpy as np
+from PIL import Image, features
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_MAX_SIZE = 300
+
+# 인코더별 최대 가로/세로 픽셀 (초과 시 다른 형식으로 저장)
+WEBP_MAX_DIMENSION = 16383
+JPEG_MAX_DIMENSION = 65500
+
+
+class ImageFormat(str, enum.Enum):
+    PNG = "png"
+    JPEG = "jpeg"
+    WEBP = "webp"
+    AVIF = "avif"
+
+
+FORMAT_EXTENSIONS = {
+    ImageFormat.PNG: ".png",
+    ImageFormat.JPEG: ".jpg",
+    ImageFormat.WEBP: ".webp",
+    ImageFormat.AVIF: ".avif",
+}
+
+MEDIA_TYPES = {
+    ImageFormat.PNG: "image/png",
+    ImageFormat.JPEG: "image/jpeg",
+    ImageFormat.WEBP: "image/webp",
+    ImageFormat.AVIF: "image/avif",
+}
+
+
+def media_type_for(image_format: Optional[str] = None, path: Optional[str] = None) -> str:
+    """형식 이름(없으면 파일 확장자)에 맞는 MIME 타입"""
+    if image_format:
+        try:
+            return MEDIA_TYPES[ImageFormat(image_format)]
+        except ValueError:
+            pass
+    if path:
+        suffix = Path(path).suffix.lower()
+        for fmt, ext in FORMAT_EXTENSIONS.items():
+            if suffix == ext or (fmt == ImageFormat.JPEG and suffix == ".jpeg"):
+                return MEDIA_TYPES[fmt]
+    return MEDIA_TYPES[ImageFormat.PNG]
+
+
+@dataclass(frozen=True)
+class ImageOptions:
+    """스크린샷/썸네일 인코딩 옵션 (프로세스 풀로 넘기므로 pickle 가능해야 함)"""
+    format: ImageFormat = ImageFormat.PNG
+    quality: int = 80
+    thumbnail_format: ImageFormat = ImageFormat.WEBP
+    thumbnail_quality: int = 75
+
+    @classmethod
+    def resolve(cls, image_format: Optional[str] = None, quality: Optional[int] = None) -> "ImageOptions":
+        """캡처별 설정이 없으면 배포 설정(SCREENSHOT_*/THUMBNAIL_*) 사용"""
+        return cls(
+            format=ImageFormat(image_format or settings.SCREENSHOT_FORMAT),
+            quality=quality or settings.SCREENSHOT_QUALITY,
+            thumbnail_format=ImageFormat(settings.THUMBNAIL_FORMAT),
+            thumbnail_quality=settings.THUMBNAIL_QUALITY,
+        )
+
+
+def choose_format(requested: ImageFormat, width: int, height: int) -> ImageFormat:
+    """인코더 지원 여부와 이미지 크기를 고려해 실제로 저장할 형식 결정
+
+    AVIF 인코더가 없으면 WebP, WebP 한도를 넘는 긴 페이지는 JPEG, JPEG 한도도
+    넘으면 PNG 로 저장한다.
+    """
+    fmt = ImageFormat(requested)
+    if fmt == ImageFormat.AVIF and not features.check("avif"):
+        fmt = ImageFormat.WEBP
+    if fmt == ImageFormat.WEBP and (not features.check("webp") or max(width, height) > WEBP_MAX_DIMENSION):
+        fmt = ImageFormat.JPEG
+    if fmt == ImageFormat.JPEG and max(width, height) > JPEG_MAX_DIMENSION:
+        fmt = ImageFormat.PNG
+    return fmt
+
+
+def save_image(image: Image.Image, path: Path, fmt: ImageFormat, quality: int) -> None:
+    """형식별 인코딩 옵션으로 이미지 저장"""
+    if fmt == ImageFormat.PNG:
+        image.save(path, format="PNG", optimize=True)
+        return
+    if fmt == ImageFormat.JPEG:
+        # JPEG 는 알파 채널 미지원
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        image.save(path, format="JPEG", quality=quality, optimize=True, progressive=True)
+    elif fmt == ImageFormat.WEBP:
+        image.save(path, format="WEBP", quality=quality, method=4)
+    elif fmt == ImageFormat.AVIF:
+        image.save(path, format="AVIF", quality=quality, speed=6)
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """파일 내용의 SHA-256 (16진수). 큰 파일도 메모리에 다 올리지 않고 나눠 읽음"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _dct_matrix(size: int) -> np.ndarray:
+    """정규화된 DCT-II 변환 행렬"""
+    k = np.arange(size)[:, None]
+    i = np.arange(size)[None, :]
+    matrix = np.cos(np.pi * (2 * i + 1) * k / (2 * size)) * np.sqrt(2 / size)
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+
+_DCT_32 = _dct_matrix(32)
+
+
+def _bits_to_int64(bits: np.ndarray) -> int:
+    """64개 비트를 부호 있는 64비트 정수로 (DB BigInteger 에 그대로 저장)"""
+    return int.from_bytes(np.packbits(bits.astype(bool).flatten()).tobytes(), "big", signed=True)
+
+
+def hash_region_height(width: int, height: int) -> int:
+    """지각 해시를 계산할 첫 화면 영역 높이 (위쪽 정사각형)"""
+    return min(height, width)
+
+
+def perceptual_hashes(image: Image.Image) -> Dict[str, int]:
+    """첫 화면 영역의 dHash/pHash (각 64비트)
+
+    페이지 길이가 달라도 같은 템플릿이면 비슷한 값이 나오도록 전체가 아닌
+    위쪽 정사각형 영역만 사용한다. dHash 는 9x8 축소 이미지의 가로 밝기
+    기울기, pHash 는 32x32 축소 이미지 DCT 저주파 8x8 계수의 중앙값 비교이다.
+    """
+    width, height = image.size
+    region = image.crop((0, 0, width, hash_region_height(width, height))).convert("L")
+    factor = min(region.width // 64, region.height // 64)
+    if factor > 1:
+        region = region.reduce(factor)
+
+    small = np.asarray(region.resize((9, 8), Image.LANCZOS), dtype=np.int16)
+    dhash = small[:, 1:] > small[:, :-1]
+
+    pixels = np.asarray(region.resize((32, 32), Image.LANCZOS), dtype=np.float64)
+    low = (_DCT_32 @ pixels @ _DCT_32.T)[:8, :8].flatten()
+    # DC 계수(평균 밝기)는 중앙값 계산에서 제외
+    phash = low > np.median(low[1:])
+
+    return {"dhash": _bits_to_int64(dhash), "phash": _bits_to_int64(phash)}
+
+
+def _thumbnail_size(width: int, height: int, max_size: int) -> Tuple[int, int]:
+    """비율을 유지한 썸네일 크기 (긴 변이 max_size)"""
+    if width > height:
+        return max_size, max(1, int(height * (max_size / width)))
+    return max(1, int(width * (max_size / height))), max_size
+
+
+def _write_thumbnail(image: Image.Image, thumbnail_path: Path, options: ImageOptions) -> Tuple[Path, ImageFormat]:
+    """썸네일 저장. JPEG 등 draft 를 지원하는 형식은 디코딩 단계에서 축소하고, 그 외에는
+    reduce() 로 정수 배율 박스 축소를 먼저 한 뒤 작은 이미지에만 LANCZOS 를 적용한다.
+    draft 는 아직 디코딩하지 않은(load 전) 이미지에만 적용되고 image 를 바꾼다."""
+    new_width, new_height = _thumbnail_size(*image.size, THUMBNAIL_MAX_SIZE)
+
+    # 최종 크기의 2배까지만 미리 축소해 LANCZOS 품질은 유지
+    image.draft("RGB", (new_width * 2, new_height * 2))
+    factor = min(image.width // (new_width * 2), image.height // (new_height * 2))
+    reduced = image.reduce(factor) if factor > 1 else image
+    thumbnail = reduced.resize((new_width, new_height), Image.LANCZOS)
+
+    fmt = choose_format(options.thumbnail_format, new_width, new_height)
+    thumbnail_path = thumbnail_path.with_suffix(FORMAT_EXTENSIONS[fmt])
+    save_image(thumbnail, thumbnail_path, fmt, options.thumbnail_quality)
+    return thumbnail_path, fmt
+
+
+def process_screenshot_file(
+    source_path: Union[str, Path],
+    screenshot_path: Union[str, Path],
+    thumbnail_path: Union[str, Path],
+    options: ImageOptions,
+) -> Dict[str, Any]:
+    """브라우저가 저장한 스크린샷을 요청 형식으로 변환하고 썸네일 생성 (프로세스 풀에서 실행)
+
+    source_path 가 이미 최종 형식이면 변환 없이 썸네일만 만든다. 변환한 경우
+    source_path 는 삭제한다. 형식이 바뀌면 확장자도 바뀌므로 실제 경로를 반환한다.
+
+    Returns:
+        path, format, thumbnail_path, thumbnail_format, width, height,
+        content_hash, thumbnail_hash (파일 내용 SHA-256), dhash, phash (지각 해시)
+    """
+    source_path = Path(source_path)
+    with Image.open(source_path) as image:
+        width, height = image.size
+        fmt = choose_format(options.format, width, height)
+        target_path = Path(screenshot_path).with_suffix(FORMAT_EXTENSIONS[fmt])
+
+        if image.format == "JPEG":
+            # draft 로 축소 디코딩하면 원본 크기 이미지를 쓸 수 없으므로 썸네일용으로 따로 연다
+            with Image.open(source_path) as draft_source:
+                thumb_path, thumb_format = _write_thumbnail(draft_source, Path(thumbnail_path), options)
+            image.load()
+        else:
+            image.load()
+            thumb_path, thumb_format = _write_thumbnail(image, Path(thumbnail_path), options)
+
+        if target_path != source_path:
+            save_image(image, target_path, fmt, options.quality)
+        hashes = perceptual_hashes(image)
+
+    if target_path != source_path:
+        os.remove(source_path)
+
+    return {
+        "path": str(target_path),
+        "format": fmt.value,
+        "thumbnail_path": str(thumb_path),
+        "thumbnail_format": thumb_format.value,
+        "width": width,
+        "height": height,
+        "content_hash": file_digest(target_path),
+        "thumbnail_hash": file_digest(thumb_path),
+        **hashes,
+    }
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data))
+
+
+class StripImageWriter:
+    """세로 스트립을 위에서부터 받아 하나의 PNG 파일로 이어 붙이는 스트리밍 기록기
+
+    PNG 의 IDAT 는 행 단위 zlib 스트림이므로 스트립을 받는 즉시 압축해 파일에
+    쓰고, 썸네일도 스트립마다 축소해 작은 캔버스에 붙인다. 따라서 메모리는
+    전체 이미지 크기와 무관하게 스트립 하나 분량만 사용한다.
+    """
+
+    def __init__(self, path: Path, width: int, height: int, thumbnail_path: Path, options: ImageOptions):
+        """기록기 초기화 (최종 크기를 미리 알아야 PNG 헤더를 쓸 수 있음)
+
+        Args:
+            path: 이어 붙인 PNG 저장 경로
+            width: 이미지 너비
+            height: 이미지 전체 높이
+            thumbnail_path: 썸네일 저장 경로
+            options: 썸네일 인코딩 옵션
+        """
+        self.path = Path(path)
+        self.width = width
+        self.height = height
+        self.thumbnail_path = Path(thumbnail_path)
+        self.options = options
+        self.written = 0
+
+        self._compressor = zlib.compressobj(6)
+        self._file = open(self.path, "wb")
+        self._file.write(b"\x89PNG\r\n\x1a\n")
+        # 8비트 RGB, 압축/필터/인터레이스 기본값
+        self._file.write(_png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+
+        thumb_width, thumb_height = _thumbnail_size(width, height, THUMBNAIL_MAX_SIZE)
+        self._scale = thumb_height / height
+        self._thumbnail = Image.new("RGB", (thumb_width, thumb_height), "white")
+        # 지각 해시용 첫 화면 영역
+        self._head = Image.new("RGB", (width, hash_region_height(width, height)), "white")
+
+    def add_strip(self, png_bytes: bytes) -> None:
+        """다음 스트립 추가 (브라우저가 반환한 PNG 바이트)"""
+        with Image.open(BytesIO(png_bytes)) as strip:
+            strip = strip.convert("RGB")
+        if strip.width != self.width:
+            strip = strip.crop((0, 0, self.width, strip.height))
+        rows = min(strip.height, self.height - self.written)
+        if rows <= 0:
+            return
+
+        if self.written < self._head.height:
+            self._head.paste(strip.crop((0, 0, self.width, rows)), (0, self.written))
+
+        raw = strip.tobytes()
+        stride = self.width * 3
+        # 각 행 앞에 필터 타입(0: None) 바이트
+        data = b"".join(b"\x00" + raw[i * stride:(i + 1) * stride] for i in range(rows))
+        compressed = self._compressor.compress(data)
+        if compressed:
+            self._file.write(_png_chunk(b"IDAT", compressed))
+
+        # 썸네일 캔버스의 해당 위치에 축소본 붙이기
+        top = round(self.written * self._scale)
+        bottom = round((self.written + rows) * self._scale)
+        if bottom > top:
+            part = strip.crop((0, 0, self.width, rows))
+            factor = min(part.width // (self._thumbnail.width * 2), part.height // ((bottom - top) * 2))
+            if factor > 1:
+                part = part.reduce(factor)
+            self._thumbnail.paste(part.resize((self._thumbnail.width, bottom - top), Image.LANCZOS), (0, top))
+        self.written += rows
+
+    def close(self) -> Dict[str, Any]:
+        """PNG 마무리와 썸네일 저장
+
+        Returns:
+            process_screenshot_file 과 같은 형식의 결과
+        """
+        # 스트립이 모자라면 (페이지가 줄어든 경우) 남은 행을 흰색으로 채움
+        blank_row = b"\x00" + b"\xff" * (self.width * 3)
+        while self.written < self.height:
+            rows = min(256, self.height - self.written)
+            self._file.write(_png_chunk(b"IDAT", self._compressor.compress(blank_row * rows)))
+            self.written += rows
+        self._file.write(_png_chunk(b"IDAT", self._compressor.flush()))
+        self._file.write(_png_chunk(b"IEND", b""))
+        self._file.close()
+
+        fmt = choose_format(self.options.thumbnail_format, *self._thumbnail.size)
+        thumbnail_path = self.thumbnail_path.with_suffix(FORMAT_EXTENSIONS[fmt])
+        save_image(self._thumbnail, thumbnail_path, fmt, self.options.thumbnail_quality)
+        return {
+            "path": str(self.path),
+            "format": ImageFormat.PNG.value,
+            "thumbnail_path": str(thumbnail_path),
+            "thumbnail_format": fmt.value,
+            "width": self.width,
+            "height": self.height,
+            "content_hash": file_digest(self.path),
+            "thumbnail_hash": file_digest(thumbnail_path),
+            **perceptual_hashes(self._head),
+        }
+
+    def abort(self) -> None:
+        """기록 중단 및 미완성 파일 삭제"""
+        self._file.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class ImageProcessPool:
+    """이미지 후처리(디코딩/리사이즈/인코딩)를 실행하는 프로세스 풀
+
+    CPU 를 많이 쓰는 작업이 이벤트 루프를 막지 않도록 별도 프로세스에서 실행한다.
+    workers 가 0 이면 기본 스레드 풀에서 실행한다.
+    """
+
+    def __init__(self, workers: int = 2):
+        """프로세스 풀 초기화 (첫 사용 시 프로세스 시작)
+
+        Args:
+            workers: 프로세스 수 (0이면 스레드 풀 사용)
+        """
+        self.workers = max(0, workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.workers == 0:
+            return None
+        if self._executor is None:
+            # 브라우저/이벤트 루프 스레드가 있는 프로세스를 fork 하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"이미지 프로세스 풀 시작: {self.workers}개")
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """함수를 풀에서 실행하고 결과 반환 (func 와 인자는 pickle 가능해야 함)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), functools.partial(func, *args, **kwargs))
+
+    def close(self) -> None:
+        """프로세스 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+image_pool = ImageProcessPool(workers=settings.IMAGE_PROCESS_WORKERS)
@@ -0,0 +1,171 @@
+import enum
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.utils.url import extract_domain
+
+logger = logging.getLogger(__name__)
+
+
+class LoadStrategy(str, enum.Enum):
+    AUTO = "auto"  # 도메인별 기록을 보고 완전한 렌더링을 주는 가장 가벼운 전략 선택
+    DOMCONTENTLOADED = "domcontentloaded"
+    LOAD = "load"
+    NETWORKIDLE = "networkidle"  # load 후 네트워크 유휴를 CAPTURE_NETWORKIDLE_CAP_MS 까지만 대기
+
+
+# 확인 순서 (가장 확실한 전략부터 가벼운 전략으로)
+_PROBE_ORDER = (LoadStrategy.NETWORKIDLE, LoadStrategy.LOAD, LoadStrategy.DOMCONTENTLOADED)
+
+
+@dataclass(frozen=True)
+class LoadPlan:
+    """페이지 로드 방법"""
+    strategy: LoadStrategy
+    selector: Optional[str] = None  # 로드 후 화면에 나타날 때까지 기다릴 CSS 선택자
+    auto: bool = False  # 도메인 기록으로 자동 선택된 전략인지 여부
+
+    @property
+    def wait_until(self) -> str:
+        """page.goto 에 넘길 wait_until (networkidle 은 load 후 따로 제한 시간을 두고 대기)"""
+        return LoadStrategy.LOAD.value if self.strategy == LoadStrategy.NETWORKIDLE else self.strategy.value
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"strategy": self.strategy.value, "auto": self.auto, "selector": self.selector}
+
+
+class LoadProfileStore:
+    """도메인별 로드 전략 기록 (SQLite)
+
+    전략마다 렌더링이 완전했던 비율과 로드에 걸린 시간을 지수 이동 평균으로 기록한다.
+    자동 선택 시 networkidle 부터 표본을 모으고, 완전한 렌더링이 확인되면 한 단계씩
+    가벼운 전략(load, domcontentloaded)을 시험한다. 완전 비율이 기준 이상인 전략 중
+    평균 시간이 가장 짧은 것을 쓰며, 기록이 오래되면 처음부터 다시 시험한다.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        min_samples: int = 3,
+        min_complete_ratio: float = 0.9,
+        alpha: float = 0.3,
+        ttl_seconds: int = 7 * 86400,
+    ):
+        """기록 저장소 초기화 (첫 사용 시 파일 생성)
+
+        Args:
+            path: SQLite 파일 경로
+            min_samples: 전략을 판단하기 전에 모을 표본 수
+            min_complete_ratio: 전략을 쓸 수 있다고 판단할 완전 렌더링 비율
+            alpha: 이동 평균 가중치 (클수록 최근 결과 반영이 빠름)
+            ttl_seconds: 이보다 오래 갱신되지 않은 기록은 무시
+        """
+        self.path = Path(path)
+        self.min_samples = min_samples
+        self.min_complete_ratio = min_complete_ratio
+        self.alpha = alpha
+        self.ttl_seconds = ttl_seconds
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS load_profiles ("
+                "domain TEXT NOT NULL, strategy TEXT NOT NULL, samples INTEGER NOT NULL, "
+                "complete_ratio REAL NOT NULL, elapsed_ms REAL NOT NULL, updated_at REAL NOT NULL, "
+                "PRIMARY KEY (domain, strategy))"
+            )
+            self._db.commit()
+        return self._db
+
+    def profile(self, domain: str) -> Dict[str, Dict[str, Any]]:
+        """도메인의 전략별 기록 (만료된 기록 제외)"""
+        with self._lock:
+            rows = self.db.execute(
+                "SELECT strategy, samples, complete_ratio, elapsed_ms FROM load_profiles "
+                "WHERE domain = ? AND updated_at > ?",
+                (domain, time.time() - self.ttl_seconds),
+            ).fetchall()
+        return {
+            strategy: {"samples": samples, "completeRatio": ratio, "elapsedMs": elapsed}
+            for strategy, samples, ratio, elapsed in rows
+        }
+
+    def record(self, domain: str, strategy: LoadStrategy, elapsed_ms: float, complete: bool) -> None:
+        """로드 결과 기록"""
+        complete_value = 1.0 if complete else 0.0
+        with self._lock:
+            row = self.db.execute(
+                "SELECT samples, complete_ratio, elapsed_ms, updated_at FROM load_profiles "
+                "WHERE domain = ? AND strategy = ?",
+                (domain, strategy.value),
+            ).fetchone()
+            now = time.time()
+            if row is None or row[3] <= now - self.ttl_seconds:
+                samples, ratio, elapsed = 1, complete_value, float(elapsed_ms)
+            else:
+                samples = row[0] + 1
+                ratio = row[1] + self.alpha * (complete_value - row[1])
+                elapsed = row[2] + self.alpha * (elapsed_ms - row[2])
+            self.db.execute(
+                "INSERT OR REPLACE INTO load_profiles "
+                "(domain, strategy, samples, complete_ratio, elapsed_ms, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (domain, strategy.value, samples, ratio, elapsed, now),
+            )
+            self.db.commit()
+
+    def choose(self, domain: str) -> LoadStrategy:
+        """도메인에 쓸 가장 가벼운 전략 선택"""
+        profile = self.profile(domain)
+        for strategy in _PROBE_ORDER:
+            stats = profile.get(strategy.value)
+            if stats is None or stats["samples"] < self.min_samples:
+                # 아직 표본이 부족한 단계부터 시험
+                return strategy
+            if stats["completeRatio"] < self.min_complete_ratio:
+                # 이 단계에서 렌더링이 불완전하면 더 가벼운 전략은 시험하지 않음
+                break
+
+        sampled = {s: profile[s.value] for s in _PROBE_ORDER if s.value in profile}
+        qualified = [s for s, stats in sampled.items() if stats["completeRatio"] >= self.min_complete_ratio]
+        if qualified:
+            return min(qualified, key=lambda s: sampled[s]["elapsedMs"])
+        # 어떤 전략도 완전하지 않으면 가장 나은 전략
+        return max(sampled, key=lambda s: (sampled[s]["completeRatio"], -sampled[s]["elapsedMs"]))
+
+    def plan(self, url: str, strategy: Optional[str] = None, selector: Optional[str] = None) -> LoadPlan:
+        """캡처 설정(없으면 배포 설정)으로 로드 방법 결정"""
+        requested = LoadStrategy(strategy or settings.CAPTURE_LOAD_STRATEGY)
+        if requested != LoadStrategy.AUTO:
+            return LoadPlan(strategy=requested, selector=selector)
+        try:
+            chosen = self.choose(extract_domain(url))
+        except Exception as e:
+            logger.warning(f"로드 전략 기록 조회 오류 ({url}): {str(e)}")
+            chosen = LoadStrategy.NETWORKIDLE
+        return LoadPlan(strategy=chosen, selector=selector, auto=True)
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+load_profiles = LoadProfileStore(
+    Path(settings.LOAD_PROFILE_PATH),
+    min_samples=settings.LOAD_PROFILE_MIN_SAMPLES,
+    min_complete_ratio=settings.LOAD_PROFILE_MIN_COMPLETE_RATIO,
+    alpha=settings.LOAD_PROFILE_EWMA_ALPHA,
+    ttl_seconds=settings.LOAD_PROFILE_TTL_SECONDS,
+)
@@ -0,0 +1,234 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Optional, Tuple
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+import httpx
+
+from app.core.config import settings
+from app.utils.url import extract_domain
+
+logger = logging.getLogger(__name__)
+
+
+class RobotsCache:
+    """도메인별 robots.txt 캐시 (TTL 만료 시 다시 가져옴)"""
+
+    def __init__(
+        self,
+        user_agent: str,
+        ttl_seconds: int = 3600,
+        error_ttl_seconds: int = 300,
+        max_entries: int = 10000,
+        timeout: float = 10.0,
+    ):
+        """robots.txt 캐시 초기화
+
+        Args:
+            user_agent: robots.txt 규칙을 매칭할 User-Agent 토큰
+            ttl_seconds: 정상 응답 캐시 유지 시간 (초)
+            error_ttl_seconds: 네트워크 오류/5xx 응답 캐시 유지 시간 (초)
+            max_entries: 캐시할 최대 호스트 수 (초과 시 가장 오래 안 쓴 항목 제거)
+            timeout: robots.txt 요청 타임아웃 (초)
+        """
+        self.user_agent = user_agent
+        self.ttl_seconds = ttl_seconds
+        self.error_ttl_seconds = error_ttl_seconds
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._entries: "OrderedDict[str, Tuple[float, RobotFileParser]]" = OrderedDict()
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def get(self, url: str) -> RobotFileParser:
+        """URL이 속한 호스트의 robots.txt 파서 반환"""
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+
+        entry = self._entries.get(origin)
+        if entry and entry[0] > time.monotonic():
+            self._entries.move_to_end(origin)
+            return entry[1]
+
+        # 같은 호스트에 대한 동시 요청은 한 번만 가져오도록 잠금
+        lock = self._locks.setdefault(origin, asyncio.Lock())
+        async with lock:
+            entry = self._entries.get(origin)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+
+            parser, ttl = await self._fetch(origin)
+            self._entries[origin] = (time.monotonic() + ttl, parser)
+            self._entries.move_to_end(origin)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._locks.pop(evicted, None)
+            return parser
+
+    async def _fetch(self, origin: str) -> Tuple[RobotFileParser, int]:
+        """robots.txt 요청 및 파싱 (RFC 9309: 4xx 는 전체 허용)"""
+        parser = RobotFileParser(f"{origin}/robots.txt")
+        try:
+            async with httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers={"User-Agent": self.user_agent},
+            ) as client:
+                response = await client.get(f"{origin}/robots.txt")
+        except httpx.HTTPError as e:
+            logger.debug(f"robots.txt 요청 실패 ({origin}): {str(e)}")
+            parser.parse([])
+            return parser, self.error_ttl_seconds
+
+        if response.status_code >= 500:
+            parser.parse([])
+            return parser, self.error_ttl_seconds
+        if response.status_code >= 400:
+            parser.parse([])
+        else:
+            parser.parse(response.text.splitlines())
+        return parser, self.ttl_seconds
+
+    async def can_fetch(self, url: str) -> bool:
+        """robots.txt 가 URL 접근을 허용하는지 여부"""
+        parser = await self.get(url)
+        return parser.can_fetch(self.user_agent, url)
+
+    async def crawl_delay(self, url: str) -> Optional[float]:
+        """robots.txt 의 Crawl-delay (없으면 None)"""
+        parser = await self.get(url)
+        delay = parser.crawl_delay(self.user_agent)
+        return float(delay) if delay is not None else None
+
+
+@dataclass
+class _DomainState:
+    semaphore: asyncio.Semaphore
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    next_allowed: float = 0.0
+    active: int = 0  # 슬롯을 쓰고 있거나 기다리는 요청 수
+
+
+class PolitenessScheduler:
+    """도메인별 동시 요청 수와 최소 요청 간격을 지키는 스케줄러
+
+    extract_domain 기준으로 도메인마다 별도의 세마포어와 대기 시각을 두므로
+    한 도메인이 대기하는 동안에도 다른 도메인은 전체 처리량을 그대로 쓴다.
+    도메인 상태는 max_domains 개까지 최근 사용 순으로 기억하며, 넘치면 오래 안 쓴
+    도메인 중 쉬고 있는 것(요청 없음 + 대기 간격 지남)만 제거하므로 제거해도
+    동작은 달라지지 않는다.
+    """
+
+    def __init__(
+        self,
+        robots: RobotsCache,
+        max_per_domain: int = 2,
+        min_delay: float = 1.0,
+        max_crawl_delay: float = 30.0,
+        respect_robots: bool = True,
+        max_domains: int = 10000,
+    ):
+        """스케줄러 초기화
+
+        Args:
+            robots: robots.txt 캐시
+            max_per_domain: 도메인당 동시 요청 수
+            min_delay: 같은 도메인 요청 사이 최소 간격 (초)
+            max_crawl_delay: robots.txt Crawl-delay 상한 (초)
+            respect_robots: robots.txt (Disallow, Crawl-delay) 준수 여부
+            max_domains: 상태를 기억할 최대 도메인 수
+        """
+        self.robots = robots
+        self.max_per_domain = max(1, max_per_domain)
+        self.min_delay = min_delay
+        self.max_crawl_delay = max_crawl_delay
+        self.respect_robots = respect_robots
+        self.max_domains = max(1, max_domains)
+        self._domains: "OrderedDict[str, _DomainState]" = OrderedDict()
+
+    def _state(self, domain: str) -> _DomainState:
+        state = self._domains.get(domain)
+        if state is None:
+            state = _DomainState(semaphore=asyncio.Semaphore(self.max_per_domain))
+            self._domains[domain] = state
+            self._evict_idle(keep=domain)
+        else:
+            self._domains.move_to_end(domain)
+        return state
+
+    def _evict_idle(self, keep: str) -> None:
+        """도메인 수가 한도를 넘으면 오래 안 쓴 쉬고 있는 도메인 상태 제거 (keep 은 지금 쓰려는 도메인)"""
+        excess = len(self._domains) - self.max_domains
+        if excess <= 0:
+            return
+        now = asyncio.get_running_loop().time()
+        idle = []
+        for domain, state in self._domains.items():
+            if domain != keep and state.active == 0 and state.next_allowed <= now:
+                idle.append(domain)
+                if len(idle) == excess:
+                    break
+        # 모두 사용 중이면 잠시 한도를 넘겨 둠
+        for domain in idle:
+            del self._domains[domain]
+
+    async def allowed(self, url: str) -> bool:
+        """robots.txt 가 URL 접근을 허용하는지 여부 (준수하지 않도록 설정하면 항상 True)"""
+        if not self.respect_robots:
+            return True
+        try:
+            return await self.robots.can_fetch(url)
+        except Exception as e:
+            logger.warning(f"robots.txt 확인 오류 ({url}): {str(e)}")
+            return True
+
+    async def _delay_for(self, url: str) -> float:
+        if not self.respect_robots:
+            return self.min_delay
+        try:
+            crawl_delay = await self.robots.crawl_delay(url)
+        except Exception:
+            crawl_delay = None
+        if crawl_delay is None:
+            return self.min_delay
+        return max(self.min_delay, min(crawl_delay, self.max_crawl_delay))
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """URL의 도메인에 요청을 보낼 차례가 될 때까지 대기
+
+        블록 안에서 해당 도메인으로의 요청(페이지 로드)을 수행한다.
+        """
+        domain = extract_domain(url)
+        state = self._state(domain)
+        state.active += 1
+        try:
+            delay = await self._delay_for(url)
+            async with state.semaphore:
+                # 요청 시작 시각 사이의 간격 보장
+                async with state.lock:
+                    loop = asyncio.get_running_loop()
+                    wait = state.next_allowed - loop.time()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    state.next_allowed = loop.time() + delay
+                yield
+        finally:
+            state.active -= 1
+
+
+politeness = PolitenessScheduler(
+    robots=RobotsCache(
+        user_agent=settings.ROBOTS_USER_AGENT,
+        ttl_seconds=settings.ROBOTS_CACHE_TTL_SECONDS,
+    ),
+    max_per_domain=settings.DOMAIN_MAX_CONCURRENCY,
+    min_delay=settings.DOMAIN_MIN_DELAY_SECONDS,
+    max_crawl_delay=settings.ROBOTS_MAX_CRAWL_DELAY_SECONDS,
+    respect_robots=settings.CRAWL_RESPECT_ROBOTS,
+    max_domains=settings.DOMAIN_STATE_MAX_ENTRIES,
+)
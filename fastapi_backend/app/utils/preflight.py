@@ -0,0 +1,235 @@
+import asyncio
+import enum
+import logging
+import socket
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from app.core.config import settings
+from app.utils.capture import DEFAULT_USER_AGENT
+
+logger = logging.getLogger(__name__)
+
+# HTML 로 렌더링할 수 있는 Content-Type
+HTML_CONTENT_TYPES = {"text/html", "application/xhtml+xml"}
+# Content-Type 이 없거나 모호하면 본문 앞부분을 확인
+_AMBIGUOUS_CONTENT_TYPES = {"", "text/plain", "application/octet-stream"}
+_SNIFF_BYTES = 1024
+# 도메인이 존재하지 않는다고 확정된 DNS 조회 오류 (EAI_AGAIN 같은 일시적 실패는 제외)
+_DNS_NOT_FOUND_ERRNOS = {socket.EAI_NONAME, getattr(socket, "EAI_NODATA", socket.EAI_NONAME)}
+
+
+class PreflightKind(str, enum.Enum):
+    HTML = "html"  # 브라우저로 캡처
+    NON_HTML = "non_html"  # PDF, 이미지, 다운로드 파일 등
+    HTTP_ERROR = "http_error"  # PREFLIGHT_FAIL_STATUS_CODES 에 해당하는 응답
+    LOGIN_WALL = "login_wall"  # 로그인 페이지로 리다이렉트
+    DNS_NOT_FOUND = "dns_not_found"  # 도메인이 존재하지 않음 (NXDOMAIN)
+    SERVER_ERROR = "server_error"  # 그 밖의 5xx 응답 (일시적일 수 있음)
+    UNREACHABLE = "unreachable"  # 연결/TLS 오류, 타임아웃, 리다이렉트 과다
+
+
+# 브라우저로 시도해도 결과가 같다고 확정할 수 있는 결과
+# (타임아웃/TLS 오류/5xx 는 사전 확인 요청만의 문제이거나 일시적일 수 있어 브라우저로 시도)
+_SKIP_KINDS = {PreflightKind.NON_HTML, PreflightKind.HTTP_ERROR, PreflightKind.LOGIN_WALL, PreflightKind.DNS_NOT_FOUND}
+
+
+@dataclass(frozen=True)
+class PreflightResult:
+    """URL 사전 확인 결과"""
+    url: str
+    kind: PreflightKind
+    final_url: Optional[str] = None
+    status_code: Optional[int] = None
+    content_type: Optional[str] = None
+    redirects: int = 0
+    error: Optional[str] = None
+
+    @property
+    def renderable(self) -> bool:
+        return self.kind == PreflightKind.HTML
+
+    @property
+    def should_skip(self) -> bool:
+        """브라우저를 쓰지 않고 바로 실패/건너뛰어도 되는지"""
+        return self.kind in _SKIP_KINDS
+
+    @property
+    def reason(self) -> Optional[str]:
+        """렌더링하지 않는 이유 (렌더링 가능하면 None)"""
+        if self.kind == PreflightKind.HTML:
+            return None
+        if self.kind == PreflightKind.NON_HTML:
+            return f"HTML 문서가 아닙니다 ({self.content_type or '알 수 없는 형식'})"
+        if self.kind == PreflightKind.HTTP_ERROR:
+            return f"HTTP 오류 응답 ({self.status_code})"
+        if self.kind == PreflightKind.LOGIN_WALL:
+            return f"로그인 페이지로 리다이렉트됩니다 ({self.final_url})"
+        if self.kind == PreflightKind.DNS_NOT_FOUND:
+            return f"도메인을 찾을 수 없습니다 ({self.error})"
+        if self.kind == PreflightKind.SERVER_ERROR:
+            return f"서버 오류 응답 ({self.status_code})"
+        return f"URL에 접근할 수 없습니다 ({self.error})"
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "kind": self.kind.value,
+            "finalUrl": self.final_url,
+            "statusCode": self.status_code,
+            "contentType": self.content_type,
+            "redirects": self.redirects,
+            "reason": self.reason,
+        }
+
+
+def _dns_not_found(error: Optional[BaseException]) -> bool:
+    """예외 원인 중 도메인이 존재하지 않는다는 DNS 조회 오류가 있는지"""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, socket.gaierror):
+            return error.errno in _DNS_NOT_FOUND_ERRNOS
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def _looks_like_html(head: bytes) -> bool:
+    text = head.lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    return text.startswith((b"<!doctype html", b"<html", b"<head", b"<body")) or b"<html" in text
+
+
+class PreflightCache:
+    """브라우저에 할당하기 전 URL을 HTTP 요청으로 확인하는 캐시 (URL별 TTL)
+
+    리다이렉트를 따라간 최종 응답의 상태 코드와 Content-Type 을 확인하고,
+    헤더가 모호하면 본문 앞부분만 읽어 HTML 여부를 판단한다 (본문 전체는 받지 않음).
+    """
+
+    def __init__(
+        self,
+        user_agent: str,
+        ttl_seconds: int = 600,
+        error_ttl_seconds: int = 60,
+        max_entries: int = 10000,
+        timeout: float = 10.0,
+        max_redirects: int = 10,
+    ):
+        """사전 확인 캐시 초기화
+
+        Args:
+            user_agent: 요청에 사용할 User-Agent (브라우저와 같은 값이어야 봇 차단 오판이 적음)
+            ttl_seconds: 결과 캐시 유지 시간 (초)
+            error_ttl_seconds: 접근 불가/5xx 결과 캐시 유지 시간 (초)
+            max_entries: 캐시할 최대 URL 수 (초과 시 가장 오래 안 쓴 항목 제거)
+            timeout: 요청 타임아웃 (초)
+            max_redirects: 따라갈 최대 리다이렉트 수
+        """
+        self.user_agent = user_agent
+        self.ttl_seconds = ttl_seconds
+        self.error_ttl_seconds = error_ttl_seconds
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self._entries: "OrderedDict[str, Tuple[float, PreflightResult]]" = OrderedDict()
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def check(self, url: str) -> PreflightResult:
+        """URL 확인 결과 반환 (캐시에 없으면 요청)"""
+        entry = self._entries.get(url)
+        if entry and entry[0] > time.monotonic():
+            self._entries.move_to_end(url)
+            return entry[1]
+
+        # 같은 URL에 대한 동시 확인은 한 번만 요청하도록 잠금
+        lock = self._locks.setdefault(url, asyncio.Lock())
+        async with lock:
+            entry = self._entries.get(url)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+
+            result = await self._probe(url)
+            ttl = self.error_ttl_seconds if self._is_transient(result) else self.ttl_seconds
+            self._entries[url] = (time.monotonic() + ttl, result)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._locks.pop(evicted, None)
+            return result
+
+    @staticmethod
+    def _is_transient(result: PreflightResult) -> bool:
+        return (
+            result.kind in (PreflightKind.UNREACHABLE, PreflightKind.DNS_NOT_FOUND)
+            or (result.status_code or 0) >= 500
+        )
+
+    async def _probe(self, url: str) -> PreflightResult:
+        """GET 요청으로 헤더(와 필요하면 본문 앞부분)만 확인"""
+        try:
+            async with httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                max_redirects=self.max_redirects,
+                headers={
+                    "User-Agent": self.user_agent,
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                },
+            ) as client:
+                async with client.stream("GET", url) as response:
+                    return await self._classify(url, response)
+        except httpx.HTTPError as e:
+            logger.debug(f"사전 확인 요청 실패 ({url}): {str(e)}")
+            if _dns_not_found(e):
+                return PreflightResult(url=url, kind=PreflightKind.DNS_NOT_FOUND, error=httpx.URL(url).host)
+            return PreflightResult(url=url, kind=PreflightKind.UNREACHABLE, error=type(e).__name__)
+
+    async def _classify(self, url: str, response: httpx.Response) -> PreflightResult:
+        final_url = str(response.url)
+        content_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
+        result = dict(
+            url=url,
+            final_url=final_url,
+            status_code=response.status_code,
+            content_type=content_type or None,
+            redirects=len(response.history),
+        )
+
+        if response.status_code in settings.PREFLIGHT_FAIL_STATUS_CODES:
+            return PreflightResult(kind=PreflightKind.HTTP_ERROR, **result)
+        if response.status_code >= 500:
+            return PreflightResult(kind=PreflightKind.SERVER_ERROR, **result)
+
+        if (
+            response.history
+            and any(fnmatchcase(final_url.lower(), pattern) for pattern in settings.PREFLIGHT_LOGIN_URL_PATTERNS)
+            and not any(fnmatchcase(url.lower(), pattern) for pattern in settings.PREFLIGHT_LOGIN_URL_PATTERNS)
+        ):
+            return PreflightResult(kind=PreflightKind.LOGIN_WALL, **result)
+
+        if "attachment" in response.headers.get("content-disposition", "").lower():
+            return PreflightResult(kind=PreflightKind.NON_HTML, **result)
+        if content_type in HTML_CONTENT_TYPES:
+            return PreflightResult(kind=PreflightKind.HTML, **result)
+        if content_type in _AMBIGUOUS_CONTENT_TYPES:
+            head = b""
+            async for chunk in response.aiter_bytes():
+                head += chunk
+                if len(head) >= _SNIFF_BYTES:
+                    break
+            if _looks_like_html(head[:_SNIFF_BYTES]):
+                return PreflightResult(kind=PreflightKind.HTML, **result)
+        return PreflightResult(kind=PreflightKind.NON_HTML, **result)
+
+
+preflight = PreflightCache(
+    user_agent=settings.PREFLIGHT_USER_AGENT or DEFAULT_USER_AGENT,
+    ttl_seconds=settings.PREFLIGHT_CACHE_TTL_SECONDS,
+    error_ttl_seconds=settings.PREFLIGHT_ERROR_TTL_SECONDS,
+    timeout=settings.PREFLIGHT_TIMEOUT_SECONDS,
+)
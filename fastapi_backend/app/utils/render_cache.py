@@ -0,0 +1,177 @@
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.utils.crawl import crawl_key
+from app.utils.image import ImageOptions
+from app.utils.load_strategy import LoadStrategy
+
+
+def render_key(
+    url: str,
+    device: Dict[str, Any],
+    *,
+    capture_full_page: bool,
+    capture_dynamic_elements: bool,
+    image_format: Optional[str] = None,
+    image_quality: Optional[int] = None,
+    request_policy: Optional[Dict] = None,
+    load_strategy: Optional[str] = None,
+    wait_for_selector: Optional[str] = None,
+) -> str:
+    """같은 결과를 내는 캡처 요청을 식별하는 키 (정규화 URL + 뷰포트 + 캡처 옵션)
+
+    디바이스 이름이 아니라 실제 렌더링에 영향을 주는 값(크기, User-Agent,
+    모바일/터치 에뮬레이션)으로 구분하고, 배포 기본값은 풀어서 비교한다.
+    """
+    options = ImageOptions.resolve(image_format, image_quality)
+    parts = {
+        "url": crawl_key(url),
+        "width": device["width"],
+        "height": device["height"],
+        "userAgent": device.get("user_agent"),
+        "isMobile": bool(device.get("is_mobile", False)),
+        "hasTouch": bool(device.get("has_touch", False)),
+        "fullPage": bool(capture_full_page),
+        "dynamic": bool(capture_dynamic_elements),
+        "format": options.format.value,
+        "quality": options.quality,
+        "requestPolicy": request_policy,
+        "loadStrategy": LoadStrategy(load_strategy or settings.CAPTURE_LOAD_STRATEGY).value,
+        "waitForSelector": wait_for_selector,
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class RenderCoalescer:
+    """같은 렌더링 키의 캡처를 하나로 합치고 (single-flight) 완료 결과를 잠시 보관
+
+    진행 중인 캡처와 같은 키로 들어온 요청은 새로 렌더링하지 않고 같은 결과를
+    기다린다. 완료된 결과는 ttl_seconds 동안 보관해 요청별 허용 나이(max_age)
+    안이면 그대로 재사용한다. 프로세스 단위이며, 다른 워커의 결과는 DB의
+    Screenshot.render_key 로 찾는다.
+    """
+
+    def __init__(self, ttl_seconds: int = 300, max_entries: int = 10000):
+        """합치기/결과 캐시 초기화
+
+        Args:
+            ttl_seconds: 완료 결과 보관 시간 (초)
+            max_entries: 보관할 최대 결과 수 (초과 시 가장 오래 안 쓴 항목 제거)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._results: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._flights: Dict[str, asyncio.Future] = {}
+
+    def get(self, key: str, max_age: float) -> Optional[Dict[str, Any]]:
+        """max_age 초 안에 완료된 결과 (없으면 None)"""
+        entry = self._results.get(key)
+        if entry is None:
+            return None
+        age = time.monotonic() - entry[0]
+        if age > self.ttl_seconds:
+            del self._results[key]
+            return None
+        if age > max_age:
+            return None
+        self._results.move_to_end(key)
+        return entry[1]
+
+    def remember(self, key: str, result: Dict[str, Any]) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        self._results[key] = (time.monotonic(), result)
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+
+    def _land(self, key: str, flight: asyncio.Future) -> None:
+        """캡처가 끝나면 진행 목록에서 빼고, 성공한 결과는 보관"""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.cancelled() and flight.exception() is None:
+            self.remember(key, flight.result())
+
+    async def run(self, key: str, func: Callable[[], Awaitable[Dict[str, Any]]]) -> Tuple[Dict[str, Any], bool]:
+        """같은 키의 캡처가 진행 중이면 그 결과를 기다리고, 아니면 func 실행
+
+        Returns:
+            (결과, 다른 요청의 렌더링을 공유했는지 여부)
+        """
+        flight = self._flights.get(key)
+        shared = flight is not None
+        if flight is None:
+            flight = asyncio.ensure_future(func())
+            self._flights[key] = flight
+            flight.add_done_callback(lambda _: self._land(key, flight))
+        # 기다리던 요청이 취소되어도 같은 결과를 기다리는 다른 요청을 위해 렌더링은 계속
+        return await asyncio.shield(flight), shared
+
+    async def run_many(
+        self, keys: List[str], func: Callable[[List[str]], Awaitable[Dict[str, Dict[str, Any]]]]
+    ) -> List[Tuple[Dict[str, Any], bool]]:
+        """한 번의 렌더링으로 여러 키의 결과를 만드는 캡처(뷰포트 공유 캡처)용 run
+
+        진행 중인 키는 그 결과를 기다리고, 나머지 키만 func(나머지 키) 한 번으로
+        만든다. func 가 실행되는 동안 나머지 키는 진행 중으로 등록되므로 같은 키로
+        들어온 run/run_many 요청은 새로 렌더링하지 않는다.
+
+        Args:
+            keys: 렌더링 키 목록 (중복 가능)
+            func: 키 목록을 받아 키별 결과를 반환하는 캡처
+
+        Returns:
+            keys 순서와 같은 (결과, 다른 요청의 렌더링을 공유했는지 여부) 목록
+        """
+        flights: Dict[str, asyncio.Future] = {}
+        shared: Dict[str, bool] = {}
+        for key in keys:
+            if key not in flights and key in self._flights:
+                flights[key] = self._flights[key]
+                shared[key] = True
+        missing = [key for key in dict.fromkeys(keys) if key not in flights]
+
+        if missing:
+            loop = asyncio.get_running_loop()
+            batch = asyncio.ensure_future(func(missing))
+            for key in missing:
+                flight = loop.create_future()
+                flights[key] = self._flights[key] = flight
+                shared[key] = False
+                flight.add_done_callback(lambda done, key=key: self._land(key, done))
+
+            def settle(batch: asyncio.Future) -> None:
+                # 렌더링 결과를 키별 진행 항목에 나눠 전달
+                for key in missing:
+                    flight = flights[key]
+                    if flight.done():
+                        continue
+                    if batch.cancelled():
+                        flight.cancel()
+                    elif batch.exception() is not None:
+                        flight.set_exception(batch.exception())
+                    elif key not in batch.result():
+                        flight.set_exception(KeyError(f"렌더링 결과에 키가 없습니다 ({key})"))
+                    else:
+                        flight.set_result(batch.result()[key])
+
+            batch.add_done_callback(settle)
+
+        results = []
+        seen = set()
+        for key in keys:
+            # 같은 호출 안에서 중복된 키는 첫 결과를 공유
+            results.append((await asyncio.shield(flights[key]), shared[key] or key in seen))
+            seen.add(key)
+        return results
+
+
+render_coalescer = RenderCoalescer(
+    ttl_seconds=settings.CAPTURE_RESULT_TTL_SECONDS,
+    max_entries=settings.CAPTURE_RESULT_CACHE_SIZE,
+)
@@ -0,0 +1,161 @@
+import logging
+from collections import Counter
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _domain_matches(host: str, domains: Iterable[str]) -> bool:
+    """host 가 목록의 도메인 또는 그 하위 도메인인지 여부"""
+    return any(host == domain or host.endswith("." + domain) for domain in domains)
+
+
+class RequestPolicy:
+    """캡처 중 브라우저 요청 차단 정책 (리소스 유형, 도메인, URL 패턴)
+
+    메인 문서 요청은 차단하지 않으며, allow_domains 에 속한 요청은 다른 규칙보다 우선해 허용한다.
+    """
+
+    def __init__(
+        self,
+        block_resource_types: Optional[Iterable[str]] = None,
+        block_domains: Optional[Iterable[str]] = None,
+        block_url_patterns: Optional[Iterable[str]] = None,
+        allow_domains: Optional[Iterable[str]] = None,
+    ):
+        """요청 정책 초기화
+
+        Args:
+            block_resource_types: 차단할 Playwright 리소스 유형 (media, font, image 등)
+            block_domains: 차단할 도메인 (하위 도메인 포함)
+            block_url_patterns: 차단할 URL glob 패턴 (예: "*/collect?*")
+            allow_domains: 항상 허용할 도메인 (하위 도메인 포함)
+        """
+        self.block_resource_types = {t.lower() for t in block_resource_types or []}
+        self.block_domains = {d.lower().lstrip(".") for d in block_domains or []}
+        self.block_url_patterns = list(block_url_patterns or [])
+        self.allow_domains = {d.lower().lstrip(".") for d in allow_domains or []}
+
+    @classmethod
+    def resolve(cls, overrides: Optional[Dict[str, Any]] = None) -> Optional["RequestPolicy"]:
+        """배포 설정(CAPTURE_BLOCK_*)에 캡처별 설정을 합친 정책 (비활성화면 None)
+
+        캡처별 설정:
+            enabled: False 면 요청을 가로채지 않음
+            use_defaults: False 면 배포 설정의 도메인/패턴 목록을 쓰지 않음
+            block_resource_types: 지정하면 배포 설정 대신 사용
+            block_domains, block_url_patterns: 배포 설정에 추가
+            allow_domains: 항상 허용할 도메인
+        """
+        overrides = overrides or {}
+        if not settings.CAPTURE_REQUEST_POLICY_ENABLED or not overrides.get("enabled", True):
+            return None
+
+        use_defaults = overrides.get("use_defaults", True)
+        resource_types = overrides.get("block_resource_types")
+        if resource_types is None:
+            resource_types = settings.CAPTURE_BLOCK_RESOURCE_TYPES
+        domains = list(overrides.get("block_domains") or [])
+        patterns = list(overrides.get("block_url_patterns") or [])
+        if use_defaults:
+            domains += settings.CAPTURE_BLOCK_DOMAINS
+            patterns += settings.CAPTURE_BLOCK_URL_PATTERNS
+
+        return cls(
+            block_resource_types=resource_types,
+            block_domains=domains,
+            block_url_patterns=patterns,
+            allow_domains=overrides.get("allow_domains"),
+        )
+
+    def block_reason(self, url: str, resource_type: str, is_main_document: bool = False) -> Optional[str]:
+        """요청을 차단해야 하면 사유(resourceType/domain/pattern), 아니면 None"""
+        if is_main_document:
+            return None
+        host = (urlparse(url).hostname or "").lower()
+        if _domain_matches(host, self.allow_domains):
+            return None
+        if resource_type in self.block_resource_types:
+            return "resourceType"
+        if _domain_matches(host, self.block_domains):
+            return "domain"
+        if any(fnmatchcase(url, pattern) for pattern in self.block_url_patterns):
+            return "pattern"
+        return None
+
+
+class RequestStats:
+    """캡처 중 허용/차단된 요청 수"""
+
+    def __init__(self):
+        self.allowed = 0
+        self.blocked = 0
+        self.blocked_by_reason: Counter = Counter()
+        self.blocked_by_type: Counter = Counter()
+        self.cache: Counter = Counter()
+
+    def record(self, resource_type: str, reason: Optional[str]) -> None:
+        if reason is None:
+            self.allowed += 1
+            return
+        self.blocked += 1
+        self.blocked_by_reason[reason] += 1
+        self.blocked_by_type[resource_type] += 1
+
+    def record_cache(self, result: str) -> None:
+        self.cache[result] += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        """스크린샷 metadata 에 넣을 형태"""
+        return {
+            "allowed": self.allowed,
+            "blocked": self.blocked,
+            "blockedByReason": dict(self.blocked_by_reason),
+            "blockedByType": dict(self.blocked_by_type),
+            "cache": dict(self.cache),  # 리소스 캐시 hit/revalidated/miss
+        }
+
+
+async def install_request_policy(page, policy: Optional[RequestPolicy], cache=None) -> RequestStats:
+    """페이지에 요청 가로채기(page.route) 설치 후 통계 객체 반환
+
+    정책은 불필요한 요청을 차단하고, 리소스 캐시(AssetCache)가 주어지면 허용된
+    정적 리소스(ASSET_CACHE_RESOURCE_TYPES) 요청을 공유 디스크 캐시로 응답한다.
+    둘 다 없으면 가로채지 않고 빈 통계만 반환한다. 가로채기를 설치하면
+    Chromium 이 해당 페이지에서 HTTP 캐시를 쓰지 않으므로 필요할 때만 설치한다.
+    """
+    stats = RequestStats()
+    if policy is None and cache is None:
+        return stats
+    cached_types = set(settings.ASSET_CACHE_RESOURCE_TYPES)
+
+    def is_main_document(request) -> bool:
+        try:
+            return request.is_navigation_request() and request.frame.parent_frame is None
+        except Exception:
+            # 서비스 워커 요청 등 프레임이 없는 요청
+            return False
+
+    async def handle(route) -> None:
+        request = route.request
+        reason = None
+        if policy is not None:
+            reason = policy.block_reason(request.url, request.resource_type, is_main_document(request))
+        stats.record(request.resource_type, reason)
+        try:
+            if reason:
+                await route.abort("blockedbyclient")
+            elif cache is not None and request.method == "GET" and request.resource_type in cached_types:
+                stats.record_cache(await cache.handle(route))
+            else:
+                await route.continue_()
+        except Exception as e:
+            # 페이지가 닫히는 중 등 이미 처리된 요청
+            logger.debug(f"요청 라우팅 오류 ({request.url}): {str(e)}")
+
+    await page.route("**/*", handle)
+    return stats
@@ -0,0 +1,183 @@
+import asyncio
+import enum
+import logging
+import time
+from typing import Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud import screenshots
+
+logger = logging.getLogger(__name__)
+
+_MASK_64 = (1 << 64) - 1
+
+T = TypeVar("T")
+
+
+class HashKind(str, enum.Enum):
+    PHASH = "phash"
+    DHASH = "dhash"
+
+
+def hamming(a: int, b: int) -> int:
+    """64비트 해시의 해밍 거리 (부호 있는 정수로 저장된 값도 처리)"""
+    return ((a ^ b) & _MASK_64).bit_count()
+
+
+# 64비트 해시를 16비트 4조각으로 나눠 색인
+_CHUNKS = 4
+_CHUNK_BITS = 16
+_CHUNK_MASK = (1 << _CHUNK_BITS) - 1
+# 비트 수별 16비트 XOR 마스크 (조각값과 거리가 정확히 r 인 값 = 조각값 ^ 마스크)
+_MASKS_BY_WEIGHT: List[List[int]] = [[] for _ in range(_CHUNK_BITS + 1)]
+for _mask in range(1 << _CHUNK_BITS):
+    _MASKS_BY_WEIGHT[_mask.bit_count()].append(_mask)
+
+
+def _chunks(value: int) -> List[int]:
+    return [(value >> (_CHUNK_BITS * i)) & _CHUNK_MASK for i in range(_CHUNKS)]
+
+
+class MultiIndexHashTable(Generic[T]):
+    """해밍 거리 검색용 다중 인덱스 해시 테이블
+
+    해시를 16비트 조각 4개로 나눠 조각별 해시 테이블에 넣는다. 비둘기집 원리로
+    거리가 4r+3 이하인 해시는 적어도 한 조각의 거리가 r 이하이므로, 각 조각값과
+    거리 r 이내인 버킷만 확인하면 된다 (r=4 까지 조각당 2,517번 조회로 거리 19
+    이하 전부). 조회 비용은 저장된 해시 수와 거의 무관하다. 같은 해시의 항목은
+    하나로 모아 저장한다.
+    """
+
+    def __init__(self):
+        self._tables: List[Dict[int, List[int]]] = [{} for _ in range(_CHUNKS)]
+        self._items: Dict[int, List[T]] = {}
+        self.size = 0
+
+    def add(self, value: int, item: T) -> None:
+        value &= _MASK_64
+        self.size += 1
+        items = self._items.get(value)
+        if items is not None:
+            items.append(item)
+            return
+        self._items[value] = [item]
+        for table, chunk in zip(self._tables, _chunks(value)):
+            table.setdefault(chunk, []).append(value)
+
+    def nearest(
+        self,
+        value: int,
+        k: int,
+        max_distance: int = 64,
+        predicate: Optional[Callable[[T], bool]] = None,
+    ) -> List[Tuple[int, T]]:
+        """거리가 max_distance 이하인 가장 가까운 k 개 (거리, 항목) - 가까운 순
+
+        조각 거리 r 을 0부터 늘려가며 후보를 모으고, 빠짐없이 찾은 거리(4r+3)
+        안에 k 개가 모이면 멈춘다. predicate 가 False 인 항목은 제외한다.
+        """
+        if k <= 0 or not self._items:
+            return []
+        value &= _MASK_64
+        chunks = _chunks(value)
+        seen = set()
+        found: List[Tuple[int, T]] = []
+        for radius in range(_CHUNK_BITS + 1):
+            for table, chunk in zip(self._tables, chunks):
+                for mask in _MASKS_BY_WEIGHT[radius]:
+                    bucket = table.get(chunk ^ mask)
+                    if not bucket:
+                        continue
+                    for candidate in bucket:
+                        if candidate in seen:
+                            continue
+                        seen.add(candidate)
+                        distance = hamming(value, candidate)
+                        if distance > max_distance:
+                            continue
+                        found.extend(
+                            (distance, item)
+                            for item in self._items[candidate]
+                            if predicate is None or predicate(item)
+                        )
+            found.sort(key=lambda entry: entry[0])
+            complete = _CHUNKS * radius + _CHUNKS - 1
+            if complete >= max_distance or (len(found) >= k and found[k - 1][0] <= complete):
+                break
+        return found[:k]
+
+
+class SimilarityIndex:
+    """스크린샷 지각 해시 검색 인덱스 (프로세스 메모리의 다중 인덱스 해시 테이블)
+
+    질의할 때마다 마지막으로 읽은 스크린샷 이후에 추가된 행만 DB에서 읽어
+    트리에 더한다. 삭제된 스크린샷은 rebuild_seconds 마다 전체를 다시 읽어
+    정리하며, 그 전까지는 조회 시 DB에 없는 결과를 걸러낸다.
+    항목은 (스크린샷 ID, 웹사이트 ID) 이다.
+    """
+
+    def __init__(self, rebuild_seconds: int = 3600):
+        """인덱스 초기화 (첫 질의 때 DB에서 읽음)
+
+        Args:
+            rebuild_seconds: 전체를 다시 읽는 주기 (초)
+        """
+        self.rebuild_seconds = rebuild_seconds
+        self._indexes: Dict[HashKind, MultiIndexHashTable[Tuple[int, int]]] = {}
+        self._last_id = 0
+        self._built_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _add_rows(
+        indexes: Dict[HashKind, MultiIndexHashTable[Tuple[int, int]]], rows: List[Tuple[int, int, int, int]]
+    ) -> None:
+        for screenshot_id, website_id, dhash, phash in rows:
+            indexes[HashKind.DHASH].add(dhash, (screenshot_id, website_id))
+            indexes[HashKind.PHASH].add(phash, (screenshot_id, website_id))
+
+    async def refresh(self, db: AsyncSession) -> None:
+        """새로 추가된 스크린샷을 인덱스에 반영"""
+        async with self._lock:
+            rebuild = not self._indexes or time.monotonic() - self._built_at > self.rebuild_seconds
+            last_id = 0 if rebuild else self._last_id
+            rows = await screenshots.aget_hashes_after(db, after_id=last_id)
+            if rebuild:
+                # 새 인덱스는 아직 질의에 쓰이지 않으므로 스레드에서 구성 후 교체
+                indexes = {kind: MultiIndexHashTable() for kind in HashKind}
+                await asyncio.to_thread(self._add_rows, indexes, rows)
+                self._indexes = indexes
+                self._built_at = time.monotonic()
+                logger.info(f"유사 화면 인덱스 구성: {len(rows)}개")
+            else:
+                self._add_rows(self._indexes, rows)
+            if rows:
+                self._last_id = rows[-1][0]
+            elif rebuild:
+                self._last_id = 0
+
+    def nearest(
+        self,
+        kind: HashKind,
+        value: int,
+        k: int,
+        max_distance: int = 64,
+        exclude_screenshot_id: Optional[int] = None,
+        exclude_website_id: Optional[int] = None,
+    ) -> List[Tuple[int, Tuple[int, int]]]:
+        """가장 가까운 k 개 (거리, (스크린샷 ID, 웹사이트 ID))"""
+        index = self._indexes.get(kind)
+        if index is None:
+            return []
+
+        def predicate(item: Tuple[int, int]) -> bool:
+            return item[0] != exclude_screenshot_id and (
+                exclude_website_id is None or item[1] != exclude_website_id
+            )
+
+        return index.nearest(value, k, max_distance, predicate)
+
+
+similarity_index = SimilarityIndex(rebuild_seconds=settings.SIMILARITY_REBUILD_SECONDS)
@@ -0,0 +1,354 @@
+import logging
+import math
+import shutil
+import struct
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+from app.core.config import settings
+from app.utils.image import FORMAT_EXTENSIONS, ImageFormat, choose_format, image_pool, save_image
+
+logger = logging.getLogger(__name__)
+
+TILES_DIR = Path("storage/tiles")
+
+DZI_DESCRIPTOR = "image.dzi"
+DZI_TILES = "image_files"
+
+# 타일은 내용이 바뀌지 않으므로 브라우저/CDN 에 오래 캐시
+TILE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_DZI_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<Image xmlns="http://schemas.microsoft.com/deepzoom/2008" '
+    'TileSize="{tile_size}" Overlap="{overlap}" Format="{format}">'
+    '<Size Width="{width}" Height="{height}"/></Image>\n'
+)
+
+
+# 원본을 나눠 읽는 행 수 (전체 이미지를 한 번에 디코딩하지 않음)
+_BAND_ROWS = 256
+# 압축 해제 한 번에 만들 최대 바이트 (큰 IDAT 청크도 나눠 처리)
+_INFLATE_CHUNK = 4 * 1024 * 1024
+
+
+class _UnsupportedPng(Exception):
+    """행 단위로 읽을 수 없는 PNG (전체 디코딩으로 처리)"""
+
+
+def _png_bands(source_path: Union[str, Path], band_rows: int) -> Tuple[int, int, Iterator[np.ndarray]]:
+    """8비트 RGB/RGBA 비인터레이스 PNG 를 위에서부터 band_rows 행씩 RGB 배열로 읽기
+
+    StripImageWriter 가 만든 긴 스크린샷처럼 필터가 None/Sub/Up 인 행만 있으면
+    전체를 디코딩하지 않고 IDAT 를 흘려 읽는다. Average/Paeth 필터 행을 만나면
+    _UnsupportedPng 를 발생시킨다.
+
+    Returns:
+        (너비, 높이, 행 묶음 반복자)
+    """
+    file = open(source_path, "rb")
+    try:
+        if file.read(8) != b"\x89PNG\r\n\x1a\n":
+            raise _UnsupportedPng("PNG 가 아님")
+        length, chunk_type = struct.unpack(">I4s", file.read(8))
+        if chunk_type != b"IHDR":
+            raise _UnsupportedPng("IHDR 없음")
+        width, height, bit_depth, color_type, _, _, interlace = struct.unpack(">IIBBBBB", file.read(length))
+        file.read(4)  # CRC
+        if bit_depth != 8 or color_type not in (2, 6) or interlace:
+            raise _UnsupportedPng("지원하지 않는 PNG 형식")
+    except BaseException:
+        file.close()
+        raise
+    channels = 3 if color_type == 2 else 4
+
+    def bands() -> Iterator[np.ndarray]:
+        stride = width * channels
+        inflater = zlib.decompressobj()
+        previous = np.zeros(stride, dtype=np.uint8)
+        buffer = bytearray()
+        rows: List[np.ndarray] = []
+        produced = 0
+        with file:
+            while produced < height:
+                header = file.read(8)
+                if len(header) < 8:
+                    raise ValueError("PNG 데이터가 끝까지 없습니다")
+                length, chunk_type = struct.unpack(">I4s", header)
+                data = file.read(length)
+                file.read(4)  # CRC
+                if chunk_type == b"IEND":
+                    raise ValueError("PNG 행이 부족합니다")
+                if chunk_type != b"IDAT":
+                    continue
+                while data and produced < height:
+                    buffer += inflater.decompress(data, _INFLATE_CHUNK)
+                    data = inflater.unconsumed_tail
+                    offset = 0
+                    while len(buffer) - offset > stride and produced < height:
+                        filter_type = buffer[offset]
+                        raw = np.frombuffer(buffer[offset + 1:offset + 1 + stride], dtype=np.uint8)
+                        offset += stride + 1
+                        if filter_type == 0:
+                            row = raw
+                        elif filter_type == 1:
+                            row = np.cumsum(raw.reshape(width, channels), axis=0, dtype=np.uint8).reshape(-1)
+                        elif filter_type == 2:
+                            row = raw + previous
+                        else:
+                            raise _UnsupportedPng(f"필터 {filter_type}")
+                        previous = row
+                        rows.append(row.reshape(width, channels)[:, :3])
+                        produced += 1
+                        if len(rows) == band_rows:
+                            yield np.stack(rows)
+                            rows = []
+                    del buffer[:offset]
+        if rows:
+            yield np.stack(rows)
+
+    return width, height, bands()
+
+
+def _decoded_bands(source_path: Union[str, Path], band_rows: int) -> Tuple[int, int, Iterator[np.ndarray]]:
+    """PIL 로 전체를 디코딩해 band_rows 행씩 나눠 반환 (행 단위로 읽을 수 없는 형식용)"""
+    with Image.open(source_path) as source:
+        pixels = np.asarray(source.convert("RGB"))
+    height, width = pixels.shape[:2]
+    return width, height, (pixels[top:top + band_rows] for top in range(0, height, band_rows))
+
+
+def _half(rows: np.ndarray) -> np.ndarray:
+    """짝수 개의 행을 가로/세로 절반으로 축소 (2x2 평균, 홀수 너비는 마지막 열 복제)"""
+    if rows.shape[1] % 2:
+        rows = np.concatenate([rows, rows[:, -1:]], axis=1)
+    height, width = rows.shape[:2]
+    blocks = rows.reshape(height // 2, 2, width // 2, 2, 3).astype(np.uint16)
+    return ((blocks.sum(axis=(1, 3)) + 2) // 4).astype(np.uint8)
+
+
+class _PyramidLevel:
+    """한 레벨의 타일을 위에서부터 받은 행으로 만들고, 축소한 행을 다음 레벨로 넘김
+
+    타일 한 줄(tile_size + overlap 행)에 필요한 행만 보관하므로 메모리는
+    이미지 높이와 무관하다.
+    """
+
+    def __init__(
+        self,
+        level: int,
+        width: int,
+        height: int,
+        tiles_dir: Path,
+        tile_size: int,
+        overlap: int,
+        fmt: ImageFormat,
+        quality: int,
+        child: Optional["_PyramidLevel"],
+    ):
+        self.width = width
+        self.height = height
+        self.level_dir = tiles_dir / str(level)
+        self.level_dir.mkdir(parents=True, exist_ok=True)
+        self.tile_size = tile_size
+        self.overlap = overlap
+        self.fmt = fmt
+        self.quality = quality
+        self.child = child
+
+        self._pending = np.empty((0, width, 3), dtype=np.uint8)
+        self._top = 0  # _pending 첫 행의 y 좌표
+        self._received = 0
+        self._next_row = 0
+        self._carry: Optional[np.ndarray] = None  # 다음 레벨로 아직 넘기지 않은 홀수 번째 행
+
+    def add(self, rows: np.ndarray) -> None:
+        self._pending = np.concatenate([self._pending, rows])
+        self._received += len(rows)
+        self._emit_tiles()
+        if self.child is not None:
+            if self._carry is not None:
+                rows = np.concatenate([self._carry, rows])
+                self._carry = None
+            if len(rows) % 2:
+                self._carry, rows = rows[-1:], rows[:-1]
+            if len(rows):
+                self.child.add(_half(rows))
+
+    def finish(self) -> None:
+        if self._received != self.height:
+            raise ValueError(f"행 수가 맞지 않습니다 ({self._received}/{self.height})")
+        if self.child is not None:
+            if self._carry is not None:
+                # 홀수 높이의 마지막 행은 복제해 축소
+                self.child.add(_half(np.concatenate([self._carry, self._carry])))
+                self._carry = None
+            self.child.finish()
+
+    def _emit_tiles(self) -> None:
+        size, overlap = self.tile_size, self.overlap
+        extension = FORMAT_EXTENSIONS[self.fmt]
+        while self._next_row < math.ceil(self.height / size):
+            row = self._next_row
+            # 이웃 타일과 overlap 만큼 겹치도록 잘라냄 (가장자리는 제외)
+            top = max(0, row * size - overlap)
+            bottom = min(self.height, (row + 1) * size + overlap)
+            if self._received < bottom:
+                return
+            band = self._pending[top - self._top:bottom - self._top]
+            for col in range(math.ceil(self.width / size)):
+                left = max(0, col * size - overlap)
+                right = min(self.width, (col + 1) * size + overlap)
+                tile = Image.fromarray(np.ascontiguousarray(band[:, left:right]))
+                save_image(tile, self.level_dir / f"{col}_{row}{extension}", self.fmt, self.quality)
+            self._next_row += 1
+            # 다음 타일 줄에 필요 없는 행 버림
+            keep_from = max(0, self._next_row * size - overlap)
+            self._pending = self._pending[keep_from - self._top:]
+            self._top = keep_from
+
+
+def _build_levels(
+    width: int,
+    height: int,
+    bands: Iterator[np.ndarray],
+    tiles_dir: Path,
+    tile_size: int,
+    overlap: int,
+    fmt: ImageFormat,
+    quality: int,
+) -> int:
+    """모든 레벨의 타일 생성. 가장 높은 레벨 번호 반환"""
+    max_level = math.ceil(math.log2(max(width, height, 1)))
+    # 레벨 0(1x1)부터 위로 연결
+    level: Optional[_PyramidLevel] = None
+    for number in range(max_level + 1):
+        scale = 2 ** (max_level - number)
+        level = _PyramidLevel(
+            number,
+            max(1, math.ceil(width / scale)),
+            max(1, math.ceil(height / scale)),
+            tiles_dir,
+            tile_size,
+            overlap,
+            fmt,
+            quality,
+            child=level,
+        )
+    for band in bands:
+        level.add(band)
+    level.finish()
+    return max_level
+
+
+def build_dzi_pyramid(
+    source_path: Union[str, Path],
+    output_dir: Union[str, Path],
+    tile_size: int = 254,
+    overlap: int = 1,
+    tile_format: str = "webp",
+    quality: int = 80,
+) -> Dict[str, Any]:
+    """스크린샷으로 Deep Zoom(DZI) 타일 피라미드 생성 (프로세스 풀에서 실행)
+
+    output_dir/image.dzi 와 output_dir/image_files/{level}/{col}_{row}.{ext} 를 만든다.
+    가장 높은 레벨이 원본 크기이고, 레벨이 하나 내려갈 때마다 가로/세로가 절반이 되며
+    레벨 0 은 1x1 픽셀이다. 원본을 위에서부터 행 묶음으로 읽어 모든 레벨을 한 번에
+    만들므로, 긴 스크린샷(StripImageWriter 의 PNG)도 전체를 메모리에 올리지 않는다.
+    행 단위로 읽을 수 없는 형식만 전체를 디코딩한다.
+
+    작업마다 고유한 임시 디렉터리에 만든 뒤 교체하며, 같은 내용의 피라미드를 다른
+    작업이 먼저 완성했으면 그것을 그대로 사용한다.
+
+    Returns:
+        descriptor(.dzi 경로), width, height, levels, format
+    """
+    output_dir = Path(output_dir)
+    output_dir.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(prefix=f"{output_dir.name}.", suffix=".tmp", dir=output_dir.parent))
+    tiles_dir = tmp_dir / DZI_TILES
+    fmt = choose_format(ImageFormat(tile_format), tile_size + 2 * overlap, tile_size + 2 * overlap)
+    extension = FORMAT_EXTENSIONS[fmt]
+
+    try:
+        try:
+            width, height, bands = _png_bands(source_path, _BAND_ROWS)
+            max_level = _build_levels(width, height, bands, tiles_dir, tile_size, overlap, fmt, quality)
+        except _UnsupportedPng:
+            shutil.rmtree(tiles_dir, ignore_errors=True)
+            width, height, bands = _decoded_bands(source_path, _BAND_ROWS)
+            max_level = _build_levels(width, height, bands, tiles_dir, tile_size, overlap, fmt, quality)
+
+        (tmp_dir / DZI_DESCRIPTOR).write_text(
+            _DZI_TEMPLATE.format(
+                tile_size=tile_size, overlap=overlap, format=extension.lstrip("."), width=width, height=height
+            ),
+            encoding="utf-8",
+        )
+
+        # 완성된 피라미드만 보이도록 마지막에 교체
+        try:
+            tmp_dir.rename(output_dir)
+        except OSError:
+            if not (output_dir / DZI_DESCRIPTOR).exists():
+                raise
+            # 같은 스크린샷의 피라미드를 다른 작업이 먼저 완성함 (내용 주소 경로라 결과가 같음)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    return {
+        "descriptor": str(output_dir / DZI_DESCRIPTOR),
+        "width": width,
+        "height": height,
+        "levels": max_level + 1,
+        "format": fmt.value,
+    }
+
+
+def tiles_dir_for(screenshot_path: Union[str, Path]) -> Path:
+    """스크린샷 파일에 대응하는 타일 디렉터리 (날짜 폴더/파일 이름 기준)"""
+    screenshot_path = Path(screenshot_path)
+    return TILES_DIR / screenshot_path.parent.name / screenshot_path.stem
+
+
+def tile_path(descriptor_path: Union[str, Path], level: int, col: int, row: int, extension: str) -> Path:
+    """DZI 디스크립터 경로와 타일 좌표로 타일 파일 경로 생성"""
+    return Path(descriptor_path).parent / DZI_TILES / str(level) / f"{col}_{row}.{extension}"
+
+
+async def create_tile_pyramid(screenshot_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """스크린샷의 타일 피라미드를 이미지 프로세스 풀에서 생성
+
+    DZI_ENABLED 가 꺼져 있거나 DZI_MIN_HEIGHT 보다 짧은 스크린샷은 건너뛰고,
+    이미 피라미드가 있으면 다시 만들지 않는다.
+    실패해도 캡처 자체는 유효하므로 None 을 반환하고 경고만 남긴다.
+    """
+    if not settings.DZI_ENABLED:
+        return None
+    descriptor = tiles_dir_for(screenshot_path) / DZI_DESCRIPTOR
+    if descriptor.exists():
+        # 내용 주소 경로의 같은 이미지는 이미 만든 피라미드를 그대로 사용
+        return {"descriptor": str(descriptor)}
+    try:
+        with Image.open(screenshot_path) as image:
+            if image.height < settings.DZI_MIN_HEIGHT:
+                return None
+        return await image_pool.run(
+            build_dzi_pyramid,
+            str(screenshot_path),
+            str(tiles_dir_for(screenshot_path)),
+            settings.DZI_TILE_SIZE,
+            settings.DZI_TILE_OVERLAP,
+            settings.DZI_TILE_FORMAT,
+            settings.DZI_TILE_QUALITY,
+        )
+    except Exception as e:
+        logger.warning(f"타일 피라미드 생성 오류 ({screenshot_path}): {str(e)}")
+        return None
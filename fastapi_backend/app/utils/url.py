@@ -1,5 +1,9 @@
+import fnmatch
 import re
-from urllib.parse import urlparse
+from typing import Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
 
 def validate_url(url: str) -> bool:
     """URL 유효성 검사
@@ -16,6 +20,7 @@ def validate_url(url: str) -> bool:
     # URL 형식 검사
     try:
         result = urlparse(url)
+        result.port  # 범위 밖/숫자가 아닌 포트는 ValueError
         return all([result.scheme, result.netloc])
     except:
         return False
@@ -77,4 +82,56 @@ def get_base_url(url: str) -> str:
         base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
         return base_url
     except:
-        return url
\ No newline at end of file
+        return url
+
+
+def canonicalize_url(url: str, tracking_params: Optional[Iterable[str]] = None) -> str:
+    """중복 판단용 URL 정규화
+
+    스킴/호스트 소문자화, 기본 포트 제거, 프래그먼트 제거, 쿼리 파라미터 정렬,
+    추적용 파라미터 제거를 수행한다.
+
+    Args:
+        url: 정규화할 URL
+        tracking_params: 제거할 쿼리 파라미터 이름 목록 (utm_* 처럼 와일드카드 가능)
+
+    Returns:
+        정규화된 URL
+
+    Raises:
+        ValueError: 호스트/포트 형식이 잘못된 URL (닫히지 않은 IPv6 대괄호, 범위 밖 포트 등)
+    """
+    if not re.match(r'^https?://', url, re.IGNORECASE):
+        url = 'https://' + url
+
+    parsed = urlparse(url)
+    scheme = parsed.scheme.lower()
+    host = (parsed.hostname or '').lower()
+    if ':' in host:
+        # hostname 은 IPv6 주소의 대괄호를 떼므로 다시 붙임
+        host = f"[{host}]"
+
+    # 기본 포트 제거 (잘못된 포트는 ValueError)
+    port = parsed.port
+    netloc = host
+    if port and port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{port}"
+    if parsed.username:
+        userinfo = parsed.username + (f":{parsed.password}" if parsed.password else "")
+        netloc = f"{userinfo}@{netloc}"
+
+    # 경로: 빈 경로는 '/', 그 외에는 마지막 슬래시 제거
+    path = parsed.path or '/'
+    if len(path) > 1 and path.endswith('/'):
+        path = path.rstrip('/') or '/'
+
+    # 쿼리: 추적 파라미터 제거 후 정렬
+    patterns = list(tracking_params or [])
+    query_items = [
+        (key, value)
+        for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not any(fnmatch.fnmatchcase(key.lower(), pattern) for pattern in patterns)
+    ]
+    query = urlencode(sorted(query_items))
+
+    return urlunparse((scheme, netloc, path, parsed.params, query, ''))
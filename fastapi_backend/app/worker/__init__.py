@@ -0,0 +1 @@
+# This file is intentionally left empty for package initialization
\ No newline at end of file
@@ -0,0 +1,33 @@
+import asyncio
+import logging
+import signal
+
+from app.utils.asset_cache import asset_cache
+from app.utils.browser_pool import browser_pool
+from app.utils.image import image_pool
+from app.utils.load_strategy import load_profiles
+from app.worker.worker import CaptureWorker
+
+
+async def main() -> None:
+    """독립 실행 캡처 워커 (python -m app.worker)"""
+    worker = CaptureWorker()
+
+    # SIGTERM/SIGINT 수신 시 새 작업을 받지 않고 진행 중인 작업을 마친 뒤 종료
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, worker.stop)
+
+    await browser_pool.start()
+    try:
+        await worker.run()
+    finally:
+        await browser_pool.close()
+        image_pool.close()
+        asset_cache.close()
+        load_profiles.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
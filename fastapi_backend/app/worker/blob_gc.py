@@ -0,0 +1,105 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Set
+
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.blob import Blob
+from app.models.screenshot import Screenshot
+from app.utils.blob_store import BlobStore, blob_store
+
+logger = logging.getLogger(__name__)
+
+
+async def _count_refs(db: AsyncSession, hashes: List[str]) -> Dict[str, int]:
+    """해시별로 이를 가리키는 스크린샷/썸네일 수"""
+    refs: Dict[str, int] = {content_hash: 0 for content_hash in hashes}
+    for column in (Screenshot.content_hash, Screenshot.thumbnail_hash):
+        result = await db.execute(
+            select(column, func.count()).where(column.in_(hashes)).group_by(column)
+        )
+        for content_hash, count in result.all():
+            refs[content_hash] += count
+    return refs
+
+
+async def _existing_hashes(db: AsyncSession, hashes: Iterable[str]) -> Set[str]:
+    result = await db.execute(select(Blob.hash).where(Blob.hash.in_(list(hashes))))
+    return set(result.scalars().all())
+
+
+async def collect_garbage(
+    db: AsyncSession,
+    store: BlobStore = blob_store,
+    grace_seconds: int = settings.BLOB_GC_GRACE_SECONDS,
+    recheck_seconds: int = settings.BLOB_GC_INTERVAL_SECONDS,
+    batch_size: int = settings.BLOB_GC_BATCH_SIZE,
+) -> Dict[str, int]:
+    """참조되지 않는 저장소 파일 삭제
+
+    1. recheck_seconds 동안 확인하지 않은 Blob 행을 FOR UPDATE SKIP LOCKED 로 나눠 가져와
+       실제 스크린샷 참조 수로 ref_count 를 맞춘다 (페이지/캡처 삭제의 CASCADE 는
+       참조 수를 줄이지 않으므로). 참조가 없고 grace_seconds 안에 저장/재사용되지
+       않은 파일은 타일과 함께 지우고 행도 삭제한다.
+    2. 저장 후 DB에 기록되기 전에 작업이 중단되어 Blob 행이 없는 파일을 지운다.
+
+    Returns:
+        checked, deleted, freedBytes, orphans 건수
+    """
+    stats = {"checked": 0, "deleted": 0, "freedBytes": 0, "orphans": 0}
+    started = datetime.utcnow()
+    grace_cutoff = started - timedelta(seconds=grace_seconds)
+    # 이번 실행에서 확인한 행은 checked_at 이 started 이후가 되어 다시 선택되지 않음
+    recheck_cutoff = started - timedelta(seconds=recheck_seconds)
+
+    while True:
+        now = datetime.utcnow()
+        result = await db.execute(
+            select(Blob)
+            .where(or_(Blob.checked_at.is_(None), Blob.checked_at < recheck_cutoff))
+            .order_by(Blob.ref_count, Blob.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        blobs = list(result.scalars().all())
+        if not blobs:
+            await db.commit()
+            break
+
+        refs = await _count_refs(db, [blob.hash for blob in blobs])
+        deleted_ids: List[int] = []
+        updates = []
+        for blob in blobs:
+            count = refs[blob.hash]
+            if (
+                count == 0
+                and (blob.created_at is None or blob.created_at < grace_cutoff)
+                and not store.is_recent(blob.path, grace_seconds)
+            ):
+                stats["freedBytes"] += await asyncio.to_thread(store.delete, blob.path)
+                deleted_ids.append(blob.id)
+            else:
+                updates.append({"id": blob.id, "ref_count": count, "checked_at": now})
+        if deleted_ids:
+            await db.execute(delete(Blob).where(Blob.id.in_(deleted_ids)))
+        if updates:
+            await db.execute(update(Blob), updates)
+        await db.commit()
+        stats["checked"] += len(blobs)
+        stats["deleted"] += len(deleted_ids)
+
+    # Blob 행이 없는 오래된 파일
+    files = await asyncio.to_thread(lambda: list(store.iter_files(grace_seconds)))
+    for start in range(0, len(files), batch_size):
+        chunk = files[start:start + batch_size]
+        existing = await _existing_hashes(db, {content_hash for content_hash, _ in chunk})
+        for content_hash, path in chunk:
+            if content_hash not in existing:
+                stats["freedBytes"] += await asyncio.to_thread(store.delete, path)
+                stats["orphans"] += 1
+    await db.commit()
+
+    return stats
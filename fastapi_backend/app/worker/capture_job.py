@@ -0,0 +1,619 @@
+import asyncio
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud import captures, websites, pages, page_links, screenshots, device_profiles
+from app.models.capture import Capture
+from app.models.page import Page, PageStatus
+from app.models.screenshot import Screenshot
+from app.utils.blob_store import blob_store
+from app.utils.capture import MOBILE_USER_AGENT, TABLET_USER_AGENT, capture_website, capture_website_viewports
+from app.utils.crawl import CrawlScope, crawl_key
+from app.utils.fingerprint import fingerprinter
+from app.utils.frontier import FrontierItem, URLFrontier
+from app.utils.politeness import politeness
+from app.utils.preflight import preflight
+from app.utils.render_cache import render_coalescer, render_key
+from app.utils.tiles import create_tile_pyramid
+from app.worker.writer import CaptureWriter
+
+# 크롤링 중 블룸 필터를 디스크에 저장하는 주기 (페이지 수)
+FRONTIER_CHECKPOINT_PAGES = 20
+
+# 디바이스 종류별 기본 크기와 에뮬레이션 설정 (모바일/태블릿은 모바일 UA, meta viewport, 터치)
+DEFAULT_DEVICES: Dict[str, Dict[str, Any]] = {
+    "desktop": {"width": 1920, "height": 1080},
+    "tablet": {"width": 768, "height": 1024, "user_agent": TABLET_USER_AGENT, "is_mobile": True, "has_touch": True},
+    "mobile": {"width": 375, "height": 667, "user_agent": MOBILE_USER_AGENT, "is_mobile": True, "has_touch": True},
+}
+OTHER_DEVICE = {"width": 1280, "height": 720}
+
+
+@dataclass
+class PageRef:
+    """작업 중 사용하는 페이지 정보 (ORM 객체를 다시 읽지 않기 위함)"""
+    id: int
+    url: str
+    depth: int
+    title: Optional[str] = None
+
+
+async def process_capture(capture_id: int, db: AsyncSession) -> None:
+    """
+    워커가 리스를 획득한 캡처 작업 처리
+
+    상태는 리스 획득 시 이미 처리 중으로 바뀌어 있으며, db 는 워커가
+    작업마다 새로 연 AsyncSession 이다. DB 쓰기는 모두 이 작업의 코루틴에서만
+    순차적으로 수행한다 (AsyncSession 은 동시 사용 불가).
+    진행률과 결과 행은 CaptureWriter 가 모아서 기록하며, 완료/실패 전에 남은
+    쓰기를 모두 flush 한다.
+    """
+    # 캡처 정보 가져오기
+    capture_obj = await captures.aget(db, id=capture_id)
+    if not capture_obj:
+        return
+
+    writer = CaptureWriter(db, capture_id)
+    try:
+        website = await websites.aget(db, id=capture_obj.website_id)
+        if not website:
+            await captures.aupdate_error(db, id=capture_id, error="웹사이트 정보를 찾을 수 없습니다")
+            return
+
+        device_settings = await _get_device_settings(db, capture_obj.device_types)
+
+        # 디바이스 설정이 없으면 에러
+        if not device_settings:
+            await captures.aupdate_error(db, id=capture_id, error="유효한 디바이스 설정이 없습니다")
+            return
+
+        # 시작 URL이 없는 작업(이전 버전에서 생성)은 웹사이트 URL부터 캡처
+        root_url = capture_obj.url or website.url
+        if capture_obj.crawl:
+            error = await _crawl_website(writer, capture_obj, root_url, device_settings)
+        else:
+            error = await _capture_single_page(writer, capture_obj, root_url, device_settings)
+        await writer.flush()
+
+        if error:
+            await captures.aupdate_error(db, id=capture_id, error=error)
+            return
+
+        # 모든 캡처 완료
+        await captures.aupdate_completed(db, id=capture_id)
+
+    except Exception as e:
+        await db.rollback()
+        # 이미 끝난 페이지/스크린샷 결과는 남긴다
+        try:
+            await writer.flush()
+        except Exception:
+            await db.rollback()
+        await captures.aupdate_error(db, id=capture_id, error=f"캡처 처리 중 오류: {str(e)}")
+
+
+async def _get_device_settings(db: AsyncSession, device_types: List[str]) -> List[Dict[str, Any]]:
+    """디바이스 프로필 가져오기 (없으면 기본 크기 사용)
+
+    프로필에는 크기만 있으므로 User-Agent 와 모바일/터치 에뮬레이션은 이름이
+    mobile/tablet 인 디바이스에 기본값을 적용한다.
+    """
+    device_settings = []
+    for device_type in device_types:
+        defaults = DEFAULT_DEVICES.get(device_type.lower(), OTHER_DEVICE)
+        device = {"type": device_type, **defaults}
+        profile = await device_profiles.aget_by_name(db, name=device_type)
+        if profile:
+            device.update(width=profile.width, height=profile.height)
+        device_settings.append(device)
+    return device_settings
+
+
+async def _create_pages(
+    writer: CaptureWriter, capture_obj: Capture, urls: List[str], depth: int
+) -> List[PageRef]:
+    """같은 깊이의 페이지들을 한 번의 INSERT 로 생성"""
+    now = datetime.now()
+    rows = [
+        {
+            "url": url,
+            "website_id": capture_obj.website_id,
+            "capture_id": capture_obj.id,
+            "created_at": now,
+            "title": None,  # 캡처 후 업데이트
+            "status": PageStatus.PENDING.value,
+            "depth": depth
+        }
+        for url in urls
+    ]
+    page_ids = await writer.create_pages(rows)
+    return [PageRef(id=page_id, url=url, depth=depth) for page_id, url in zip(page_ids, urls)]
+
+
+async def _capture_single_page(
+    writer: CaptureWriter, capture_obj: Capture, url: str, device_settings: List[Dict[str, Any]]
+) -> Optional[str]:
+    """시작 URL 한 페이지만 캡처. 실패 시 오류 메시지 반환"""
+    # 총 처리할 디바이스 수
+    total_devices = len(device_settings)
+    completed_devices = 0
+
+    async def on_device_done() -> None:
+        nonlocal completed_devices
+        completed_devices += 1
+
+        # 진행률 업데이트
+        progress = int((completed_devices / total_devices) * 100)
+        await writer.set_progress(progress)
+
+    [page] = await _create_pages(writer, capture_obj, [url], depth=0)
+    _, error = await _capture_page(writer, capture_obj, page, device_settings, on_device_done)
+    return error
+
+
+async def _crawl_website(
+    writer: CaptureWriter, capture_obj: Capture, root_url: str, device_settings: List[Dict[str, Any]]
+) -> Optional[str]:
+    """시작 URL부터 발견한 링크를 너비 우선으로 따라가며 캡처
+
+    발견한 링크는 max_pages 한도 안에서 곧바로 같은 캡처의 Page 행(pending)으로
+    등록되므로 pageCount/completedPageCount 가 실제 진행 상황을 나타낸다.
+    대기열과 방문 집합은 디스크 기반 URLFrontier 에 저장되어 워커가 재시작되면
+    이어서 진행하며, 다른 노드에서 재개하는 경우 DB의 Page 행으로 복원한다.
+    시작 페이지 캡처가 실패하면 오류 메시지를 반환하고, 하위 페이지 실패는
+    해당 페이지만 실패 처리한다.
+    프론티어 항목은 해당 페이지의 결과가 DB에 커밋된 뒤에 완료 처리한다.
+    프론티어(SQLite) 접근은 스레드에서 실행하고, 페이지 하나마다 한 번만 커밋한다.
+    """
+    options = capture_obj.crawl
+    max_depth = options.get("max_depth", 1)
+    max_pages = max(1, options.get("max_pages", 20))
+    scope = CrawlScope(
+        root_url,
+        same_domain=options.get("same_domain", True),
+        include_patterns=options.get("include_patterns"),
+        exclude_patterns=options.get("exclude_patterns"),
+    )
+
+    frontier = await asyncio.to_thread(
+        URLFrontier,
+        Path(settings.CRAWL_FRONTIER_DIR) / f"capture_{capture_obj.id}.sqlite3",
+        bloom_capacity=settings.CRAWL_BLOOM_CAPACITY,
+        bloom_error_rate=settings.CRAWL_BLOOM_ERROR_RATE,
+    )
+    # 결과가 커밋되어 완료 처리할 프론티어 항목 (다음 프론티어 갱신 때 함께 기록)
+    completed_items: List[FrontierItem] = []
+
+    def take_completed() -> List[FrontierItem]:
+        items = completed_items[:]
+        completed_items.clear()
+        return items
+
+    def update_frontier(
+        new_pages: List[PageRef], seen_urls: List[str], done_items: List[FrontierItem], checkpoint: bool = False
+    ) -> None:
+        """페이지 하나를 처리하며 생긴 프론티어 변경을 한 트랜잭션으로 기록 (스레드에서 실행)"""
+        for new_page in new_pages:
+            frontier.push(crawl_key(new_page.url), new_page.depth, {"page_id": new_page.id, "url": new_page.url})
+        for url in seen_urls:
+            frontier.mark_seen(url)
+        for done_item in done_items:
+            frontier.done(done_item)
+        if checkpoint:
+            frontier.checkpoint()
+        else:
+            frontier.commit()
+
+    def new_links(links: List[str]) -> List[str]:
+        """범위 안에서 아직 방문하지 않은 링크 (스레드에서 실행)"""
+        return [url for url in scope.filter_links(links) if frontier.is_new(url)]
+
+    finished = False
+    try:
+        existing_pages = await pages.aget_by_capture(writer.db, capture_id=capture_obj.id)
+        processed_ids = {page.id for page in existing_pages if page.status != PageStatus.PENDING.value}
+        if frontier.seen_count == 0:
+            if existing_pages:
+                # 프론티어 파일이 없는 노드에서 재개: DB의 페이지로 복원
+                pending_pages = [
+                    PageRef(id=page.id, url=page.url, depth=page.depth)
+                    for page in existing_pages
+                    if page.status == PageStatus.PENDING.value
+                ]
+                seen_urls = [crawl_key(page.url) for page in existing_pages]
+                await asyncio.to_thread(update_frontier, pending_pages, seen_urls, [])
+            else:
+                root_pages = await _create_pages(writer, capture_obj, [root_url], depth=0)
+                await asyncio.to_thread(update_frontier, root_pages, [], [])
+
+        scheduled_pages = max(1, len(existing_pages))
+        completed_pages = len(processed_ids)
+
+        while True:
+            item = await asyncio.to_thread(frontier.pop)
+            if item is None:
+                break
+            if item.data.get("page_id") in processed_ids:
+                # 중단 직전에 이미 처리된 페이지
+                completed_items.append(item)
+                continue
+            page = PageRef(id=item.data["page_id"], url=item.data.get("url", item.url), depth=item.depth)
+
+            links, error = await _capture_page(writer, capture_obj, page, device_settings)
+            if error and page.depth == 0:
+                finished = True
+                return error
+            completed_pages += 1
+
+            # 범위 안의 새 링크를 다음 깊이의 페이지로 예약
+            new_pages: List[PageRef] = []
+            blocked_urls: List[str] = []
+            if not error and page.depth < max_depth and scheduled_pages < max_pages:
+                new_urls: List[str] = []
+                for url in await asyncio.to_thread(new_links, links):
+                    if scheduled_pages + len(new_urls) >= max_pages:
+                        break
+                    if not await politeness.allowed(url):
+                        # robots.txt 가 막은 URL은 다시 확인하지 않도록 방문 처리만
+                        blocked_urls.append(url)
+                        continue
+                    new_urls.append(url)
+                # 이 페이지에서 찾은 링크는 한 번에 Page 행으로 생성
+                if new_urls:
+                    new_pages = await _create_pages(writer, capture_obj, new_urls, depth=page.depth + 1)
+                scheduled_pages += len(new_urls)
+            writer.after_flush(lambda item=item: completed_items.append(item))
+
+            await asyncio.to_thread(
+                update_frontier, new_pages, blocked_urls, take_completed(),
+                completed_pages % FRONTIER_CHECKPOINT_PAGES == 0,
+            )
+
+            # 진행률 업데이트 (예약된 페이지 기준)
+            progress = int((completed_pages / scheduled_pages) * 100)
+            await writer.set_progress(progress)
+
+        await writer.flush()
+        finished = True
+        return None
+    finally:
+        # 정상 종료 시 프론티어 삭제, 중단(취소/예외) 시 재개를 위해 보존
+        if finished:
+            await asyncio.to_thread(frontier.destroy)
+        else:
+            done_items = take_completed()
+
+            def close_frontier() -> None:
+                update_frontier([], [], done_items)
+                frontier.close()
+
+            await asyncio.to_thread(close_frontier)
+
+
+async def _find_reusable_results(
+    db: AsyncSession, keys: List[str], max_age: int
+) -> List[Optional[Dict[str, Any]]]:
+    """렌더링 키별로 max_age 초 안에 끝난 같은 캡처 결과 (없으면 None)
+
+    이 프로세스의 결과를 먼저 보고, 없으면 다른 워커가 기록한 스크린샷을 찾는다.
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(keys)
+    if max_age <= 0:
+        return results
+
+    missing = []
+    for i, key in enumerate(keys):
+        result = render_coalescer.get(key, max_age)
+        if result is not None:
+            results[i] = _reused_result(result)
+        else:
+            missing.append(i)
+    if not missing:
+        return results
+
+    recent = await screenshots.aget_recent_by_render_keys(
+        db, render_keys=[keys[i] for i in missing], since=datetime.now() - timedelta(seconds=max_age)
+    )
+    found = {
+        i: recent[keys[i]]
+        for i in missing
+        if keys[i] in recent
+        and os.path.exists(recent[keys[i]].path)
+        and os.path.exists(recent[keys[i]].thumbnail_path)
+    }
+    saved_links = await _saved_links(db, list(found.values()))
+    for i, screenshot in found.items():
+        metadata = {key: value for key, value in (screenshot.metadata or {}).items() if key != "links"}
+        results[i] = _reused_result({
+            "screenshot_path": screenshot.path,
+            "thumbnail_path": screenshot.thumbnail_path,
+            "format": screenshot.format,
+            "tiles_path": screenshot.tiles_path,
+            "content_hash": screenshot.content_hash,
+            "thumbnail_hash": screenshot.thumbnail_hash,
+            "dhash": screenshot.dhash,
+            "phash": screenshot.phash,
+            "title": metadata.get("title"),
+            "links": saved_links.get(screenshot.page_id, []),
+            "metadata": metadata,
+        }, screenshot.id)
+    return results
+
+
+async def _saved_links(db: AsyncSession, screenshots_: List[Screenshot]) -> Dict[int, List[str]]:
+    """스크린샷들의 페이지별로 저장된 링크 (링크 그래프)
+
+    링크 그래프 도입 전에 저장된 스크린샷은 metadata 의 links 를 사용한다.
+    """
+    saved = await page_links.aget_outbound_urls(db, page_ids=list({s.page_id for s in screenshots_}))
+    for screenshot in screenshots_:
+        legacy = (screenshot.metadata or {}).get("links")
+        if legacy and screenshot.page_id not in saved:
+            saved[screenshot.page_id] = legacy
+    return saved
+
+
+def _reused_result(result: Dict[str, Any], screenshot_id: Optional[int] = None) -> Dict[str, Any]:
+    """다른 요청의 캡처 결과를 이 요청의 결과로 사용 (파일은 공유, metadata 에 표시)"""
+    metadata = {**result.get("metadata", {}), "reused": True}
+    if screenshot_id is not None:
+        metadata["reusedScreenshotId"] = screenshot_id
+    return {**result, "metadata": metadata}
+
+
+async def _check_unchanged(
+    db: AsyncSession, capture_obj: Capture, page: PageRef, keys: List[str]
+) -> Tuple[Optional[Page], List[str], Dict[str, Any]]:
+    """증분 캡처: 이전 버전과 내용이 같은지 지문으로 확인
+
+    이전 버전의 ETag/Last-Modified 로 조건부 요청을 보내고, 304 가 아니면 정규화한
+    HTML 해시를 비교한다. 내용이 같아도 이전 버전의 스크린샷이 지금의 디바이스와
+    캡처 옵션(렌더링 키)을 모두 포함할 때만 그 버전을 가리킨다.
+
+    Returns:
+        (스크린샷이 있는 이전 버전 페이지 - 새로 캡처해야 하면 None,
+         그 페이지에서 수집했던 링크, 이 페이지에 기록할 지문)
+    """
+    previous = await pages.aget_latest_version(
+        db, website_id=capture_obj.website_id, url=page.url, exclude_capture_id=capture_obj.id
+    )
+    async with politeness.slot(page.url):
+        fingerprint = await fingerprinter.fetch(
+            page.url,
+            etag=previous.etag if previous else None,
+            last_modified=previous.last_modified if previous else None,
+        )
+    if fingerprint is None:
+        return None, [], {}
+    values = fingerprint.as_values()
+    if previous is None or not fingerprint.matches(previous.dom_hash):
+        return None, [], values
+    values["dom_hash"] = previous.dom_hash
+
+    # 이전 버전도 바뀌지 않은 페이지였다면 스크린샷이 있는 버전을 따라감
+    source = previous
+    if previous.status == PageStatus.UNCHANGED.value:
+        source = await pages.aget(db, id=previous.previous_page_id) if previous.previous_page_id else None
+    if source is None:
+        return None, [], values
+    source_screenshots = await screenshots.aget_by_page(db, page_id=source.id)
+    if not set(keys) <= {screenshot.render_key for screenshot in source_screenshots}:
+        return None, [], values
+
+    links = (await _saved_links(db, source_screenshots)).get(source.id, [])
+    return source, links, values
+
+
+async def _capture_page(
+    writer: CaptureWriter,
+    capture_obj: Capture,
+    page: PageRef,
+    device_settings: List[Dict[str, Any]],
+    on_device_done: Optional[Callable[[], Awaitable[None]]] = None,
+) -> Tuple[List[str], Optional[str]]:
+    """한 페이지를 모든 디바이스로 캡처하고 결과 저장
+
+    같은 URL/뷰포트/옵션의 캡처가 허용 나이(result_max_age_seconds) 안에 끝났거나
+    진행 중이면 새로 렌더링하지 않고, 그 결과 파일을 가리키는 Screenshot 행만 만든다.
+    증분 캡처에서 이전 버전과 내용이 같으면 스크린샷 없이 페이지를 unchanged 로
+    표시하고 이전 버전(previous_page_id)을 가리킨다.
+
+    Returns:
+        (페이지에서 수집한 링크 목록, 실패 시 오류 메시지)
+    """
+    links: List[str] = []
+    http_status: Optional[int] = None
+
+    keys = [
+        render_key(
+            page.url,
+            device,
+            capture_full_page=capture_obj.capture_full_page,
+            capture_dynamic_elements=capture_obj.capture_dynamic_elements,
+            image_format=capture_obj.image_format,
+            image_quality=capture_obj.image_quality,
+            request_policy=capture_obj.request_policy,
+            load_strategy=capture_obj.load_strategy,
+            wait_for_selector=capture_obj.wait_for_selector,
+        )
+        for device in device_settings
+    ]
+    fingerprint: Dict[str, Any] = {}
+    if capture_obj.incremental:
+        source, links, fingerprint = await _check_unchanged(writer.db, capture_obj, page, keys)
+        if source is not None:
+            page.title = source.title
+            await writer.update_page(page.id, {
+                "status": PageStatus.UNCHANGED.value,
+                "previous_page_id": source.id,
+                "title": source.title,
+                "http_status": source.http_status,
+                **fingerprint,
+            })
+            # 링크 그래프는 캡처별로 완결되도록 이전 버전의 링크를 이 페이지에도 기록
+            await writer.set_links(page.id, links)
+            if on_device_done:
+                for _ in device_settings:
+                    await on_device_done()
+            return links, None
+
+    max_age = capture_obj.result_max_age_seconds
+    if max_age is None:
+        max_age = settings.CAPTURE_RESULT_TTL_SECONDS
+    reusable = await _find_reusable_results(writer.db, keys, max_age)
+    pending = [i for i, result in enumerate(reusable) if result is None]
+
+    # 브라우저를 쓰기 전에 HTTP 요청으로 확인해 렌더링할 수 없는 것이 확실한 URL은 바로 건너뜀
+    # (타임아웃/TLS 오류/5xx 는 사전 확인만의 문제일 수 있으므로 브라우저로 시도)
+    if pending and settings.PREFLIGHT_ENABLED:
+        async with politeness.slot(page.url):
+            check = await preflight.check(page.url)
+        if check.should_skip:
+            await writer.update_page(page.id, {
+                "status": PageStatus.SKIPPED.value,
+                "error": check.reason,
+                "http_status": check.status_code,
+            })
+            return links, check.reason
+
+    # 같은 URL/디바이스의 이전 스크린샷 다음 버전으로 저장 (내용이 같아 건너뛴 캡처는 버전을 늘리지 않음)
+    versions = await screenshots.aget_latest_versions(
+        writer.db, website_id=capture_obj.website_id, url=page.url, exclude_capture_id=capture_obj.id
+    )
+
+    # 작업 단위 동시 캡처 수 제한 (도메인별 제한은 politeness, 전역 제한은 capture_website 에서 적용)
+    job_semaphore = asyncio.Semaphore(settings.CAPTURE_JOB_CONCURRENCY)
+
+    async def postprocess(capture_result: Dict[str, Any]) -> Dict[str, Any]:
+        # 브라우저/도메인 슬롯을 반납한 뒤 파일을 내용 해시 경로로 옮기고 타일 피라미드 생성
+        capture_result = await asyncio.to_thread(blob_store.adopt_result, capture_result)
+        tiles = await create_tile_pyramid(capture_result["screenshot_path"])
+        capture_result["tiles_path"] = tiles["descriptor"] if tiles else None
+        return capture_result
+
+    async def run_device(i: int) -> List[Tuple[int, Optional[Dict], Optional[Exception]]]:
+        device = device_settings[i]
+
+        async def render() -> Dict[str, Any]:
+            async with politeness.slot(page.url):
+                capture_result = await capture_website(
+                    url=page.url,
+                    device_type=device["type"],
+                    width=device["width"],
+                    height=device["height"],
+                    capture_full_page=capture_obj.capture_full_page,
+                    capture_dynamic_elements=capture_obj.capture_dynamic_elements,
+                    image_format=capture_obj.image_format,
+                    image_quality=capture_obj.image_quality,
+                    request_policy=capture_obj.request_policy,
+                    load_strategy=capture_obj.load_strategy,
+                    wait_for_selector=capture_obj.wait_for_selector
+                )
+            return await postprocess(capture_result)
+
+        async with job_semaphore:
+            try:
+                # 같은 키로 진행 중인 캡처가 있으면 그 결과를 함께 사용
+                capture_result, shared = await render_coalescer.run(keys[i], render)
+                return [(i, _reused_result(capture_result) if shared else capture_result, None)]
+            except Exception as e:
+                return [(i, None, e)]
+
+    async def run_shared_render() -> List[Tuple[int, Optional[Dict], Optional[Exception]]]:
+        first_index = {}
+        for i in pending:
+            first_index.setdefault(keys[i], i)
+
+        async def render(render_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+            async with politeness.slot(page.url):
+                capture_results = await capture_website_viewports(
+                    url=page.url,
+                    devices=[device_settings[first_index[key]] for key in render_keys],
+                    capture_full_page=capture_obj.capture_full_page,
+                    capture_dynamic_elements=capture_obj.capture_dynamic_elements,
+                    image_format=capture_obj.image_format,
+                    image_quality=capture_obj.image_quality,
+                    request_policy=capture_obj.request_policy,
+                    load_strategy=capture_obj.load_strategy,
+                    wait_for_selector=capture_obj.wait_for_selector
+                )
+            return {key: await postprocess(result) for key, result in zip(render_keys, capture_results)}
+
+        try:
+            # 같은 키로 진행 중인 캡처는 그 결과를 함께 사용하고, 나머지 디바이스만 한 번에 렌더링
+            rendered = await render_coalescer.run_many([keys[i] for i in pending], render)
+            return [
+                (i, _reused_result(result) if shared else result, None)
+                for i, (result, shared) in zip(pending, rendered)
+            ]
+        except Exception as e:
+            return [(pending[0], None, e)]
+
+    async def reused() -> List[Tuple[int, Optional[Dict], Optional[Exception]]]:
+        return [(i, result, None) for i, result in enumerate(reusable) if result is not None]
+
+    tasks = [asyncio.create_task(reused())]
+    if pending and capture_obj.reuse_render:
+        # 페이지를 한 번만 렌더링하고 뷰포트만 바꿔가며 캡처
+        tasks.append(asyncio.create_task(run_shared_render()))
+    else:
+        # 각 디바이스 타입별 캡처를 병렬 실행
+        tasks.extend(asyncio.create_task(run_device(i)) for i in pending)
+    try:
+        # 완료 순서대로 결과를 받아 이 코루틴에서만 DB에 기록
+        for finished in asyncio.as_completed(tasks):
+            for i, capture_result, error in await finished:
+                device = device_settings[i]
+                if error is not None:
+                    await writer.update_page(page.id, {"status": PageStatus.FAILED.value, "error": str(error)})
+                    return links, f"디바이스 {device['type']} 캡처 중 오류: {str(error)}"
+
+                # 페이지 제목 업데이트 (처음 완료된 캡처에서만)
+                if page.title is None and capture_result.get("title"):
+                    page.title = capture_result["title"]
+                    await writer.update_page(page.id, {"title": page.title})
+                if not links:
+                    links = capture_result.get("links", [])
+                if http_status is None:
+                    http_status = capture_result.get("metadata", {}).get("statusCode")
+
+                # 스크린샷 저장 (재사용한 결과는 같은 파일을 가리킴)
+                screenshot_data = {
+                    "path": capture_result["screenshot_path"],
+                    "thumbnail_path": capture_result["thumbnail_path"],
+                    "created_at": datetime.now(),
+                    "page_id": page.id,
+                    "capture_id": capture_obj.id,
+                    "device_type": device["type"],
+                    "width": device["width"],
+                    "height": device["height"],
+                    "version": versions.get(device["type"], 0) + 1,
+                    "format": capture_result["format"],
+                    "tiles_path": capture_result.get("tiles_path"),
+                    "content_hash": capture_result.get("content_hash"),
+                    "thumbnail_hash": capture_result.get("thumbnail_hash"),
+                    "render_key": keys[i],
+                    "dhash": capture_result.get("dhash"),
+                    "phash": capture_result.get("phash"),
+                    "metadata": capture_result.get("metadata", {})
+                }
+
+                await writer.add_screenshot(screenshot_data)
+
+                if on_device_done:
+                    await on_device_done()
+    finally:
+        # 실패로 빠져나온 경우 남은 캡처 취소
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    await writer.set_links(page.id, links)
+    await writer.update_page(page.id, {"status": PageStatus.COMPLETE.value, "http_status": http_status, **fingerprint})
+    return links, None
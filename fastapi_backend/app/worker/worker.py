@@ -0,0 +1,158 @@
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.crud import captures
+from app.db.session import AsyncSessionLocal
+from app.worker.blob_gc import collect_garbage
+from app.worker.capture_job import process_capture
+
+logger = logging.getLogger(__name__)
+
+
+class CaptureWorker:
+    """Postgres 기반 캡처 작업 큐 워커
+
+    pending 상태의 Capture 행을 FOR UPDATE SKIP LOCKED 로 리스를 걸어 가져오고,
+    처리하는 동안 하트비트로 리스를 연장한다. 워커가 죽어 하트비트가 끊긴
+    작업은 리스 만료 후 다른 워커가 다시 가져간다. 여러 노드에서 별도
+    프로세스로 띄워 부하를 나눌 수 있다.
+    """
+
+    def __init__(
+        self,
+        worker_id: Optional[str] = None,
+        concurrency: int = settings.WORKER_CONCURRENCY,
+        lease_seconds: int = settings.WORKER_LEASE_SECONDS,
+        heartbeat_seconds: int = settings.WORKER_HEARTBEAT_SECONDS,
+        poll_seconds: float = settings.WORKER_POLL_SECONDS,
+        max_attempts: int = settings.WORKER_MAX_ATTEMPTS,
+    ):
+        """워커 초기화
+
+        Args:
+            worker_id: 리스 소유자로 기록될 워커 ID (없으면 호스트명:PID 기반 생성)
+            concurrency: 동시에 처리할 캡처 작업 수
+            lease_seconds: 리스 유효 시간 (초)
+            heartbeat_seconds: 하트비트 간격 (초)
+            poll_seconds: 작업이 없을 때 폴링 간격 (초)
+            max_attempts: 작업당 최대 시도 횟수
+        """
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.concurrency = max(1, concurrency)
+        self.lease_seconds = lease_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.poll_seconds = poll_seconds
+        self.max_attempts = max_attempts
+        self._jobs: Dict[int, asyncio.Task] = {}
+        self._stopping = asyncio.Event()
+
+    async def run(self) -> None:
+        """작업 폴링 루프 (stop() 호출 시 남은 작업을 마치고 종료)"""
+        logger.info(f"캡처 워커 시작: {self.worker_id}")
+        gc_task = asyncio.create_task(self._collect_garbage()) if settings.BLOB_GC_ENABLED else None
+        try:
+            while not self._stopping.is_set():
+                claimed = False
+                if len(self._jobs) < self.concurrency:
+                    try:
+                        capture_id = await self._claim()
+                    except Exception as e:
+                        logger.error(f"작업 획득 오류: {str(e)}")
+                        capture_id = None
+                    if capture_id is not None:
+                        claimed = True
+                        task = asyncio.create_task(self._run_job(capture_id))
+                        self._jobs[capture_id] = task
+                        task.add_done_callback(lambda _, cid=capture_id: self._jobs.pop(cid, None))
+
+                # 방금 작업을 가져왔고 여유 슬롯이 있으면 바로 다음 작업 시도
+                if claimed and len(self._jobs) < self.concurrency:
+                    continue
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if gc_task:
+                gc_task.cancel()
+                await asyncio.gather(gc_task, return_exceptions=True)
+            if self._jobs:
+                await asyncio.gather(*self._jobs.values(), return_exceptions=True)
+            logger.info(f"캡처 워커 종료: {self.worker_id}")
+
+    def stop(self) -> None:
+        """새 작업 획득 중단 요청"""
+        self._stopping.set()
+
+    async def _claim(self) -> Optional[int]:
+        """만료된 작업 정리 후 다음 작업의 리스 획득"""
+        async with AsyncSessionLocal() as db:
+            failed = await captures.afail_exhausted(db, max_attempts=self.max_attempts)
+            if failed:
+                logger.warning(f"재시도 횟수 초과로 실패 처리된 캡처: {failed}건")
+            capture = await captures.aclaim_next(db, worker_id=self.worker_id, lease_seconds=self.lease_seconds)
+            return capture.id if capture else None
+
+    async def _heartbeat(self, capture_id: int) -> bool:
+        async with AsyncSessionLocal() as db:
+            return await captures.aheartbeat(
+                db, id=capture_id, worker_id=self.worker_id, lease_seconds=self.lease_seconds
+            )
+
+    async def _release(self, capture_id: int) -> None:
+        async with AsyncSessionLocal() as db:
+            await captures.arelease(
+                db, id=capture_id, worker_id=self.worker_id, max_attempts=self.max_attempts
+            )
+
+    async def _collect_garbage(self) -> None:
+        """BLOB_GC_INTERVAL_SECONDS 마다 참조되지 않는 저장소 파일 삭제 (여러 워커가 나눠서 처리)"""
+        while not self._stopping.is_set():
+            try:
+                async with AsyncSessionLocal() as db:
+                    stats = await collect_garbage(db)
+                if stats["deleted"] or stats["orphans"]:
+                    logger.info(f"저장소 GC: {stats}")
+            except Exception as e:
+                logger.error(f"저장소 GC 오류: {str(e)}")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=settings.BLOB_GC_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _run_job(self, capture_id: int) -> None:
+        """작업 하나를 처리하며 주기적으로 리스 연장"""
+        logger.info(f"캡처 작업 시작: {capture_id}")
+        job = asyncio.create_task(self._process(capture_id))
+        try:
+            while not job.done():
+                done, _ = await asyncio.wait({job}, timeout=self.heartbeat_seconds)
+                if done:
+                    break
+                try:
+                    still_owned = await self._heartbeat(capture_id)
+                except Exception as e:
+                    # 일시적인 DB 오류는 리스가 만료되기 전까지 재시도
+                    logger.warning(f"하트비트 오류 ({capture_id}): {str(e)}")
+                    continue
+                if not still_owned:
+                    logger.warning(f"리스를 잃어 작업 중단: {capture_id}")
+                    job.cancel()
+                    break
+            await asyncio.gather(job, return_exceptions=True)
+        finally:
+            try:
+                await self._release(capture_id)
+            except Exception as e:
+                logger.error(f"리스 해제 오류 ({capture_id}): {str(e)}")
+            logger.info(f"캡처 작업 종료: {capture_id}")
+
+    async def _process(self, capture_id: int) -> None:
+        """작업 전용 세션으로 캡처 처리"""
+        async with AsyncSessionLocal() as db:
+            await process_capture(capture_id, db)
@@ -0,0 +1,180 @@
+import asyncio
+import logging
+import os
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import insert, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud.link import page_links
+from app.models.blob import Blob
+from app.models.capture import Capture
+from app.models.page import Page
+from app.models.screenshot import Screenshot
+from app.utils.blob_store import blob_store
+from app.utils.crawl import crawl_key
+
+logger = logging.getLogger(__name__)
+
+
+class CaptureWriter:
+    """캡처 작업의 DB 쓰기를 모아서 처리하는 write-behind 버퍼
+
+    - 진행률: 최신 값만 기억해 두고 progress_interval 마다 최대 한 번만 기록
+    - 스크린샷 INSERT / 페이지 UPDATE / 링크 간선 INSERT: 버퍼에 모았다가 batch_size 또는
+      flush_interval 에 도달하면 다중 행 INSERT / 일괄 UPDATE 로 한 트랜잭션에 기록
+      (행마다 commit/refresh 하지 않음)
+
+    작업이 끝나거나 실패하면 반드시 flush() 를 호출해 남은 쓰기를 기록해야 한다.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        capture_id: int,
+        progress_interval: float = settings.CAPTURE_PROGRESS_INTERVAL_SECONDS,
+        batch_size: int = settings.CAPTURE_WRITE_BATCH_SIZE,
+        flush_interval: float = settings.CAPTURE_FLUSH_INTERVAL_SECONDS,
+    ):
+        """버퍼 초기화
+
+        Args:
+            db: 작업 전용 AsyncSession
+            capture_id: 캡처 ID
+            progress_interval: 진행률 기록 최소 간격 (초)
+            batch_size: 이 개수만큼 쌓이면 즉시 기록
+            flush_interval: 마지막 기록 후 이 시간이 지나면 기록 (초)
+        """
+        self.db = db
+        self.capture_id = capture_id
+        self.progress_interval = progress_interval
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+        self._screenshots: List[Dict[str, Any]] = []
+        self._page_updates: Dict[int, Dict[str, Any]] = {}
+        self._links: Dict[int, List[str]] = {}
+        self._after_flush: List[Callable[[], None]] = []
+        self._progress: Optional[float] = None
+        self._progress_written_at = 0.0
+        self._flushed_at = self._now()
+
+    @staticmethod
+    def _now() -> float:
+        return asyncio.get_running_loop().time()
+
+    async def create_pages(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """페이지 여러 개를 다중 행 INSERT 로 즉시 생성하고 ID 목록 반환 (rows 와 같은 순서)
+
+        크롤링 대기열에 페이지 ID가 필요하므로 버퍼링하지 않는다.
+        링크 그래프에서 찾을 수 있도록 페이지 URL을 인터닝해 url_id 를 채운다.
+        """
+        if not rows:
+            return []
+        url_ids = await page_links.aintern_urls(self.db, urls=[crawl_key(row["url"]) for row in rows])
+        rows = [{**row, "url_id": url_ids.get(crawl_key(row["url"]))} for row in rows]
+        result = await self.db.execute(
+            insert(Page).returning(Page.id, sort_by_parameter_order=True), rows
+        )
+        ids = list(result.scalars().all())
+        await self.db.commit()
+        return ids
+
+    async def add_screenshot(self, row: Dict[str, Any]) -> None:
+        """스크린샷 행 추가 (버퍼링)"""
+        self._screenshots.append(row)
+        await self._maybe_flush()
+
+    async def update_page(self, page_id: int, values: Dict[str, Any]) -> None:
+        """페이지 컬럼 변경 (같은 페이지의 변경은 하나로 합쳐짐)"""
+        self._page_updates.setdefault(page_id, {}).update(values)
+        await self._maybe_flush()
+
+    async def set_links(self, page_id: int, links: List[str]) -> None:
+        """페이지에서 수집한 링크 기록 (버퍼링, 정규화/인터닝은 flush 에서 한 번에)"""
+        if links:
+            self._links[page_id] = links
+            await self._maybe_flush()
+
+    async def set_progress(self, progress: float) -> None:
+        """진행률 변경 (progress_interval 에 한 번만 기록)"""
+        self._progress = progress
+        if self._now() - self._progress_written_at >= self.progress_interval:
+            await self.flush()
+        else:
+            await self._maybe_flush()
+
+    def after_flush(self, callback: Callable[[], None]) -> None:
+        """지금까지 버퍼에 쌓인 쓰기가 커밋된 뒤 실행할 콜백 등록"""
+        self._after_flush.append(callback)
+
+    async def _maybe_flush(self) -> None:
+        pending = len(self._screenshots) + len(self._page_updates) + len(self._links)
+        if pending >= self.batch_size or (
+            pending and self._now() - self._flushed_at >= self.flush_interval
+        ):
+            await self.flush()
+
+    async def _add_blob_refs(self, screenshots: List[Dict[str, Any]]) -> None:
+        """새 스크린샷 행이 가리키는 저장소 파일의 참조 수 증가 (없으면 Blob 행 생성)"""
+        refs: Counter = Counter()
+        paths: Dict[str, str] = {}
+        for row in screenshots:
+            for hash_key, path_key in (("content_hash", "path"), ("thumbnail_hash", "thumbnail_path")):
+                content_hash, path = row.get(hash_key), row.get(path_key)
+                if content_hash and path and blob_store.owns(path):
+                    refs[content_hash] += 1
+                    paths[content_hash] = path
+        if not refs:
+            return
+
+        values = []
+        for content_hash, count in sorted(refs.items()):
+            try:
+                size = os.path.getsize(paths[content_hash])
+            except OSError:
+                size = 0
+            values.append({"hash": content_hash, "path": paths[content_hash], "size": size, "ref_count": count})
+        stmt = pg_insert(Blob).values(values)
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[Blob.hash], set_={"ref_count": Blob.ref_count + stmt.excluded.ref_count}
+            )
+        )
+
+    async def flush(self) -> None:
+        """버퍼에 쌓인 쓰기를 한 트랜잭션으로 기록"""
+        screenshots, self._screenshots = self._screenshots, []
+        page_updates, self._page_updates = self._page_updates, {}
+        links, self._links = self._links, {}
+        callbacks, self._after_flush = self._after_flush, []
+        progress, self._progress = self._progress, None
+
+        if screenshots:
+            # 테이블 기준 INSERT: executemany 가 다중 행 VALUES 로 묶여 실행됨
+            await self.db.execute(insert(Screenshot.__table__), screenshots)
+            await self._add_blob_refs(screenshots)
+        if page_updates:
+            # 기본 키 기준 일괄 UPDATE
+            await self.db.execute(
+                update(Page), [{"id": page_id, **values} for page_id, values in page_updates.items()]
+            )
+        if links:
+            await page_links.aadd(self.db, links_by_page=links)
+        if progress is not None:
+            await self.db.execute(
+                update(Capture).where(Capture.id == self.capture_id).values(progress=progress)
+            )
+            self._progress_written_at = self._now()
+        if screenshots or page_updates or links or progress is not None:
+            await self.db.commit()
+        self._flushed_at = self._now()
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"flush 후 콜백 오류: {str(e)}")
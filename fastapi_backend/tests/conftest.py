@@ -0,0 +1,50 @@
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+# app.db.session 은 import 시 DATABASE_URL 로 엔진을 만들므로 테스트 DB를 기본값으로 사용
+if os.environ.get("TEST_DATABASE_URL"):
+    os.environ.setdefault("DATABASE_URL", os.environ["TEST_DATABASE_URL"])
+
+
+@pytest.fixture(scope="session")
+def database_url():
+    """DB가 필요한 테스트용 Postgres URL (TEST_DATABASE_URL 이 없거나 접속할 수 없으면 건너뜀)
+
+    테이블이 없으면 만들며, 테스트가 만든 행은 각 테스트가 정리한다.
+    """
+    url = os.environ.get("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL 이 설정되지 않았습니다")
+    engine = create_engine(url)
+    try:
+        with engine.connect():
+            pass
+    except OperationalError as e:
+        pytest.skip(f"테스트 DB에 접속할 수 없습니다: {e}")
+
+    from app.db.base import Base
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    return url
+
+
+@pytest.fixture
+def sync_engine(database_url):
+    engine = create_engine(database_url)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def async_session_factory(database_url):
+    """요청마다 새 연결을 여는 AsyncSession 팩토리 (TestClient 의 이벤트 루프와 연결을 공유하지 않음)"""
+    from app.db.session import _async_engine_args
+
+    async_url, connect_args = _async_engine_args(database_url)
+    engine = create_async_engine(async_url, connect_args=connect_args, poolclass=NullPool)
+    return async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
@@ -0,0 +1,193 @@
+import asyncio
+import threading
+
+from app.utils import asset_cache as asset_cache_module
+from app.utils.asset_cache import AssetCache, freshness_lifetime
+
+NOW = 1_700_000_000.0
+DATE = "Tue, 14 Nov 2023 22:13:20 GMT"  # NOW
+
+
+def test_freshness_lifetime_prefers_explicit_directives():
+    assert freshness_lifetime({"cache-control": "max-age=60, s-maxage=120"}, NOW, 86400) == 120
+    assert freshness_lifetime({"cache-control": "max-age=60", "expires": "Wed, 15 Nov 2023 00:00:00 GMT"}, NOW, 86400) == 60
+    assert freshness_lifetime({"date": DATE, "expires": "Tue, 14 Nov 2023 22:23:20 GMT"}, NOW, 86400) == 600
+    assert freshness_lifetime({"date": DATE, "expires": "0"}, NOW, 86400) == 0
+
+
+def test_freshness_lifetime_uses_last_modified_heuristic():
+    headers = {"date": DATE, "last-modified": "Tue, 14 Nov 2023 19:26:40 GMT"}  # 10000초 전
+    assert freshness_lifetime(headers, NOW, 86400) == 1000
+    assert freshness_lifetime(headers, NOW, 100) == 100
+    assert freshness_lifetime({}, NOW, 86400) == 0
+
+
+def test_freshness_lifetime_rejects_uncacheable_responses():
+    assert freshness_lifetime({"cache-control": "no-store"}, NOW, 86400) is None
+    assert freshness_lifetime({"cache-control": "private, max-age=60"}, NOW, 86400) is None
+    assert freshness_lifetime({"cache-control": "max-age=60", "vary": "*"}, NOW, 86400) is None
+    assert freshness_lifetime({"cache-control": "no-cache, max-age=60"}, NOW, 86400) == 0
+
+
+def test_vary_headers_select_stored_variant(tmp_path):
+    cache = AssetCache(tmp_path)
+    headers = {"cache-control": "max-age=60", "Vary": "Accept-Encoding, accept"}
+    assert cache.store("https://a.test/app.css", {"accept": "text/css"}, 200, headers, b"css")
+    assert cache.store("https://a.test/app.css", {"accept": "*/*"}, 200, headers, b"any")
+
+    entry = cache.lookup("https://a.test/app.css", {"accept": "text/css", "user-agent": "x"})
+    assert entry.body_path.read_bytes() == b"css"
+    assert entry.fresh and "content-length" not in entry.headers
+    assert cache.lookup("https://a.test/app.css", {"accept": "image/png"}) is None
+    assert cache._key("u", ["accept"], {"accept": "a"}) != cache._key("u", ["accept"], {"accept": "b"})
+    assert cache._vary_names({"vary": "Accept, accept-encoding,Accept"}) == ["accept", "accept-encoding"]
+    cache.close()
+
+
+def test_store_rejects_uncacheable_responses(tmp_path):
+    cache = AssetCache(tmp_path, max_entry_bytes=4)
+    assert not cache.store("https://a.test/x", {}, 500, {"cache-control": "max-age=60"}, b"")
+    assert not cache.store("https://a.test/x", {}, 200, {"cache-control": "max-age=60"}, b"12345")
+    assert not cache.store("https://a.test/x", {}, 200, {"cache-control": "no-cache"}, b"")
+    assert cache.store("https://a.test/x", {}, 200, {"cache-control": "no-cache", "etag": '"1"'}, b"")
+    cache.close()
+
+
+def test_lookup_batches_access_times_and_eviction_uses_them(tmp_path, monkeypatch):
+    monkeypatch.setattr(asset_cache_module, "ACCESS_FLUSH_SIZE", 1000)
+    cache = AssetCache(tmp_path, max_bytes=10)
+    headers = {"cache-control": "max-age=60"}
+    cache.store("https://a.test/1", {}, 200, headers, b"1111")
+    cache.store("https://a.test/2", {}, 200, headers, b"2222")
+
+    updates = []
+    cache.db.set_trace_callback(lambda sql: updates.append(sql) if sql.startswith("UPDATE") else None)
+    assert cache.lookup("https://a.test/1", {}) is not None
+    assert updates == []  # 조회는 기록하지 않음
+    cache.db.set_trace_callback(None)
+
+    # 저장 전에 모아 둔 조회 시각을 기록하므로 방금 조회한 1 대신 2 가 삭제됨
+    cache.store("https://a.test/3", {}, 200, headers, b"3333")
+    assert cache.lookup("https://a.test/1", {}) is not None
+    assert cache.lookup("https://a.test/2", {}) is None
+    assert cache.evictions == 1
+    cache.close()
+
+
+class _Response:
+    def __init__(self, status, headers, body=b""):
+        self.status = status
+        self.headers = headers
+        self._body = body
+
+    async def body(self):
+        return self._body
+
+
+class _Request:
+    url = "https://a.test/app.js"
+    method = "GET"
+
+    async def all_headers(self):
+        return {"accept": "*/*"}
+
+
+class _Route:
+    def __init__(self, responses):
+        self.request = _Request()
+        self.responses = list(responses)
+        self.fetched = []
+        self.fulfilled = []
+        self.handled = []
+
+    async def fetch(self, headers=None):
+        self.fetched.append(headers)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    async def fulfill(self, status, headers, body):
+        self.fulfilled.append((status, body))
+
+    async def continue_(self):
+        self.handled.append("continue")
+
+    async def abort(self, error_code=None):
+        self.handled.append(f"abort:{error_code}")
+
+
+def test_handle_serves_hits_and_revalidates_off_the_event_loop(tmp_path, monkeypatch):
+    cache = AssetCache(tmp_path)
+    loop_thread = threading.get_ident()
+    threads = []
+    for name in ("lookup", "refresh"):
+        method = getattr(cache, name)
+
+        def wrapper(*args, _method=method):
+            threads.append(threading.get_ident())
+            return _method(*args)
+
+        monkeypatch.setattr(cache, name, wrapper)
+
+    async def scenario():
+        miss = _Route([_Response(200, {"cache-control": "max-age=0", "etag": '"v1"'}, b"js")])
+        assert await cache.handle(miss) == "miss"
+
+        stale = _Route([_Response(304, {"cache-control": "max-age=60"})])
+        assert await cache.handle(stale) == "revalidated"
+        assert stale.fetched[0]["if-none-match"] == '"v1"'
+        assert stale.fulfilled == [(200, b"js")]
+
+        hit = _Route([])
+        assert await cache.handle(hit) == "hit"
+        assert hit.fulfilled == [(200, b"js")]
+
+    asyncio.run(scenario())
+    assert len(threads) == 4 and loop_thread not in threads
+    cache.close()
+
+
+def test_handle_falls_back_when_fetch_fails(tmp_path):
+    cache = AssetCache(tmp_path)
+
+    async def scenario():
+        # 저장된 응답이 없으면 브라우저가 직접 요청하도록 넘김
+        missing = _Route([ConnectionError("reset")])
+        assert await cache.handle(missing) == "error"
+        assert missing.handled == ["continue"] and missing.fulfilled == []
+
+        cache.store(
+            "https://a.test/app.js", {"accept": "*/*"}, 200,
+            {"cache-control": "max-age=0", "etag": '"v1"'}, b"js",
+        )
+        # 재검증 요청이 실패하면 만료된 응답이라도 사용
+        stale = _Route([TimeoutError("timeout")])
+        assert await cache.handle(stale) == "stale"
+        assert stale.fetched[0]["if-none-match"] == '"v1"'
+        assert stale.fulfilled == [(200, b"js")] and stale.handled == []
+
+        # 304 후 본문 파일이 사라졌고 다시 요청도 실패하면 요청 실패 처리
+        cache.lookup("https://a.test/app.js", {"accept": "*/*"}).body_path.unlink()
+        broken = _Route([_Response(304, {}), ConnectionError("reset")])
+        assert await cache.handle(broken) == "error"
+        assert broken.handled == ["abort:failed"]
+
+    asyncio.run(scenario())
+    assert (cache.stale, cache.errors, cache.misses) == (1, 2, 0)
+    cache.close()
+
+
+def test_stats_are_shared_through_the_index(tmp_path):
+    worker = AssetCache(tmp_path)
+    headers = {"cache-control": "max-age=60"}
+    worker.store("https://a.test/app.js", {"accept": "*/*"}, 200, headers, b"1111")
+    assert asyncio.run(worker.handle(_Route([]))) == "hit"
+    worker.close()
+
+    # 요청을 처리하지 않은 다른 프로세스(API)에서도 워커의 통계가 보임
+    api = AssetCache(tmp_path)
+    stats = api.stats()
+    assert (stats["hits"], stats["stores"], stats["bytesServed"], stats["entries"]) == (1, 1, 4, 1)
+    assert stats["hitRatio"] == 1.0
+    api.close()
@@ -0,0 +1,84 @@
+import asyncio
+import os
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+if not os.environ.get("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL 이 설정되지 않았습니다", allow_module_level=True)
+
+from sqlalchemy import delete, select
+
+from app.models.blob import Blob
+from app.models.capture import Capture
+from app.models.page import Page
+from app.models.screenshot import Screenshot
+from app.models.website import Website
+from app.utils.blob_store import BlobStore
+from app.worker.blob_gc import collect_garbage
+
+GRACE = 3600
+
+
+def _age(path, seconds):
+    at = time.time() - seconds
+    os.utime(path, (at, at))
+
+
+def test_collect_garbage_respects_references_and_grace_period(tmp_path, async_session_factory):
+    store = BlobStore(tmp_path / "blobs")
+    files = {}
+    for name in ("referenced", "unreferenced", "recent", "orphan", "new_orphan"):
+        source = tmp_path / f"{name}.png"
+        source.write_bytes(f"{name}-{uuid.uuid4()}".encode())
+        files[name] = store.adopt(source)
+    for name in ("referenced", "unreferenced", "orphan"):
+        _age(files[name][0], GRACE * 2)
+    old = datetime.utcnow() - timedelta(seconds=GRACE * 2)
+
+    async def scenario():
+        async with async_session_factory() as db:
+            domain = f"{uuid.uuid4().hex[:12]}.example.com"
+            website = Website(name=domain, url=f"https://{domain}/", domain=domain)
+            db.add(website)
+            await db.flush()
+            capture = Capture(website_id=website.id, status="complete", device_types=["desktop"])
+            db.add(capture)
+            await db.flush()
+            page = Page(url=website.url, website_id=website.id, capture_id=capture.id, status="complete")
+            db.add(page)
+            await db.flush()
+            db.add(Screenshot(
+                path=str(files["referenced"][0]), thumbnail_path="t", width=1, height=1, device_type="desktop",
+                page_id=page.id, capture_id=capture.id, version=1, content_hash=files["referenced"][1],
+            ))
+            for name, created_at in (("referenced", old), ("unreferenced", old), ("recent", datetime.utcnow())):
+                path, content_hash = files[name]
+                db.add(Blob(hash=content_hash, path=str(path), size=path.stat().st_size, created_at=created_at))
+            await db.commit()
+
+            try:
+                stats = await collect_garbage(db, store, grace_seconds=GRACE, recheck_seconds=0, batch_size=2)
+                blobs = {
+                    blob.hash: blob for blob in (await db.execute(
+                        select(Blob).where(Blob.hash.in_([h for _, h in files.values()]))
+                    )).scalars()
+                }
+                return stats, blobs
+            finally:
+                await db.execute(delete(Screenshot).where(Screenshot.capture_id == capture.id))
+                await db.execute(delete(Page).where(Page.id == page.id))
+                await db.execute(delete(Capture).where(Capture.id == capture.id))
+                await db.execute(delete(Website).where(Website.id == website.id))
+                await db.execute(delete(Blob).where(Blob.hash.in_([h for _, h in files.values()])))
+                await db.commit()
+
+    stats, blobs = asyncio.run(scenario())
+
+    assert set(blobs) == {files["referenced"][1], files["recent"][1]}
+    assert blobs[files["referenced"][1]].ref_count == 1
+    assert stats["deleted"] >= 1 and stats["orphans"] == 1
+    remaining = {name for name, (path, _) in files.items() if path.exists()}
+    assert remaining == {"referenced", "recent", "new_orphan"}
@@ -0,0 +1,49 @@
+import os
+import time
+
+from app.utils.blob_store import BlobStore
+from app.utils.image import file_digest
+
+
+def _file(path, content: bytes):
+    path.write_bytes(content)
+    return path
+
+
+def test_adopt_moves_files_to_content_addressed_paths(tmp_path):
+    store = BlobStore(tmp_path / "blobs")
+    first, content_hash = store.adopt(_file(tmp_path / "a.png", b"same"))
+
+    assert content_hash == file_digest(first)
+    assert first == tmp_path / "blobs" / content_hash[:2] / content_hash[2:4] / f"{content_hash}.png"
+    assert store.owns(first) and not store.owns(tmp_path / "a.png")
+    assert store.adopt(first) == (first, content_hash)
+
+
+def test_adopt_deduplicates_and_refreshes_grace_period(tmp_path):
+    store = BlobStore(tmp_path / "blobs")
+    first, _ = store.adopt(_file(tmp_path / "a.png", b"same"))
+    old = time.time() - 7200
+    os.utime(first, (old, old))
+    assert not store.is_recent(first, 3600)
+
+    second, _ = store.adopt(_file(tmp_path / "b.png", b"same"))
+    assert second == first and not (tmp_path / "b.png").exists()
+    # 재사용된 파일은 GC 유예 기간이 다시 시작됨
+    assert store.is_recent(first, 3600)
+
+
+def test_iter_files_skips_recent_and_temporary_files(tmp_path):
+    store = BlobStore(tmp_path / "blobs")
+    old_path, old_hash = store.adopt(_file(tmp_path / "old.webp", b"old"))
+    store.adopt(_file(tmp_path / "new.webp", b"new"))
+    tmp_file = _file(old_path.with_name(f"{old_path.name}.1.tmp"), b"partial")
+    old = time.time() - 7200
+    for path in (old_path, tmp_file):
+        os.utime(path, (old, old))
+
+    assert list(store.iter_files(3600)) == [(old_hash, old_path)]
+    assert list(BlobStore(tmp_path / "missing").iter_files(0)) == []
+
+    assert store.delete(old_path) == 3
+    assert store.delete(old_path) == 0
@@ -0,0 +1,104 @@
+import asyncio
+import itertools
+
+import pytest
+
+from app.utils import browser_pool as browser_pool_module
+from app.utils.browser_pool import BrowserPool
+
+
+class FakeContext:
+    def __init__(self, browser, options):
+        self.browser = browser
+        self.options = options
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, number):
+        self.number = number
+        self.connected = True
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **kwargs):
+        context = FakeContext(self, kwargs)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+
+
+class FakePlaywright:
+    def __init__(self):
+        numbers = itertools.count()
+        self.launched = []
+        self.stopped = False
+
+        async def launch(headless):
+            browser = FakeBrowser(next(numbers))
+            self.launched.append(browser)
+            return browser
+
+        self.chromium = type("Chromium", (), {"launch": staticmethod(launch)})()
+
+    async def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def fake_playwright(monkeypatch):
+    playwright = FakePlaywright()
+
+    class Starter:
+        async def start(self):
+            return playwright
+
+    monkeypatch.setattr(browser_pool_module, "async_playwright", Starter)
+    return playwright
+
+
+def test_browser_pool_round_robin_and_relaunch(fake_playwright):
+    async def scenario():
+        pool = BrowserPool(size=2)
+        with pytest.raises(RuntimeError):
+            async with pool.new_context():
+                pass
+
+        await pool.start()
+        await pool.start()
+        assert pool.started
+        assert [browser.number for browser in fake_playwright.launched] == [0, 1]
+
+        used = []
+        for _ in range(3):
+            async with pool.new_context(viewport={"width": 800, "height": 600}) as context:
+                assert not context.closed
+                used.append(context)
+        assert [context.browser.number for context in used] == [0, 1, 0]
+        assert all(context.closed for context in used)
+        assert used[0].options == {"viewport": {"width": 800, "height": 600}}
+
+        # 연결이 끊긴 브라우저는 다음 차례에 다시 띄움
+        fake_playwright.launched[1].connected = False
+        async with pool.new_context() as context:
+            assert context.browser.number == 2
+        assert pool.browsers[1] is fake_playwright.launched[2]
+
+        # 캡처가 실패해도 컨텍스트는 닫힘
+        with pytest.raises(ValueError):
+            async with pool.new_context() as context:
+                raise ValueError("capture failed")
+        assert context.closed
+
+        await pool.close()
+        assert not pool.started and fake_playwright.stopped
+        assert not any(browser.connected for browser in fake_playwright.launched)
+
+    asyncio.run(scenario())
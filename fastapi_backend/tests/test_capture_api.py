@@ -0,0 +1,129 @@
+import os
+import uuid
+
+import pytest
+
+if not os.environ.get("TEST_DATABASE_URL"):
+    # 엔드포인트 모듈은 import 시 DB 엔진을 만듦
+    pytest.skip("TEST_DATABASE_URL 이 설정되지 않았습니다", allow_module_level=True)
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.api.api_v1.endpoints import capture
+from app.core.config import settings
+from app.models.capture import Capture, CaptureStatus
+from app.models.website import Website
+from app.utils.preflight import preflight
+
+
+@pytest.fixture
+def client(async_session_factory, monkeypatch):
+    async def get_async_db():
+        async with async_session_factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(capture.router, prefix="/captures")
+    app.dependency_overrides[deps.get_async_db] = get_async_db
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def domain(sync_engine):
+    domain = f"{uuid.uuid4().hex[:12]}.example.com"
+    yield domain
+    with Session(sync_engine) as db:
+        db.execute(delete(Website).where(Website.domain == domain))
+        db.commit()
+
+
+def _capture_row(sync_engine, capture_id):
+    with Session(sync_engine, expire_on_commit=False) as db:
+        return db.execute(select(Capture).where(Capture.id == capture_id)).scalars().one()
+
+
+def _website(sync_engine, website_id):
+    with Session(sync_engine) as db:
+        return db.get(Website, website_id)
+
+
+def test_create_capture_queues_pending_row(client, sync_engine, domain):
+    url = f"https://{domain}/pricing"
+    response = client.post("/captures/", json={"url": url, "device_types": ["desktop", "mobile"]})
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["status"] == CaptureStatus.PENDING.value
+    assert body["url"] == url
+
+    row = _capture_row(sync_engine, body["id"])
+    assert row.status == CaptureStatus.PENDING.value
+    assert row.lease_owner is None
+    assert row.url == url
+    assert row.device_types == ["desktop", "mobile"]
+    assert _website(sync_engine, row.website_id).domain == domain
+
+
+def test_create_capture_reuses_website_of_same_domain(client, sync_engine, domain):
+    first = client.post("/captures/", json={"url": f"https://{domain}/", "device_types": ["desktop"]}).json()
+    second = client.post("/captures/", json={"url": f"https://{domain}/about", "device_types": ["desktop"]}).json()
+
+    assert first["website_id"] == second["website_id"]
+    assert _capture_row(sync_engine, second["id"]).url == f"https://{domain}/about"
+
+
+def test_create_capture_from_website_id_uses_website_url(client, domain):
+    first = client.post("/captures/", json={"url": f"https://{domain}/", "device_types": ["desktop"]}).json()
+
+    response = client.post("/captures/", json={"website_id": first["website_id"], "device_types": ["desktop"]})
+
+    assert response.status_code == 200, response.text
+    assert response.json()["url"] == f"https://{domain}/"
+
+
+def test_create_capture_requires_url_or_website(client):
+    response = client.post("/captures/", json={"device_types": ["desktop"]})
+    assert response.status_code == 400
+
+    response = client.post("/captures/", json={"website_id": 2_000_000_000, "device_types": ["desktop"]})
+    assert response.status_code == 404
+
+
+def test_create_capture_does_not_preflight_on_the_request_path(client, domain, monkeypatch):
+    monkeypatch.setattr(settings, "PREFLIGHT_ENABLED", True)
+
+    async def check(url):
+        raise AssertionError("API 요청 처리 중에는 사전 확인 요청을 보내지 않음")
+
+    monkeypatch.setattr(preflight, "check", check)
+
+    # 렌더링 가능 여부는 워커가 확인하므로 작업은 바로 대기 상태로 생성
+    response = client.post("/captures/", json={"url": f"https://{domain}/missing", "device_types": ["desktop"]})
+    assert response.status_code == 200, response.text
+    assert response.json()["status"] == CaptureStatus.PENDING.value
+
+
+def test_create_capture_rejects_invalid_crawl_options(client, domain):
+    url = f"https://{domain}/"
+    for crawl in (
+        {"max_depth": -1},
+        {"max_depth": settings.CRAWL_MAX_DEPTH + 1},
+        {"max_pages": 0},
+        {"max_pages": settings.CRAWL_MAX_PAGES + 1},
+        {"include_patterns": ["/blog/("]},
+        {"exclude_patterns": ["[a-"]},
+    ):
+        response = client.post("/captures/", json={"url": url, "device_types": ["desktop"], "crawl": crawl})
+        assert response.status_code == 422, crawl
+
+    response = client.post(
+        "/captures/",
+        json={"url": url, "device_types": ["desktop"], "crawl": {"max_depth": 2, "include_patterns": [r"/blog/\d+"]}},
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["crawl"]["include_patterns"] == [r"/blog/\d+"]
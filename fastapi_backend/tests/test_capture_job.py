@@ -0,0 +1,101 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+if not os.environ.get("TEST_DATABASE_URL"):
+    # 워커 모듈은 import 시 DB 엔진을 만듦
+    pytest.skip("TEST_DATABASE_URL 이 설정되지 않았습니다", allow_module_level=True)
+
+from app.core.config import settings
+from app.models.page import PageStatus
+from app.utils.capture import DEFAULT_USER_AGENT, MOBILE_USER_AGENT, CaptureTool
+from app.worker import capture_job
+
+
+def test_device_settings_emulate_mobile_and_tablet(monkeypatch):
+    profiles = {"mobile": SimpleNamespace(width=390, height=844), "kiosk": SimpleNamespace(width=1080, height=1920)}
+
+    async def aget_by_name(db, name):
+        return profiles.get(name)
+
+    monkeypatch.setattr(capture_job.device_profiles, "aget_by_name", aget_by_name)
+    devices = asyncio.run(capture_job._get_device_settings(None, ["desktop", "Tablet", "mobile", "kiosk"]))
+    desktop, tablet, mobile, kiosk = devices
+
+    assert (desktop["width"], desktop["height"]) == (1920, 1080)
+    assert (mobile["width"], mobile["height"], mobile["user_agent"]) == (390, 844, MOBILE_USER_AGENT)
+    assert tablet["is_mobile"] and tablet["has_touch"] and tablet["user_agent"] != DEFAULT_USER_AGENT
+    assert (kiosk["width"], kiosk["height"]) == (1080, 1920)
+
+    # 데스크톱 계열만 기본 렌더링을 뷰포트 변경으로 재사용하고 모바일/태블릿은 따로 로드
+    assert [CaptureTool._can_reuse_render(device) for device in devices] == [True, False, False, True]
+
+
+class _Writer:
+    db = None
+
+    def __init__(self):
+        self.screenshots = []
+        self.page_updates = []
+
+    async def update_page(self, page_id, values):
+        self.page_updates.append(values)
+
+    async def add_screenshot(self, values):
+        self.screenshots.append(values)
+
+    async def set_links(self, page_id, links):
+        pass
+
+
+def test_capture_page_bounds_device_concurrency_per_job(monkeypatch):
+    monkeypatch.setattr(settings, "CAPTURE_JOB_CONCURRENCY", 2)
+    monkeypatch.setattr(settings, "PREFLIGHT_ENABLED", False)
+    running = []
+    peak = []
+
+    async def capture_website(url, device_type, width, height, **kwargs):
+        running.append(device_type)
+        peak.append(len(running))
+        await asyncio.sleep(0.02)
+        running.remove(device_type)
+        return {"screenshot_path": f"{device_type}.png", "thumbnail_path": f"{device_type}.thumb.png", "format": "png"}
+
+    async def find_reusable_results(db, keys, max_age):
+        return [None] * len(keys)
+
+    async def latest_versions(db, **kwargs):
+        return {}
+
+    async def no_tiles(path):
+        return None
+
+    @asynccontextmanager
+    async def slot(url):
+        yield
+
+    monkeypatch.setattr(capture_job, "capture_website", capture_website)
+    monkeypatch.setattr(capture_job, "_find_reusable_results", find_reusable_results)
+    monkeypatch.setattr(capture_job.screenshots, "aget_latest_versions", latest_versions)
+    monkeypatch.setattr(capture_job, "create_tile_pyramid", no_tiles)
+    monkeypatch.setattr(capture_job.blob_store, "adopt_result", lambda result: result)
+    monkeypatch.setattr(capture_job.politeness, "slot", slot)
+
+    capture_obj = SimpleNamespace(
+        id=1, website_id=1, capture_full_page=True, capture_dynamic_elements=False, image_format=None,
+        image_quality=None, request_policy=None, load_strategy=None, wait_for_selector=None,
+        incremental=False, result_max_age_seconds=0, reuse_render=False,
+    )
+    devices = [{"type": f"d{i}", "width": 800 + i, "height": 600} for i in range(5)]
+    writer = _Writer()
+    page = capture_job.PageRef(id=1, url="https://example.com/", depth=0)
+    links, error = asyncio.run(capture_job._capture_page(writer, capture_obj, page, devices))
+
+    assert error is None
+    # 디바이스 5개를 동시에 2개까지만 렌더링
+    assert max(peak) == 2
+    assert sorted(s["device_type"] for s in writer.screenshots) == [d["type"] for d in devices]
+    assert writer.page_updates[-1]["status"] == PageStatus.COMPLETE.value
@@ -0,0 +1,134 @@
+import asyncio
+import os
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+if not os.environ.get("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL 이 설정되지 않았습니다", allow_module_level=True)
+
+from sqlalchemy import delete, select, update
+
+from app.crud import captures
+from app.models.capture import Capture, CaptureStatus
+from app.models.website import Website
+
+
+def test_capture_lease_claim_heartbeat_and_expiry(async_session_factory):
+    async def scenario():
+        async with async_session_factory() as db, async_session_factory() as other:
+            domain = f"{uuid.uuid4().hex[:12]}.example.com"
+            website = Website(name=domain, url=f"https://{domain}/", domain=domain)
+            db.add(website)
+            await db.flush()
+            # 다른 대기 작업보다 먼저 선택되도록 오래된 생성 시각
+            capture = Capture(
+                website_id=website.id, status=CaptureStatus.PENDING.value, device_types=["desktop"],
+                created_at=datetime(2000, 1, 1),
+            )
+            db.add(capture)
+            await db.commit()
+            website_id, capture_id = website.id, capture.id
+
+            async def expire():
+                await db.execute(
+                    update(Capture).where(Capture.id == capture_id)
+                    .values(lease_expires_at=datetime.utcnow() - timedelta(seconds=1))
+                )
+                await db.commit()
+
+            try:
+                # 다른 트랜잭션이 잠근 행은 건너뜀
+                await other.execute(select(Capture).where(Capture.id == capture_id).with_for_update())
+                skipped = await captures.aclaim_next(db, worker_id="a", lease_seconds=60)
+                assert skipped is None or skipped.id != capture_id
+                await other.rollback()
+
+                claimed = await captures.aclaim_next(db, worker_id="a", lease_seconds=60)
+                assert claimed.id == capture_id
+                assert (claimed.status, claimed.lease_owner, claimed.attempts) == (CaptureStatus.PROCESSING.value, "a", 1)
+
+                # 리스가 유효한 동안 다른 워커는 가져가지 못함
+                taken = await captures.aclaim_next(other, worker_id="b", lease_seconds=60)
+                assert taken is None or taken.id != capture_id
+                assert await captures.aheartbeat(db, id=capture_id, worker_id="a", lease_seconds=60)
+                assert not await captures.aheartbeat(other, id=capture_id, worker_id="b", lease_seconds=60)
+
+                # 리스가 만료되면 다른 워커가 회수하고 원래 워커는 리스를 잃음
+                await expire()
+                reclaimed = await captures.aclaim_next(other, worker_id="b", lease_seconds=60)
+                assert (reclaimed.id, reclaimed.lease_owner, reclaimed.attempts) == (capture_id, "b", 2)
+                assert not await captures.aheartbeat(db, id=capture_id, worker_id="a", lease_seconds=60)
+
+                await expire()
+                assert await captures.afail_exhausted(db, max_attempts=2) >= 1
+                failed = (await db.execute(
+                    select(Capture).where(Capture.id == capture_id).execution_options(populate_existing=True)
+                )).scalars().one()
+                assert (failed.status, failed.lease_owner) == (CaptureStatus.FAILED.value, None)
+            finally:
+                await db.execute(delete(Website).where(Website.id == website_id))
+                await db.commit()
+
+    asyncio.run(scenario())
+
+
+def test_capture_release_requeues_unfinished_job(async_session_factory):
+    async def scenario():
+        async with async_session_factory() as db:
+            domain = f"{uuid.uuid4().hex[:12]}.example.com"
+            website = Website(name=domain, url=f"https://{domain}/", domain=domain)
+            db.add(website)
+            await db.flush()
+            capture = Capture(
+                website_id=website.id, status=CaptureStatus.PENDING.value, device_types=["desktop"],
+                created_at=datetime(2000, 1, 1),
+            )
+            db.add(capture)
+            await db.commit()
+            website_id, capture_id = website.id, capture.id
+
+            async def load():
+                return (await db.execute(
+                    select(Capture).where(Capture.id == capture_id).execution_options(populate_existing=True)
+                )).scalars().one()
+
+            try:
+                claimed = await captures.aclaim_next(db, worker_id="a", lease_seconds=60)
+                assert claimed.id == capture_id
+
+                # 완료되지 않은 채 해제되면 대기 상태로 돌아감
+                await captures.arelease(db, id=capture_id, worker_id="a", max_attempts=3)
+                released = await load()
+                assert (released.status, released.lease_owner, released.lease_expires_at) == (
+                    CaptureStatus.PENDING.value, None, None
+                )
+
+                # 리스 없이 진행 중으로 남은 행도 회수 대상
+                await db.execute(
+                    update(Capture).where(Capture.id == capture_id)
+                    .values(status=CaptureStatus.PROCESSING.value)
+                )
+                await db.commit()
+                reclaimed = await captures.aclaim_next(db, worker_id="b", lease_seconds=60)
+                assert (reclaimed.id, reclaimed.lease_owner, reclaimed.attempts) == (capture_id, "b", 2)
+
+                # 시도 횟수를 소진했으면 해제 시 실패 처리
+                await captures.arelease(db, id=capture_id, worker_id="b", max_attempts=2)
+                assert (await load()).status == CaptureStatus.FAILED.value
+
+                # 이미 끝난 작업은 상태를 유지한 채 리스만 해제
+                await db.execute(
+                    update(Capture).where(Capture.id == capture_id)
+                    .values(status=CaptureStatus.COMPLETE.value, lease_owner="c")
+                )
+                await db.commit()
+                await captures.arelease(db, id=capture_id, worker_id="c", max_attempts=1)
+                done = await load()
+                assert (done.status, done.lease_owner) == (CaptureStatus.COMPLETE.value, None)
+            finally:
+                await db.execute(delete(Website).where(Website.id == website_id))
+                await db.commit()
+
+    asyncio.run(scenario())
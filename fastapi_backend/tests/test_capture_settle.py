@@ -0,0 +1,121 @@
+import asyncio
+import json
+import shutil
+
+import pytest
+
+from app.core.config import settings
+from app.utils.capture import CaptureTool
+
+if shutil.which("node") is None:
+    pytest.skip("스크롤/안정화 스크립트를 실행할 node 가 없습니다", allow_module_level=True)
+
+# page.evaluate 에 넘기는 스크립트를 실행하는 최소한의 브라우저 환경
+# (문서 높이, 스크롤 위치, 프레임/타이머만 흉내 내고 이미지는 없음)
+_HARNESS = r"""
+const { script, arg, page } = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+let height = page.height;
+let scrollY = 0;
+let grown = 0;
+const maybeGrow = () => {
+    // 무한 스크롤: 바닥에 닿으면 잠시 뒤 내용이 붙음
+    if (grown < page.growTimes && scrollY + page.viewport >= height - 1) {
+        grown++;
+        setTimeout(() => { height += page.growBy; }, 20);
+    }
+};
+globalThis.requestAnimationFrame = (cb) => setTimeout(cb, 16);
+globalThis.document = {
+    documentElement: { get scrollHeight() { return height; } },
+    body: { get scrollHeight() { return height; } },
+    images: [],
+    fonts: { ready: Promise.resolve(), status: 'loaded' },
+};
+globalThis.window = {
+    innerHeight: page.viewport,
+    get scrollY() { return scrollY; },
+    scrollBy(x, y) {
+        scrollY = Math.min(scrollY + y, Math.max(0, height - page.viewport));
+        maybeGrow();
+    },
+    scrollTo(x, y) { scrollY = y; },
+};
+globalThis.IntersectionObserver = class { observe() {} disconnect() {} };
+globalThis.PerformanceObserver = class { observe() {} disconnect() {} };
+for (const [ms, value] of page.changes || []) setTimeout(() => { height = value; }, ms);
+if (page.jitterMs) setInterval(() => { height += 1; }, page.jitterMs);
+
+const started = performance.now();
+eval('(' + script + ')')(arg).then((result) => {
+    result.elapsedMs = performance.now() - started;
+    result.finalScrollY = scrollY;
+    process.stdout.write(JSON.stringify(result));
+    process.exit(0);
+});
+"""
+
+
+class FakePage:
+    """evaluate 스크립트를 node 에서 가짜 문서로 실행하는 페이지"""
+
+    def __init__(self, height, viewport=1000, grow_by=0, grow_times=0, changes=(), jitter_ms=0):
+        self.page = {
+            "height": height, "viewport": viewport, "growBy": grow_by, "growTimes": grow_times,
+            "changes": list(changes), "jitterMs": jitter_ms,
+        }
+
+    async def evaluate(self, script, arg):
+        process = await asyncio.create_subprocess_exec(
+            "node", "-e", _HARNESS,
+            stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate(
+            json.dumps({"script": script, "arg": arg, "page": self.page}).encode("utf-8")
+        )
+        assert process.returncode == 0, stderr.decode()
+        return json.loads(stdout)
+
+
+@pytest.fixture(autouse=True)
+def short_waits(monkeypatch):
+    monkeypatch.setattr(settings, "CAPTURE_SCROLL_BUDGET_RATIO", 1.0)
+    monkeypatch.setattr(settings, "CAPTURE_SCROLL_STEP_WAIT_MS", 50)
+    monkeypatch.setattr(settings, "CAPTURE_SCROLL_GROWTH_WAIT_MS", 200)
+    monkeypatch.setattr(settings, "CAPTURE_LAYOUT_STABLE_MS", 150)
+    monkeypatch.setattr(settings, "CAPTURE_MAX_PAGE_HEIGHT", 30000)
+
+
+def test_scroll_stops_at_the_bottom_of_a_stable_page():
+    result = asyncio.run(CaptureTool()._scroll_page(FakePage(height=3000), 5000))
+
+    assert (result["scrollStopReason"], result["scrollSteps"], result["pageHeight"]) == ("bottom", 2, 3000)
+    # 바닥에서 늘어나는지 한 번만 기다리고 예산을 다 쓰지 않음
+    assert result["elapsedMs"] < 2000
+    assert result["finalScrollY"] == 0
+
+
+def test_scroll_follows_infinite_scroll_until_growth_stops_or_max_height(monkeypatch):
+    grown = asyncio.run(CaptureTool()._scroll_page(FakePage(height=2000, grow_by=1000, grow_times=2), 5000))
+    assert (grown["scrollStopReason"], grown["pageHeight"]) == ("bottom", 4000)
+    assert grown["scrollSteps"] == 3
+
+    monkeypatch.setattr(settings, "CAPTURE_MAX_PAGE_HEIGHT", 3500)
+    endless = asyncio.run(CaptureTool()._scroll_page(FakePage(height=2000, grow_by=1000, grow_times=100), 5000))
+    assert endless["scrollStopReason"] == "maxHeight" and endless["pageHeight"] >= 3500
+
+
+def test_settle_waits_for_height_to_stop_changing():
+    stable = asyncio.run(CaptureTool()._wait_for_settle(FakePage(height=3000), 3000))
+    assert stable["layoutStable"] and not stable["settleTimedOut"]
+    assert stable["elapsedMs"] < 1000
+
+    # 높이가 바뀐 뒤에도 CAPTURE_LAYOUT_STABLE_MS 동안 변화가 없어야 안정
+    shifting = asyncio.run(CaptureTool()._wait_for_settle(FakePage(height=3000, changes=[(100, 3200), (200, 3400)]), 3000))
+    assert shifting["layoutStable"] and not shifting["settleTimedOut"]
+    assert shifting["elapsedMs"] >= 200 + 150
+
+
+def test_settle_gives_up_when_layout_never_stabilizes():
+    result = asyncio.run(CaptureTool()._wait_for_settle(FakePage(height=3000, jitter_ms=30), 500))
+    assert not result["layoutStable"] and result["settleTimedOut"]
+    assert result["elapsedMs"] < 1500
@@ -0,0 +1,93 @@
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from app.utils.capture import DEFAULT_USER_AGENT, CaptureTool
+from app.utils.request_policy import RequestStats
+
+
+class FakePage:
+    def __init__(self, log):
+        self.log = log
+
+    async def set_viewport_size(self, size):
+        self.log.append(("viewport", size["width"], size["height"]))
+
+
+class FakeContext:
+    def __init__(self, log):
+        self.log = log
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    async def new_page(self):
+        return FakePage(self.log)
+
+
+class RecordingCaptureTool(CaptureTool):
+    """브라우저 없이 캡처 순서만 기록하는 CaptureTool"""
+
+    def __init__(self):
+        super().__init__()
+        self.log = []
+
+    @asynccontextmanager
+    async def _new_context(self, **kwargs):
+        self.log.append(("context", kwargs["viewport"]["width"], kwargs["user_agent"]))
+        yield FakeContext(self.log)
+
+    async def _load_page(self, page, url, capture_dynamic_elements, policy, plan):
+        self.log.append(("load", url))
+        load = {"timings": {"navigation": 1}, "settle": {}, "strategy": {}, "requests": RequestStats()}
+        return None, "title", ["https://example.com/a"], load
+
+    def _build_paths(self, url, device_type, version, options):
+        return Path(f"{device_type}.png"), Path(f"{device_type}.thumb.png")
+
+    async def _wait_for_relayout(self, page):
+        pass
+
+    async def _save_screenshot(self, page, screenshot_path, thumbnail_path, capture_full_page, options):
+        self.log.append(("screenshot", str(screenshot_path)))
+        return {
+            "path": str(screenshot_path), "thumbnail_path": str(thumbnail_path), "format": "png",
+            "content_hash": "hash", "thumbnail_hash": "thumb",
+        }
+
+    async def capture_website(self, url, device_type, **kwargs):
+        self.log.append(("reload", device_type, kwargs["is_mobile"]))
+        return {"screenshot_path": f"{device_type}.png", "reloaded": True}
+
+
+def test_can_reuse_render():
+    assert CaptureTool._can_reuse_render({"type": "desktop"})
+    assert CaptureTool._can_reuse_render({"type": "tablet", "user_agent": DEFAULT_USER_AGENT})
+    assert not CaptureTool._can_reuse_render({"type": "mobile", "is_mobile": True})
+    assert not CaptureTool._can_reuse_render({"type": "touch", "has_touch": True})
+    assert not CaptureTool._can_reuse_render({"type": "bot", "user_agent": "Bot/1.0"})
+
+
+def test_capture_viewports_loads_once_and_reloads_only_emulated_devices():
+    tool = RecordingCaptureTool()
+    devices = [
+        {"type": "desktop", "width": 1920, "height": 1080},
+        {"type": "mobile", "width": 375, "height": 812, "is_mobile": True, "has_touch": True},
+        {"type": "tablet", "width": 768, "height": 1024},
+    ]
+    results = asyncio.run(tool.capture_viewports("https://example.com/", devices, load_strategy="load"))
+
+    assert tool.log == [
+        ("context", 1920, DEFAULT_USER_AGENT),
+        ("load", "https://example.com/"),
+        ("viewport", 1920, 1080),
+        ("screenshot", "desktop.png"),
+        ("viewport", 768, 1024),
+        ("screenshot", "tablet.png"),
+        ("reload", "mobile", True),
+    ]
+    # 결과는 devices 순서
+    assert [result["screenshot_path"] for result in results] == ["desktop.png", "mobile.png", "tablet.png"]
+    assert results[1] == {"screenshot_path": "mobile.png", "reloaded": True}
+    assert results[2]["metadata"]["deviceType"] == "tablet"
+    assert set(results[2]["metadata"]["timings"]) == {"navigation", "relayout", "screenshot"}
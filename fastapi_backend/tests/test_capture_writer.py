@@ -0,0 +1,88 @@
+import asyncio
+import os
+import uuid
+
+import pytest
+
+if not os.environ.get("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL 이 설정되지 않았습니다", allow_module_level=True)
+
+from sqlalchemy import delete, func, select
+
+from app.crud.link import url_hash
+from app.models.capture import Capture
+from app.models.link import Url
+from app.models.page import Page, PageStatus
+from app.models.screenshot import Screenshot
+from app.models.website import Website
+from app.utils.crawl import crawl_key
+from app.worker.writer import CaptureWriter
+
+
+def test_capture_writer_buffers_and_coalesces(async_session_factory):
+    async def scenario():
+        async with async_session_factory() as db, async_session_factory() as reader:
+            domain = f"{uuid.uuid4().hex[:12]}.example.com"
+            website = Website(name=domain, url=f"https://{domain}/", domain=domain)
+            db.add(website)
+            await db.flush()
+            capture = Capture(website_id=website.id, status="processing", device_types=["desktop"])
+            db.add(capture)
+            await db.commit()
+            website_id, capture_id = website.id, capture.id
+
+            async def committed():
+                # 다른 세션에서 보이는 (커밋된) 상태
+                await reader.rollback()
+                statuses = dict((await reader.execute(
+                    select(Page.id, Page.status).where(Page.capture_id == capture_id)
+                )).all())
+                shots = (await reader.execute(
+                    select(func.count()).select_from(Screenshot).where(Screenshot.capture_id == capture_id)
+                )).scalar_one()
+                progress = (await reader.execute(
+                    select(Capture.progress).where(Capture.id == capture_id)
+                )).scalar_one()
+                return statuses, shots, progress
+
+            try:
+                writer = CaptureWriter(
+                    db, capture_id, progress_interval=3600, batch_size=4, flush_interval=3600
+                )
+                first, second = await writer.create_pages([
+                    {"url": f"https://{domain}/{name}", "website_id": website_id, "capture_id": capture_id}
+                    for name in ("first", "second")
+                ])
+                # 페이지 생성은 버퍼링하지 않음
+                assert await committed() == ({first: "pending", second: "pending"}, 0, 0.0)
+
+                flushed = []
+                await writer.set_progress(10.0)
+                await writer.update_page(first, {"status": PageStatus.FAILED.value})
+                await writer.update_page(first, {"status": PageStatus.COMPLETE.value, "http_status": 200})
+                await writer.add_screenshot({
+                    "path": "/tmp/shot.png", "thumbnail_path": "/tmp/thumb.png", "width": 10, "height": 20,
+                    "device_type": "desktop", "page_id": first, "capture_id": capture_id,
+                })
+                writer.after_flush(lambda: flushed.append(True))
+                await writer.set_progress(20.0)
+                # 첫 진행률만 즉시 기록되고 나머지는 버퍼에 남음 (같은 페이지 변경은 하나로 합쳐짐)
+                assert await committed() == ({first: "pending", second: "pending"}, 0, 10.0)
+                assert not flushed
+
+                await writer.update_page(second, {"status": PageStatus.SKIPPED.value})
+                await writer.set_links(second, [f"https://{domain}/first"])
+                # batch_size 에 도달하면 한 트랜잭션으로 기록하고 콜백 실행
+                assert await committed() == ({first: "complete", second: "skipped"}, 1, 20.0)
+                assert flushed == [True]
+
+                http_status = (await reader.execute(select(Page.http_status).where(Page.id == first))).scalar_one()
+                assert http_status == 200
+            finally:
+                await db.execute(delete(Website).where(Website.id == website_id))
+                await db.execute(delete(Url).where(Url.hash.in_([
+                    url_hash(crawl_key(f"https://{domain}/{name}")) for name in ("first", "second")
+                ])))
+                await db.commit()
+
+    asyncio.run(scenario())
@@ -0,0 +1,87 @@
+import asyncio
+import os
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+if not os.environ.get("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL 이 설정되지 않았습니다", allow_module_level=True)
+
+from sqlalchemy import delete
+
+from app.crud import captures, pages, screenshots, websites
+from app.models.capture import CaptureStatus
+from app.models.page import PageStatus
+from app.models.website import Website
+
+
+def test_async_crud_round_trips(async_session_factory):
+    async def scenario():
+        async with async_session_factory() as db:
+            domain = f"{uuid.uuid4().hex[:12]}.example.com"
+            website = await websites.acreate(db, obj_in={"name": domain, "url": f"https://{domain}/", "domain": domain})
+            website_id = website.id
+            try:
+                assert (await websites.aget(db, id=website_id)).domain == domain
+                assert (await websites.aget_by_domain(db, domain=domain)).id == website_id
+                assert (await websites.aget_by_url(db, url=f"https://{domain}/")).id == website_id
+
+                # JSON 컬럼과 날짜 컬럼이 asyncpg 로 그대로 저장/조회됨
+                old, new = [
+                    await captures.acreate(db, obj_in={
+                        "website_id": website_id, "url": f"https://{domain}/", "status": CaptureStatus.PENDING.value,
+                        "device_types": ["desktop", "mobile"], "crawl": {"max_depth": 2}, "created_at": datetime.now(),
+                        "progress": 0,
+                    })
+                    for _ in range(2)
+                ]
+                assert (new.device_types, new.crawl) == (["desktop", "mobile"], {"max_depth": 2})
+
+                assert (await captures.aupdate_progress(db, id=new.id, progress=40)).progress == 40
+                completed = await captures.aupdate_completed(db, id=new.id)
+                assert (completed.status, completed.progress) == (CaptureStatus.COMPLETE.value, 100)
+                assert completed.completed_at is not None
+                failed = await captures.aupdate_error(db, id=old.id, error="boom")
+                assert (failed.status, failed.error) == (CaptureStatus.FAILED.value, "boom")
+                assert await captures.aupdate_status(db, id=2_000_000_000, status="x") is None
+
+                # 깊이, id 순으로 정렬
+                child = await pages.acreate(db, obj_in={
+                    "url": f"https://{domain}/a", "website_id": website_id, "capture_id": new.id,
+                    "status": PageStatus.PENDING.value, "depth": 1,
+                })
+                root = await pages.acreate(db, obj_in={
+                    "url": f"https://{domain}/", "website_id": website_id, "capture_id": new.id,
+                    "status": PageStatus.COMPLETE.value, "depth": 0,
+                })
+                assert [page.id for page in await pages.aget_by_capture(db, capture_id=new.id)] == [root.id, child.id]
+
+                old_root = await pages.acreate(db, obj_in={
+                    "url": f"https://{domain}/", "website_id": website_id, "capture_id": old.id, "depth": 0,
+                })
+                for page, version in ((old_root, 1), (old_root, 2), (root, 3)):
+                    await screenshots.acreate(db, obj_in={
+                        "path": f"{version}.png", "thumbnail_path": f"{version}.thumb.png", "width": 10, "height": 10,
+                        "device_type": "desktop", "version": version, "page_id": page.id,
+                        "capture_id": page.capture_id, "render_key": f"{domain}-{version}",
+                        "created_at": datetime.now(),
+                    })
+                assert [s.version for s in await screenshots.aget_by_page(db, page_id=old_root.id)] == [1, 2]
+                # 다른 캡처의 최신 버전만 (이 캡처의 스크린샷은 제외)
+                assert await screenshots.aget_latest_versions(
+                    db, website_id=website_id, url=f"https://{domain}/", exclude_capture_id=new.id
+                ) == {"desktop": 2}
+                recent = await screenshots.aget_recent_by_render_keys(
+                    db, render_keys=[f"{domain}-3", f"{domain}-9"], since=datetime.now() - timedelta(minutes=1)
+                )
+                assert list(recent) == [f"{domain}-3"]
+
+                assert (await pages.aremove(db, id=child.id)).id == child.id
+                assert await pages.aget(db, id=child.id) is None
+                assert await pages.aremove(db, id=child.id) is None
+            finally:
+                await db.execute(delete(Website).where(Website.id == website_id))
+                await db.commit()
+
+    asyncio.run(scenario())
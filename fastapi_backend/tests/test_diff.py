@@ -0,0 +1,69 @@
+import numpy as np
+from PIL import Image
+
+from app.utils.diff import DiffOptions, align_rows, diff_images
+from app.utils.image import ImageFormat
+
+OPTIONS = DiffOptions(block_size=8, pixel_threshold=24, overlay_format=ImageFormat.PNG)
+
+
+def _page(height: int, width: int = 40) -> np.ndarray:
+    # 행마다 내용이 다른 페이지
+    rows = np.random.default_rng(height).integers(0, 256, (height, 1, 3), dtype=np.uint8)
+    return np.repeat(rows, width, axis=1)
+
+
+def _diff(tmp_path, before: np.ndarray, after: np.ndarray, options: DiffOptions = OPTIONS):
+    Image.fromarray(before).save(tmp_path / "before.png")
+    Image.fromarray(after).save(tmp_path / "after.png")
+    return diff_images(tmp_path / "before.png", tmp_path / "after.png", tmp_path / "overlay", options)
+
+
+def test_align_rows_matches_shifted_rows():
+    mapping, identical, removed = align_rows([b"a", b"b", b"c", b"d"], [b"a", b"x", b"b", b"c"])
+    assert mapping.tolist() == [0, -1, 1, 2]
+    assert identical.tolist() == [True, False, True, True]
+    assert removed == 1
+
+
+def test_identical_screenshots_have_no_changes(tmp_path):
+    page = _page(64)
+    result = _diff(tmp_path, page, page)
+    assert result["changed_pixels"] == 0 and result["changed_ratio"] == 0.0
+    assert result["regions"] == [] and result["total_blocks"] == 8 * 5
+    assert result["overlay_path"].endswith(".png")
+
+
+def test_changed_area_becomes_block_aligned_region(tmp_path):
+    before = _page(64)
+    after = before.copy()
+    after[10:14, 20:30] = 255 - after[10:14, 20:30]
+    # 기준 이하의 차이(압축 잡음)는 무시
+    after[40:50] = np.clip(after[40:50].astype(int) + 10, 0, 255).astype(np.uint8)
+
+    result = _diff(tmp_path, before, after)
+    assert result["changed_pixels"] == 40
+    assert result["regions"] == [{"x": 16, "y": 8, "width": 16, "height": 8, "blocks": 2}]
+
+
+def test_inserted_rows_do_not_mark_shifted_content_changed(tmp_path):
+    before = _page(64)
+    inserted = np.full((8, 40, 3), 7, dtype=np.uint8)
+    after = np.concatenate([before[:24], inserted, before[24:]])
+
+    result = _diff(tmp_path, before, after)
+    assert result["inserted_rows"] == 8 and result["removed_rows"] == 0
+    assert result["changed_pixels"] == 8 * 40
+    assert [(r["y"], r["height"]) for r in result["regions"]] == [(24, 8)]
+    assert (result["before_height"], result["height"]) == (64, 72)
+
+
+def test_removed_rows_and_wider_pages_count_as_changes(tmp_path):
+    before = _page(32, width=40)
+    after = np.concatenate([before[:16], before[24:]])
+    after = np.concatenate([after, np.zeros((24, 8, 3), dtype=np.uint8)], axis=1)
+
+    result = _diff(tmp_path, before, after)
+    assert result["removed_rows"] == 8
+    assert result["changed_pixels"] == 24 * 8 + 8 * 40
+    assert result["changed_ratio"] == result["changed_pixels"] / (24 * 48 + 8 * 40)
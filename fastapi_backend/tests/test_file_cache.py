@@ -0,0 +1,34 @@
+from app.utils import file_cache as file_cache_module
+from app.utils.file_cache import ScreenshotFileCache, ScreenshotFiles
+
+
+def _files(name: str) -> ScreenshotFiles:
+    return ScreenshotFiles(
+        path=f"{name}.png", format="png", content_hash=name, thumbnail_path=f"{name}.webp",
+        thumbnail_hash=f"{name}-thumb", tiles_path=None,
+    )
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ScreenshotFileCache(max_entries=2)
+    cache.set(1, _files("a"))
+    cache.set(2, _files("b"))
+    assert cache.get(1) == _files("a")
+    cache.set(3, _files("c"))
+
+    assert cache.get(2) is None
+    assert cache.get(1) == _files("a") and cache.get(3) == _files("c")
+    cache.invalidate(1)
+    assert cache.get(1) is None
+
+
+def test_cache_entries_expire(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(file_cache_module.time, "monotonic", lambda: now[0])
+    cache = ScreenshotFileCache(ttl_seconds=10)
+    cache.set(1, _files("a"))
+
+    now[0] += 9
+    assert cache.get(1) == _files("a")
+    now[0] += 1
+    assert cache.get(1) is None
@@ -0,0 +1,64 @@
+import asyncio
+import functools
+
+import httpx
+
+from app.utils import fingerprint as fingerprint_module
+from app.utils.fingerprint import PageFingerprint, PageFingerprinter, dom_hash
+
+PAGE = '<html><body><h1 class="title">Hello   world</h1><img src="a.png" alt="A"></body></html>'
+
+
+def test_dom_hash_ignores_volatile_markup():
+    noisy = (
+        '<html>\n<body>\n<!-- rendered 12:00 -->\n'
+        '<h1 data-reactid="7" class="title" nonce="x1">Hello\n world</h1>'
+        '<script>window.token = "abc"</script><input type="hidden" name="csrf" value="t1">'
+        '<img alt="A" src="a.png"></body></html>'
+    )
+    assert dom_hash(noisy) == dom_hash(PAGE)
+
+
+def test_dom_hash_detects_content_and_tracked_attribute_changes():
+    assert dom_hash(PAGE.replace("Hello", "Goodbye")) != dom_hash(PAGE)
+    assert dom_hash(PAGE.replace("a.png", "b.png")) != dom_hash(PAGE)
+    assert dom_hash(PAGE.replace('class="title"', 'class="banner"')) != dom_hash(PAGE)
+    assert dom_hash(PAGE.replace('class="title"', ""), attributes=[]) == dom_hash(PAGE, attributes=[])
+
+
+def test_fingerprint_matches_previous_hash_or_not_modified():
+    assert PageFingerprint(dom_hash="a").matches("a")
+    assert not PageFingerprint(dom_hash="a").matches("b")
+    assert not PageFingerprint().matches(None)
+    assert PageFingerprint(not_modified=True).matches(None)
+
+
+def _fetch(monkeypatch, handler, **kwargs):
+    client = functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(fingerprint_module.httpx, "AsyncClient", client)
+    fingerprinter = PageFingerprinter(user_agent="test", max_bytes=kwargs.pop("max_bytes", 1024))
+    return asyncio.run(fingerprinter.fetch("https://example.com/", **kwargs))
+
+
+def test_fetch_uses_conditional_request(monkeypatch):
+    def handler(request):
+        assert request.headers["if-none-match"] == '"v1"'
+        return httpx.Response(304, headers={"last-modified": "Tue, 14 Nov 2023 22:13:20 GMT"})
+
+    result = _fetch(monkeypatch, handler, etag='"v1"')
+    assert result == PageFingerprint(
+        etag='"v1"', last_modified="Tue, 14 Nov 2023 22:13:20 GMT", not_modified=True
+    )
+
+
+def test_fetch_hashes_html_and_skips_other_responses(monkeypatch):
+    html = lambda request: httpx.Response(
+        200, headers={"content-type": "text/html; charset=utf-8", "etag": '"v2"'}, content=PAGE.encode()
+    )
+    result = _fetch(monkeypatch, html)
+    assert result == PageFingerprint(etag='"v2"', dom_hash=dom_hash(PAGE))
+
+    assert _fetch(monkeypatch, html, max_bytes=10) is None
+    assert _fetch(monkeypatch, lambda request: httpx.Response(500)) is None
+    pdf = lambda request: httpx.Response(200, headers={"content-type": "application/pdf"}, content=b"%PDF")
+    assert _fetch(monkeypatch, pdf) is None
@@ -0,0 +1,93 @@
+import asyncio
+import sqlite3
+
+from app.utils.frontier import BloomFilter, URLFrontier, url_fingerprint
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    added = [url_fingerprint(f"https://example.com/{i}") for i in range(1000)]
+    for fp in added:
+        bloom.add(fp)
+
+    assert all(fp in bloom for fp in added)
+    false_positives = sum(url_fingerprint(f"https://other.com/{i}") in bloom for i in range(10000))
+    assert false_positives < 300
+    assert bloom.count == 1000
+
+
+def test_bloom_filter_round_trips_and_rejects_corrupt_files(tmp_path):
+    bloom = BloomFilter(capacity=100)
+    bloom.add(url_fingerprint("https://example.com/"))
+    bloom.save(tmp_path / "f.bloom")
+
+    loaded = BloomFilter.load(tmp_path / "f.bloom")
+    assert (loaded.num_bits, loaded.num_hashes, loaded.count) == (bloom.num_bits, bloom.num_hashes, 1)
+    assert url_fingerprint("https://example.com/") in loaded
+
+    (tmp_path / "bad.bloom").write_bytes((tmp_path / "f.bloom").read_bytes()[:-1])
+    assert BloomFilter.load(tmp_path / "bad.bloom") is None
+    assert BloomFilter.load(tmp_path / "missing.bloom") is None
+
+
+def test_frontier_is_fifo_and_deduplicates(tmp_path):
+    frontier = URLFrontier(tmp_path / "crawl.sqlite3", bloom_capacity=100)
+    assert frontier.push("https://example.com/", 0)
+    assert frontier.push("https://example.com/a", 1, {"parent": 1})
+    assert not frontier.push("https://example.com/", 2)
+
+    first = frontier.pop()
+    assert (first.url, first.depth) == ("https://example.com/", 0)
+    frontier.done(first)
+    second = frontier.pop()
+    assert second.data == {"parent": 1}
+    frontier.done(second)
+    assert frontier.pop() is None and len(frontier) == 0
+    frontier.destroy()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_frontier_resumes_taken_items_and_rebuilds_stale_bloom(tmp_path):
+    path = tmp_path / "crawl.sqlite3"
+    frontier = URLFrontier(path, bloom_capacity=100)
+    for i in range(3):
+        frontier.push(f"https://example.com/{i}", 1)
+    frontier.done(frontier.pop())
+    taken = frontier.pop()
+    frontier.close()
+
+    # 완료하지 못한 항목부터 다시 꺼냄
+    resumed = URLFrontier(path, bloom_capacity=100)
+    assert [resumed.pop().url for _ in range(2)] == [taken.url, "https://example.com/2"]
+    assert not resumed.is_new("https://example.com/0")
+    resumed.push("https://example.com/3", 1)
+    resumed.commit()
+    # 체크포인트 없이 종료되면 (블룸 필터 항목 수가 다름) 방문 집합에서 다시 만듦
+    resumed.db.close()
+
+    rebuilt = URLFrontier(path, bloom_capacity=100)
+    assert rebuilt.seen_count == 4
+    assert not any(rebuilt.is_new(f"https://example.com/{i}") for i in range(4))
+    assert rebuilt.is_new("https://example.com/4")
+    rebuilt.close()
+
+
+def test_frontier_batches_writes_until_commit_and_runs_in_threads(tmp_path):
+    path = tmp_path / "crawl.sqlite3"
+    frontier = URLFrontier(path, bloom_capacity=100)
+
+    def schedule():
+        for i in range(3):
+            frontier.push(f"https://example.com/{i}", 1)
+        frontier.done(frontier.pop())
+
+    # 이벤트 루프 스레드가 아닌 곳에서도 같은 연결 사용
+    asyncio.run(asyncio.to_thread(schedule))
+    reader = sqlite3.connect(str(path))
+    assert reader.execute("SELECT COUNT(*) FROM queue").fetchone()[0] == 0
+
+    asyncio.run(asyncio.to_thread(frontier.commit))
+    assert reader.execute("SELECT COUNT(*) FROM queue").fetchone()[0] == 2
+    assert reader.execute("SELECT COUNT(*) FROM seen").fetchone()[0] == 3
+    reader.close()
+    frontier.destroy()
@@ -0,0 +1,160 @@
+import asyncio
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from app.core.config import settings
+from app.utils import image as image_module
+from app.utils.image import (
+    ImageFormat, ImageOptions, ImageProcessPool, StripImageWriter, choose_format, file_digest, media_type_for,
+    perceptual_hashes, process_screenshot_file,
+)
+
+PNG_OPTIONS = ImageOptions(format=ImageFormat.PNG, thumbnail_format=ImageFormat.PNG)
+
+
+def _save(path: Path, size=(1200, 3000), color=(10, 120, 200)) -> Path:
+    Image.new("RGB", size, color).save(path)
+    return path
+
+
+def test_thumbnail_keeps_aspect_ratio_within_max_size(tmp_path):
+    source = _save(tmp_path / "page.png")
+    result = process_screenshot_file(source, source, tmp_path / "thumb.png", PNG_OPTIONS)
+
+    assert result["path"] == str(source) and source.exists()
+    assert (result["width"], result["height"]) == (1200, 3000)
+    with Image.open(result["thumbnail_path"]) as thumbnail:
+        assert thumbnail.size == (120, 300)
+        assert thumbnail.getpixel((60, 150)) == (10, 120, 200)
+    assert result["content_hash"] == file_digest(source)
+    assert result["thumbnail_hash"] == file_digest(result["thumbnail_path"])
+    assert {"dhash", "phash"} <= set(result)
+
+
+def test_image_pool_runs_in_threads_without_workers(tmp_path):
+    pool = ImageProcessPool(workers=0)
+    source = _save(tmp_path / "wide.png", size=(900, 300))
+
+    result = asyncio.run(pool.run(process_screenshot_file, source, source, tmp_path / "thumb.png", PNG_OPTIONS))
+    with Image.open(result["thumbnail_path"]) as thumbnail:
+        assert thumbnail.size == (300, 100)
+    pool.close()
+
+
+def test_image_pool_runs_in_spawned_process(tmp_path):
+    pool = ImageProcessPool(workers=1)
+    source = _save(tmp_path / "page.png", size=(300, 600))
+    try:
+        result = asyncio.run(pool.run(process_screenshot_file, source, source, tmp_path / "thumb.png", PNG_OPTIONS))
+    finally:
+        pool.close()
+    assert Path(result["thumbnail_path"]).exists()
+
+
+def test_choose_format_falls_back_by_encoder_and_size(monkeypatch):
+    assert choose_format(ImageFormat.WEBP, 1920, 16383) == ImageFormat.WEBP
+    assert choose_format(ImageFormat.WEBP, 1920, 16384) == ImageFormat.JPEG
+    assert choose_format(ImageFormat.JPEG, 1920, 65501) == ImageFormat.PNG
+
+    monkeypatch.setattr(image_module.features, "check", lambda name: name == "webp")
+    assert choose_format(ImageFormat.AVIF, 100, 100) == ImageFormat.WEBP
+    monkeypatch.setattr(image_module.features, "check", lambda name: False)
+    assert choose_format(ImageFormat.AVIF, 100, 100) == ImageFormat.JPEG
+
+
+def test_media_type_uses_format_then_extension():
+    assert media_type_for("webp", "a.png") == "image/webp"
+    assert media_type_for("unknown", "a.JPEG") == "image/jpeg"
+    assert media_type_for(None, "a.avif") == "image/avif"
+    assert media_type_for() == "image/png"
+
+
+def test_image_options_resolve_deployment_defaults(monkeypatch):
+    monkeypatch.setattr(settings, "SCREENSHOT_FORMAT", "webp")
+    monkeypatch.setattr(settings, "SCREENSHOT_QUALITY", 70)
+    assert ImageOptions.resolve() == ImageOptions(
+        format=ImageFormat.WEBP, quality=70,
+        thumbnail_format=ImageFormat(settings.THUMBNAIL_FORMAT), thumbnail_quality=settings.THUMBNAIL_QUALITY,
+    )
+    assert ImageOptions.resolve("jpeg", 90).format == ImageFormat.JPEG
+
+
+def test_conversion_replaces_browser_png(tmp_path):
+    source = _save(tmp_path / "page.capture.png", size=(400, 800))
+    options = ImageOptions(format=ImageFormat.WEBP, thumbnail_format=ImageFormat.WEBP)
+    result = process_screenshot_file(source, tmp_path / "page.webp", tmp_path / "thumb.webp", options)
+
+    assert not source.exists()
+    assert (result["path"], result["format"]) == (str(tmp_path / "page.webp"), "webp")
+    assert result["thumbnail_path"].endswith(".webp")
+    with Image.open(result["path"]) as image:
+        assert image.format == "WEBP" and image.size == (400, 800)
+
+
+def test_jpeg_thumbnail_uses_draft_without_affecting_hashes(tmp_path, monkeypatch):
+    pixels = np.random.default_rng(5).integers(0, 256, (3000, 1200, 3), dtype=np.uint8)
+    source = tmp_path / "page.jpg"
+    Image.fromarray(pixels).save(source, quality=90)
+    thumbnail_sources = []
+    write_thumbnail = image_module._write_thumbnail
+
+    def recording_write_thumbnail(image, thumbnail_path, options):
+        path, fmt = write_thumbnail(image, thumbnail_path, options)
+        thumbnail_sources.append(image.size)
+        return path, fmt
+
+    monkeypatch.setattr(image_module, "_write_thumbnail", recording_write_thumbnail)
+    options = ImageOptions(format=ImageFormat.JPEG, thumbnail_format=ImageFormat.PNG)
+    result = process_screenshot_file(source, source, tmp_path / "thumb.png", options)
+
+    # 썸네일은 따로 연 이미지에서 축소 디코딩하고, 지각 해시는 원본 크기 이미지로 계산
+    assert thumbnail_sources[0][0] < 1200
+    with Image.open(result["thumbnail_path"]) as thumbnail:
+        assert thumbnail.size == (120, 300)
+    with Image.open(source) as original:
+        assert {k: result[k] for k in ("dhash", "phash")} == perceptual_hashes(original)
+
+
+def _strip(pixels: np.ndarray) -> bytes:
+    buffer = BytesIO()
+    Image.fromarray(pixels).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_strip_writer_concatenates_strips_into_one_png(tmp_path):
+    pixels = np.random.default_rng(3).integers(0, 256, (250, 64, 3), dtype=np.uint8)
+    writer = StripImageWriter(tmp_path / "page.png", 64, 250, tmp_path / "thumb.png", PNG_OPTIONS)
+    for top in range(0, 250, 100):
+        # 브라우저가 더 넓거나 마지막 스트립을 길게 돌려줘도 필요한 부분만 사용
+        strip = pixels[top:top + 100]
+        if top == 200:
+            strip = np.concatenate([strip, np.zeros((30, 64, 3), dtype=np.uint8)])
+        writer.add_strip(_strip(np.concatenate([strip, np.zeros((len(strip), 8, 3), dtype=np.uint8)], axis=1)))
+    result = writer.close()
+
+    with Image.open(result["path"]) as image:
+        assert np.array_equal(np.asarray(image), pixels)
+    with Image.open(result["thumbnail_path"]) as thumbnail:
+        assert thumbnail.size == (76, 300)
+    assert (result["width"], result["height"], result["format"]) == (64, 250, "png")
+    assert result["content_hash"] == file_digest(result["path"])
+    # 지각 해시는 전체 이미지의 첫 화면 영역과 같음
+    assert {k: result[k] for k in ("dhash", "phash")} == perceptual_hashes(Image.fromarray(pixels))
+
+
+def test_strip_writer_pads_missing_rows_and_aborts(tmp_path):
+    writer = StripImageWriter(tmp_path / "page.png", 10, 40, tmp_path / "thumb.png", PNG_OPTIONS)
+    writer.add_strip(_strip(np.zeros((15, 10, 3), dtype=np.uint8)))
+    result = writer.close()
+    with Image.open(result["path"]) as image:
+        pixels = np.asarray(image)
+    assert pixels.shape == (40, 10, 3)
+    assert not pixels[:15].any() and (pixels[15:] == 255).all()
+
+    aborted = StripImageWriter(tmp_path / "aborted.png", 10, 40, tmp_path / "t.png", PNG_OPTIONS)
+    aborted.add_strip(_strip(np.zeros((15, 10, 3), dtype=np.uint8)))
+    aborted.abort()
+    assert not (tmp_path / "aborted.png").exists()
@@ -0,0 +1,93 @@
+import asyncio
+import os
+import uuid
+
+import pytest
+
+if not os.environ.get("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL 이 설정되지 않았습니다", allow_module_level=True)
+
+from sqlalchemy import delete, select
+
+from app.crud.link import page_links, url_hash
+from app.models.capture import Capture
+from app.models.link import Url
+from app.models.page import Page, PageStatus
+from app.models.website import Website
+from app.utils.crawl import crawl_key
+from app.worker.writer import CaptureWriter
+
+
+def test_link_graph_queries(async_session_factory):
+    domain = f"{uuid.uuid4().hex[:12]}.example.com"
+    base = f"https://{domain}"
+
+    async def scenario():
+        async with async_session_factory() as db:
+            website = Website(name=domain, url=f"{base}/", domain=domain)
+            db.add(website)
+            await db.flush()
+            old, new = (Capture(website_id=website.id, status="complete", device_types=["desktop"]) for _ in range(2))
+            db.add_all([old, new])
+            await db.commit()
+            interned = set()
+            try:
+                def row(capture, path, depth, status=PageStatus.COMPLETE.value, http_status=200):
+                    interned.add(crawl_key(f"{base}{path}"))
+                    return {
+                        "url": f"{base}{path}", "website_id": website.id, "capture_id": capture.id,
+                        "depth": depth, "status": status, "http_status": http_status,
+                    }
+
+                await CaptureWriter(db, old.id).create_pages([row(old, "/", 0), row(old, "/old", 1)])
+                writer = CaptureWriter(db, new.id, batch_size=100)
+                root, a, broken, gone, dns = await writer.create_pages([
+                    row(new, "/", 0),
+                    row(new, "/a", 1),
+                    row(new, "/broken", 1, PageStatus.FAILED.value, None),
+                    row(new, "/gone", 1, http_status=404),
+                    row(new, "/dns", 2, PageStatus.SKIPPED.value, None),
+                ])
+                await writer.set_links(root, [
+                    f"{base}/a", f"{base}/broken", f"{base}/gone#top",
+                    "https://external.test/", "mailto:x@y", f"{base}/a",
+                ])
+                await writer.set_links(a, [f"{base}/", f"{base}/a", f"{base}/dns"])
+                interned.add(crawl_key("https://external.test/"))
+                await writer.flush()
+
+                pages = {page.id: page for page in (await db.execute(
+                    select(Page).where(Page.capture_id == new.id)
+                )).scalars()}
+                return {
+                    "ids": (root, a, broken, gone, dns),
+                    "outbound_urls": await page_links.aget_outbound_urls(db, page_ids=[root, a, dns]),
+                    "outbound": await page_links.aget_outbound(db, page=pages[root]),
+                    "inbound": [page.id for page in await page_links.aget_inbound(db, page=pages[a])],
+                    "broken": await page_links.aget_broken(db, capture_id=new.id),
+                    "orphans": [page.url for page in await page_links.aget_orphans(
+                        db, capture_id=new.id, website_id=website.id
+                    )],
+                }
+            finally:
+                await db.execute(delete(Website).where(Website.id == website.id))
+                await db.execute(delete(Url).where(Url.hash.in_([url_hash(url) for url in interned])))
+                await db.commit()
+
+    result = asyncio.run(scenario())
+    root, a, broken, gone, dns = result["ids"]
+    key = lambda path: crawl_key(f"{base}{path}")
+
+    assert result["outbound_urls"] == {
+        root: [key("/a"), key("/broken"), key("/gone"), crawl_key("https://external.test/")],
+        a: [key("/"), key("/a"), key("/dns")],
+    }
+    assert [(entry["url"], entry["page_id"]) for entry in result["outbound"]] == [
+        (key("/a"), a), (key("/broken"), broken), (key("/gone"), gone), (crawl_key("https://external.test/"), None),
+    ]
+    # 자기 자신으로의 링크는 들어오는 링크에서 제외
+    assert result["inbound"] == [root]
+    assert {entry["page_id"]: entry["source_page_ids"] for entry in result["broken"]} == {
+        broken: [root], dns: [a], gone: [root],
+    }
+    assert result["orphans"] == [f"{base}/old"]
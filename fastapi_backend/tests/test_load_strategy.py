@@ -0,0 +1,76 @@
+import time
+
+from app.utils.load_strategy import LoadPlan, LoadProfileStore, LoadStrategy
+
+DOMAIN = "example.com"
+
+
+def _store(tmp_path, **kwargs) -> LoadProfileStore:
+    kwargs.setdefault("min_samples", 2)
+    return LoadProfileStore(tmp_path / "profiles.sqlite3", **kwargs)
+
+
+def _record(store, strategy, elapsed_ms, complete, times=2):
+    for _ in range(times):
+        store.record(DOMAIN, strategy, elapsed_ms, complete)
+
+
+def test_choose_probes_lighter_strategies_while_rendering_is_complete(tmp_path):
+    store = _store(tmp_path)
+    assert store.choose(DOMAIN) == LoadStrategy.NETWORKIDLE
+
+    _record(store, LoadStrategy.NETWORKIDLE, 3000, True)
+    assert store.choose(DOMAIN) == LoadStrategy.LOAD
+    _record(store, LoadStrategy.LOAD, 1500, True)
+    assert store.choose(DOMAIN) == LoadStrategy.DOMCONTENTLOADED
+
+    _record(store, LoadStrategy.DOMCONTENTLOADED, 500, True)
+    assert store.choose(DOMAIN) == LoadStrategy.DOMCONTENTLOADED
+    store.close()
+
+
+def test_choose_stops_probing_after_incomplete_render(tmp_path):
+    store = _store(tmp_path)
+    _record(store, LoadStrategy.NETWORKIDLE, 3000, True)
+    _record(store, LoadStrategy.LOAD, 1000, False)
+
+    # load 가 불완전하면 domcontentloaded 는 시험하지 않고 완전한 전략 사용
+    assert store.choose(DOMAIN) == LoadStrategy.NETWORKIDLE
+    store.close()
+
+
+def test_choose_picks_fastest_qualified_or_most_complete(tmp_path):
+    store = _store(tmp_path)
+    _record(store, LoadStrategy.NETWORKIDLE, 800, True)
+    _record(store, LoadStrategy.LOAD, 900, True)
+    _record(store, LoadStrategy.DOMCONTENTLOADED, 300, False)
+    assert store.choose(DOMAIN) == LoadStrategy.NETWORKIDLE
+
+    other = _store(tmp_path / "other")
+    other.record(DOMAIN, LoadStrategy.NETWORKIDLE, 3000, False)
+    other.record(DOMAIN, LoadStrategy.NETWORKIDLE, 3000, True)
+    # 어떤 전략도 기준에 못 미치면 완전 비율이 가장 높은 전략
+    assert other.choose(DOMAIN) == LoadStrategy.NETWORKIDLE
+    other.close()
+    store.close()
+
+
+def test_record_uses_moving_average_and_expires(tmp_path):
+    store = _store(tmp_path, alpha=0.5, ttl_seconds=60)
+    store.record(DOMAIN, LoadStrategy.LOAD, 1000, True)
+    store.record(DOMAIN, LoadStrategy.LOAD, 2000, False)
+    assert store.profile(DOMAIN)["load"] == {"samples": 2, "completeRatio": 0.5, "elapsedMs": 1500}
+
+    store.db.execute("UPDATE load_profiles SET updated_at = ?", (time.time() - 120,))
+    assert store.profile(DOMAIN) == {}
+    store.record(DOMAIN, LoadStrategy.LOAD, 400, True)
+    assert store.profile(DOMAIN)["load"]["samples"] == 1
+    store.close()
+
+
+def test_plan_resolves_requested_strategy(tmp_path):
+    store = _store(tmp_path)
+    assert store.plan("https://example.com/", "load", "#app") == LoadPlan(LoadStrategy.LOAD, "#app")
+    assert store.plan("https://example.com/", "auto") == LoadPlan(LoadStrategy.NETWORKIDLE, auto=True)
+    assert LoadPlan(LoadStrategy.NETWORKIDLE).wait_until == "load"
+    store.close()
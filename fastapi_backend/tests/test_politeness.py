@@ -0,0 +1,114 @@
+import asyncio
+
+from app.utils.politeness import PolitenessScheduler, RobotsCache
+
+
+def _scheduler(**kwargs) -> PolitenessScheduler:
+    kwargs.setdefault("min_delay", 0.0)
+    return PolitenessScheduler(RobotsCache(user_agent="test"), respect_robots=False, **kwargs)
+
+
+def test_slot_spaces_requests_to_same_domain():
+    scheduler = _scheduler(max_per_domain=2, min_delay=0.05)
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        starts = []
+
+        async def fetch(url):
+            async with scheduler.slot(url):
+                starts.append(loop.time())
+
+        await asyncio.gather(*(fetch(f"https://example.com/{i}") for i in range(3)))
+        return sorted(starts)
+
+    starts = asyncio.run(scenario())
+    assert all(b - a >= 0.045 for a, b in zip(starts, starts[1:]))
+
+
+def test_slot_limits_concurrency_per_domain_only():
+    scheduler = _scheduler(max_per_domain=1)
+
+    async def scenario():
+        active = {"a.com": 0, "b.com": 0}
+        peak = {"a.com": 0, "b.com": 0}
+        both = False
+
+        async def fetch(domain):
+            nonlocal both
+            async with scheduler.slot(f"https://{domain}/"):
+                active[domain] += 1
+                peak[domain] = max(peak[domain], active[domain])
+                both = both or all(active.values())
+                await asyncio.sleep(0.01)
+                active[domain] -= 1
+
+        await asyncio.gather(*(fetch(domain) for domain in ("a.com", "b.com") * 3))
+        return peak, both
+
+    peak, both = asyncio.run(scenario())
+    assert peak == {"a.com": 1, "b.com": 1}
+    assert both  # 다른 도메인은 서로 기다리지 않음
+
+
+def test_idle_domains_are_evicted_beyond_limit():
+    scheduler = _scheduler(max_domains=3)
+
+    async def scenario():
+        for i in range(10):
+            async with scheduler.slot(f"https://site{i}.com/"):
+                pass
+        return list(scheduler._domains)
+
+    assert asyncio.run(scenario()) == ["site7.com", "site8.com", "site9.com"]
+
+
+def test_busy_or_delayed_domains_are_kept():
+    scheduler = _scheduler(max_domains=1, min_delay=60.0)
+
+    async def scenario():
+        async with scheduler.slot("https://busy.com/"):
+            async with scheduler.slot("https://other.com/"):
+                pass
+            # busy.com 은 사용 중, other.com 은 다음 요청까지 기다려야 하므로 둘 다 유지
+            return set(scheduler._domains)
+
+    assert asyncio.run(scenario()) == {"busy.com", "other.com"}
+
+
+def test_recently_used_domain_survives_eviction():
+    scheduler = _scheduler(max_domains=2)
+
+    async def scenario():
+        for url in ("https://a.com/", "https://b.com/", "https://a.com/x", "https://c.com/"):
+            async with scheduler.slot(url):
+                pass
+        return list(scheduler._domains)
+
+    assert asyncio.run(scenario()) == ["a.com", "c.com"]
+
+
+def test_robots_cache_fetches_once_per_origin_and_bounds_entries(monkeypatch):
+    from urllib.robotparser import RobotFileParser
+
+    robots = RobotsCache(user_agent="test", max_entries=2)
+    fetched = []
+
+    async def fake_fetch(origin):
+        fetched.append(origin)
+        parser = RobotFileParser()
+        parser.parse(["User-agent: *", "Disallow: /private", "Crawl-delay: 2"])
+        return parser, 3600
+
+    monkeypatch.setattr(robots, "_fetch", fake_fetch)
+
+    async def scenario():
+        assert await robots.can_fetch("https://a.com/public")
+        assert not await robots.can_fetch("https://a.com/private/x")
+        assert await robots.crawl_delay("https://a.com/") == 2.0
+        await robots.get("https://b.com/")
+        await robots.get("https://c.com/")
+
+    asyncio.run(scenario())
+    assert fetched == ["https://a.com", "https://b.com", "https://c.com"]
+    assert list(robots._entries) == ["https://b.com", "https://c.com"]
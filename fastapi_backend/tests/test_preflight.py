@@ -0,0 +1,75 @@
+import asyncio
+import functools
+import socket
+
+import httpx
+
+from app.utils import preflight as preflight_module
+from app.utils.preflight import PreflightCache, PreflightKind, _dns_not_found
+
+
+def _check(monkeypatch, handler, url="https://example.com/page"):
+    client = functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(preflight_module.httpx, "AsyncClient", client)
+    return asyncio.run(PreflightCache(user_agent="test").check(url))
+
+
+def _response(status, content_type="text/html", **kwargs):
+    return lambda request: httpx.Response(status, headers={"content-type": content_type}, **kwargs)
+
+
+def _raise(error):
+    def handler(request):
+        raise error
+    return handler
+
+
+def _dns_error(errno):
+    error = httpx.ConnectError("dns")
+    error.__cause__ = socket.gaierror(errno, "dns")
+    return error
+
+
+def test_definite_failures_are_skipped(monkeypatch):
+    for handler, kind in [
+        (_response(404), PreflightKind.HTTP_ERROR),
+        (_response(200, "application/pdf"), PreflightKind.NON_HTML),
+        (_raise(_dns_error(socket.EAI_NONAME)), PreflightKind.DNS_NOT_FOUND),
+    ]:
+        result = _check(monkeypatch, handler)
+        assert result.kind == kind and result.should_skip and result.reason
+
+
+def test_transient_failures_fall_through_to_browser(monkeypatch):
+    for handler, kind in [
+        (_response(503), PreflightKind.SERVER_ERROR),
+        (_response(500, "application/json"), PreflightKind.SERVER_ERROR),
+        (_raise(httpx.ConnectTimeout("timeout")), PreflightKind.UNREACHABLE),
+        (_raise(httpx.ConnectError("certificate verify failed")), PreflightKind.UNREACHABLE),
+        (_raise(httpx.TooManyRedirects("redirects")), PreflightKind.UNREACHABLE),
+        (_raise(_dns_error(socket.EAI_AGAIN)), PreflightKind.UNREACHABLE),
+    ]:
+        result = _check(monkeypatch, handler)
+        assert result.kind == kind and not result.should_skip and not result.renderable
+
+
+def test_html_and_sniffed_html_are_renderable(monkeypatch):
+    assert _check(monkeypatch, _response(200)).renderable
+    sniffed = _check(monkeypatch, _response(200, "text/plain", content=b"\n<!DOCTYPE html><html></html>"))
+    assert sniffed.kind == PreflightKind.HTML
+
+
+def test_login_redirect_is_login_wall(monkeypatch):
+    def handler(request):
+        if request.url.path == "/account":
+            return httpx.Response(302, headers={"location": "https://example.com/login?next=/account"})
+        return httpx.Response(200, headers={"content-type": "text/html"})
+
+    result = _check(monkeypatch, handler, "https://example.com/account")
+    assert result.kind == PreflightKind.LOGIN_WALL and result.should_skip and result.redirects == 1
+
+
+def test_dns_not_found_follows_exception_chain():
+    assert _dns_not_found(_dns_error(socket.EAI_NONAME))
+    assert not _dns_not_found(_dns_error(socket.EAI_AGAIN))
+    assert not _dns_not_found(httpx.ConnectError("refused"))
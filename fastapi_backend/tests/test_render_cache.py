@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.utils.render_cache import RenderCoalescer, render_key
+
+DESKTOP = {"type": "desktop", "width": 1920, "height": 1080}
+OPTIONS = {"capture_full_page": True, "capture_dynamic_elements": True}
+
+
+def test_render_key_ignores_device_name_and_url_spelling():
+    key = render_key("https://Example.com:443/a?b=2&a=1#top", DESKTOP, **OPTIONS)
+    assert key == render_key("https://example.com/a?a=1&b=2", {**DESKTOP, "type": "wide"}, **OPTIONS)
+
+
+def test_render_key_resolves_deployment_defaults():
+    key = render_key("https://example.com/", DESKTOP, **OPTIONS)
+    assert key == render_key(
+        "https://example.com/", DESKTOP, **OPTIONS,
+        image_format=settings.SCREENSHOT_FORMAT, load_strategy=settings.CAPTURE_LOAD_STRATEGY,
+    )
+
+
+@pytest.mark.parametrize("change", [
+    {"device": {**DESKTOP, "width": 1280}},
+    {"device": {**DESKTOP, "is_mobile": True}},
+    {"device": {**DESKTOP, "user_agent": "bot"}},
+    {"capture_full_page": False},
+    {"wait_for_selector": "#app"},
+    {"request_policy": {"blockAds": False}},
+])
+def test_render_key_changes_with_rendering_options(change):
+    base = render_key("https://example.com/", DESKTOP, **OPTIONS)
+    kwargs = {**OPTIONS, **change}
+    device = kwargs.pop("device", DESKTOP)
+    assert render_key("https://example.com/", device, **kwargs) != base
+
+
+def test_run_single_flights_same_key():
+    coalescer = RenderCoalescer()
+    calls = []
+
+    async def render():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"path": "a.png"}
+
+    async def scenario():
+        return await asyncio.gather(*(coalescer.run("k", render) for _ in range(3)))
+
+    results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert sorted(shared for _, shared in results) == [False, True, True]
+    assert coalescer.get("k", max_age=60) == {"path": "a.png"}
+    assert coalescer.get("k", max_age=-1) is None
+
+
+def test_run_does_not_remember_failures():
+    coalescer = RenderCoalescer()
+
+    async def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(coalescer.run("k", fail))
+    assert coalescer.get("k", max_age=60) is None
+    assert coalescer._flights == {}
+
+
+def test_run_many_shares_in_flight_keys_with_run():
+    coalescer = RenderCoalescer()
+    batches = []
+
+    async def single():
+        await asyncio.sleep(0.01)
+        return {"path": "single.png"}
+
+    async def render(keys):
+        batches.append(keys)
+        await asyncio.sleep(0.01)
+        return {key: {"path": f"{key}.png"} for key in keys}
+
+    async def scenario():
+        running = asyncio.ensure_future(coalescer.run("a", single))
+        await asyncio.sleep(0)
+        many = asyncio.ensure_future(coalescer.run_many(["a", "b", "c", "b"], render))
+        await asyncio.sleep(0)
+        # 공유 렌더링이 진행 중인 키는 다른 요청도 새로 렌더링하지 않음
+        others = await asyncio.gather(coalescer.run("b", single), coalescer.run_many(["c", "d"], render))
+        return await running, await many, others
+
+    running, many, (single_b, many_cd) = asyncio.run(scenario())
+    assert batches == [["b", "c"], ["d"]]
+    assert running == ({"path": "single.png"}, False)
+    assert many == [
+        ({"path": "single.png"}, True),
+        ({"path": "b.png"}, False),
+        ({"path": "c.png"}, False),
+        ({"path": "b.png"}, True),
+    ]
+    assert single_b == ({"path": "b.png"}, True)
+    assert many_cd == [({"path": "c.png"}, True), ({"path": "d.png"}, False)]
+    assert coalescer.get("c", max_age=60) == {"path": "c.png"}
+    assert coalescer._flights == {}
+
+
+def test_run_many_waiters_see_batch_failure():
+    coalescer = RenderCoalescer()
+
+    async def render(keys):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def scenario():
+        first = asyncio.ensure_future(coalescer.run_many(["a", "b"], render))
+        await asyncio.sleep(0)
+        second = coalescer.run("b", render)
+        return await asyncio.gather(first, second, return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert coalescer._flights == {}
+    assert coalescer.get("a", max_age=60) is None
@@ -0,0 +1,59 @@
+from app.core.config import settings
+from app.utils.request_policy import RequestPolicy, RequestStats
+
+
+def _policy(**kwargs) -> RequestPolicy:
+    kwargs.setdefault("block_resource_types", ["media", "font"])
+    kwargs.setdefault("block_domains", [".tracker.com"])
+    kwargs.setdefault("block_url_patterns", ["*/collect?*"])
+    return RequestPolicy(**kwargs)
+
+
+def test_block_reason_checks_type_domain_and_pattern():
+    policy = _policy()
+    assert policy.block_reason("https://example.com/v.mp4", "media") == "resourceType"
+    assert policy.block_reason("https://cdn.Tracker.com/t.js", "script") == "domain"
+    assert policy.block_reason("https://example.com/collect?v=1", "xhr") == "pattern"
+    assert policy.block_reason("https://example.com/app.js", "script") is None
+    # 하위 도메인만 일치 (이름이 같게 끝나는 다른 도메인은 제외)
+    assert policy.block_reason("https://nottracker.com/t.js", "script") is None
+
+
+def test_main_document_and_allowed_domains_are_never_blocked():
+    policy = _policy(allow_domains=["fonts.example.com"])
+    assert policy.block_reason("https://tracker.com/", "document", is_main_document=True) is None
+    assert policy.block_reason("https://fonts.example.com/a.woff2", "font") is None
+    assert policy.block_reason("https://example.com/a.woff2", "font") == "resourceType"
+
+
+def test_resolve_merges_capture_overrides_with_defaults(monkeypatch):
+    monkeypatch.setattr(settings, "CAPTURE_REQUEST_POLICY_ENABLED", True)
+    monkeypatch.setattr(settings, "CAPTURE_BLOCK_RESOURCE_TYPES", ["media"])
+    monkeypatch.setattr(settings, "CAPTURE_BLOCK_DOMAINS", ["ads.com"])
+    monkeypatch.setattr(settings, "CAPTURE_BLOCK_URL_PATTERNS", [])
+
+    policy = RequestPolicy.resolve({"block_domains": ["tracker.com"]})
+    assert policy.block_resource_types == {"media"}
+    assert policy.block_domains == {"ads.com", "tracker.com"}
+
+    policy = RequestPolicy.resolve({"use_defaults": False, "block_resource_types": []})
+    assert policy.block_resource_types == set() and policy.block_domains == set()
+
+    assert RequestPolicy.resolve({"enabled": False}) is None
+    monkeypatch.setattr(settings, "CAPTURE_REQUEST_POLICY_ENABLED", False)
+    assert RequestPolicy.resolve() is None
+
+
+def test_request_stats_counts_by_reason_and_type():
+    stats = RequestStats()
+    stats.record("script", None)
+    stats.record("media", "resourceType")
+    stats.record("script", "domain")
+    stats.record_cache("hit")
+    assert stats.as_dict() == {
+        "allowed": 1,
+        "blocked": 2,
+        "blockedByReason": {"resourceType": 1, "domain": 1},
+        "blockedByType": {"media": 1, "script": 1},
+        "cache": {"hit": 1},
+    }
@@ -0,0 +1,77 @@
+import os
+
+import pytest
+
+if not os.environ.get("TEST_DATABASE_URL"):
+    # 엔드포인트 모듈은 import 시 DB 엔진을 만듦
+    pytest.skip("TEST_DATABASE_URL 이 설정되지 않았습니다", allow_module_level=True)
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import deps
+from app.api.api_v1.endpoints import capture
+from app.utils.file_cache import ScreenshotFiles, screenshot_files
+
+SCREENSHOT_ID = 987654321
+CONTENT = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def client(tmp_path):
+    path = tmp_path / "shot.png"
+    path.write_bytes(CONTENT)
+    (tmp_path / "thumb.webp").write_bytes(b"thumb")
+    # 캐시에 있으면 DB를 조회하지 않음
+    screenshot_files.set(SCREENSHOT_ID, ScreenshotFiles(
+        path=str(path), format="png", content_hash="abc", thumbnail_path=str(tmp_path / "thumb.webp"),
+        thumbnail_hash="def", tiles_path=None,
+    ))
+
+    async def get_async_db():
+        yield None
+
+    app = FastAPI()
+    app.include_router(capture.router, prefix="/captures")
+    app.dependency_overrides[deps.get_async_db] = get_async_db
+    with TestClient(app) as client:
+        yield client
+    screenshot_files.invalidate(SCREENSHOT_ID)
+
+
+def test_screenshot_has_etag_and_revalidates(client):
+    response = client.get(f"/captures/screenshots/{SCREENSHOT_ID}")
+    assert response.status_code == 200 and response.content == CONTENT
+    assert response.headers["etag"] == '"abc"'
+    assert response.headers["cache-control"] == capture.REVALIDATE_CACHE_CONTROL
+    assert response.headers["content-type"] == "image/png"
+
+    for if_none_match in ('"abc"', 'W/"abc"', '"x", "abc"', "*"):
+        response = client.get(f"/captures/screenshots/{SCREENSHOT_ID}", headers={"If-None-Match": if_none_match})
+        assert response.status_code == 304 and response.content == b""
+    response = client.get(f"/captures/screenshots/{SCREENSHOT_ID}", headers={"If-None-Match": '"other"'})
+    assert response.status_code == 200
+
+
+def test_versioned_urls_are_immutable(client):
+    response = client.get(f"/captures/screenshots/{SCREENSHOT_ID}", params={"v": "abc"})
+    assert response.headers["cache-control"] == capture.IMMUTABLE_CACHE_CONTROL
+    stale = client.get(f"/captures/screenshots/{SCREENSHOT_ID}", params={"v": "old"})
+    assert stale.headers["cache-control"] == capture.REVALIDATE_CACHE_CONTROL
+
+    thumbnail = client.get(f"/captures/screenshots/{SCREENSHOT_ID}/thumbnail", params={"v": "def"})
+    assert thumbnail.content == b"thumb" and thumbnail.headers["etag"] == '"def"'
+    assert thumbnail.headers["cache-control"] == capture.IMMUTABLE_CACHE_CONTROL
+
+
+def test_screenshot_supports_byte_ranges(client):
+    response = client.get(f"/captures/screenshots/{SCREENSHOT_ID}", headers={"Range": "bytes=10-19"})
+    assert response.status_code == 206
+    assert response.content == CONTENT[10:20]
+    assert response.headers["content-range"] == f"bytes 10-19/{len(CONTENT)}"
+
+    # If-Range 의 ETag 가 다르면 전체 응답
+    response = client.get(
+        f"/captures/screenshots/{SCREENSHOT_ID}", headers={"Range": "bytes=10-19", "If-Range": '"old"'}
+    )
+    assert response.status_code == 200 and response.content == CONTENT
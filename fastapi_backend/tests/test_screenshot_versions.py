@@ -0,0 +1,55 @@
+import asyncio
+import os
+import uuid
+
+import pytest
+
+if not os.environ.get("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL 이 설정되지 않았습니다", allow_module_level=True)
+
+from app.crud import screenshots
+from app.models.capture import Capture
+from app.models.page import Page
+from app.models.screenshot import Screenshot
+from app.models.website import Website
+
+
+def test_latest_versions_per_device_exclude_current_capture(async_session_factory):
+    async def scenario():
+        async with async_session_factory() as db:
+            domain = f"{uuid.uuid4().hex[:12]}.example.com"
+            website = Website(name=domain, url=f"https://{domain}/", domain=domain)
+            db.add(website)
+            await db.flush()
+            try:
+                url = f"https://{domain}/"
+                pages = []
+                for _ in range(3):
+                    capture = Capture(website_id=website.id, status="complete", device_types=["desktop"])
+                    db.add(capture)
+                    await db.flush()
+                    page = Page(url=url, website_id=website.id, capture_id=capture.id, status="complete")
+                    db.add(page)
+                    await db.flush()
+                    pages.append(page)
+                for page, version in ((pages[0], 1), (pages[1], 2)):
+                    db.add(Screenshot(path="a", thumbnail_path="b", width=1, height=1, device_type="desktop",
+                                      page_id=page.id, capture_id=page.capture_id, version=version))
+                db.add(Screenshot(path="a", thumbnail_path="b", width=1, height=1, device_type="mobile",
+                                  page_id=pages[0].id, capture_id=pages[0].capture_id, version=1))
+                await db.flush()
+
+                versions = await screenshots.aget_latest_versions(
+                    db, website_id=website.id, url=url, exclude_capture_id=pages[2].capture_id
+                )
+                assert versions == {"desktop": 2, "mobile": 1}
+
+                # 다시 처리 중인 캡처 자신의 스크린샷은 이전 버전으로 보지 않음
+                versions = await screenshots.aget_latest_versions(
+                    db, website_id=website.id, url=url, exclude_capture_id=pages[1].capture_id
+                )
+                assert versions == {"desktop": 1, "mobile": 1}
+            finally:
+                await db.rollback()
+
+    asyncio.run(scenario())
@@ -0,0 +1,70 @@
+import random
+
+import numpy as np
+from PIL import Image
+
+from app.utils.image import perceptual_hashes
+from app.utils.similarity import MultiIndexHashTable, hamming
+
+
+def _screenshot(seed: int, height: int = 300) -> Image.Image:
+    blocks = np.random.default_rng(seed).integers(0, 256, (6, 4), dtype=np.uint8)
+    image = Image.fromarray(blocks).resize((200, 300), Image.NEAREST).convert("RGB")
+    canvas = Image.new("RGB", (200, height), "white")
+    canvas.paste(image, (0, 0))
+    return canvas
+
+
+def test_perceptual_hashes_are_stable_for_near_duplicates():
+    base = perceptual_hashes(_screenshot(1))
+    longer = perceptual_hashes(_screenshot(1, height=900))
+    noisy = np.asarray(_screenshot(1)).astype(np.int16) + np.random.default_rng(0).integers(-6, 7, (300, 200, 3))
+    noisy = perceptual_hashes(Image.fromarray(np.clip(noisy, 0, 255).astype(np.uint8)))
+    other = perceptual_hashes(_screenshot(2))
+
+    for kind in ("dhash", "phash"):
+        assert -(1 << 63) <= base[kind] < (1 << 63)
+        # 첫 화면 영역만 사용하므로 페이지 길이는 무관
+        assert base[kind] == longer[kind]
+        assert hamming(base[kind], noisy[kind]) <= 6
+        assert hamming(base[kind], other[kind]) > 12
+
+
+def test_hamming_handles_signed_values():
+    assert hamming(-1, 0) == 64
+    assert hamming(-1, (1 << 64) - 1) == 0
+    assert hamming(0b1010, 0b0110) == 2
+
+
+def _brute_force(values, query, k, max_distance):
+    found = sorted((hamming(query, value), item) for item, value in enumerate(values))
+    return [entry for entry in found if entry[0] <= max_distance][:k]
+
+
+def test_multi_index_nearest_matches_brute_force():
+    rng = random.Random(7)
+    base = rng.getrandbits(64)
+    # 질의 근처의 해시와 무작위 해시를 섞음
+    values = [base ^ sum(1 << rng.randrange(64) for _ in range(rng.randrange(30))) for _ in range(300)]
+    values += [rng.getrandbits(64) - (1 << 63) for _ in range(300)]
+    table = MultiIndexHashTable()
+    for item, value in enumerate(values):
+        table.add(value, item)
+    assert table.size == len(values)
+
+    for query, k, max_distance in ((base, 10, 64), (base, 5, 12), (values[400], 3, 40), (base ^ 0xFFFF, 20, 20)):
+        expected = _brute_force(values, query, k, max_distance)
+        result = table.nearest(query, k, max_distance)
+        assert [distance for distance, _ in result] == [distance for distance, _ in expected]
+        assert all(hamming(query, values[item]) == distance for distance, item in result)
+
+
+def test_multi_index_groups_duplicates_and_filters_items():
+    table = MultiIndexHashTable()
+    table.add(42, "a")
+    table.add(42, "b")
+    table.add(43, "c")
+
+    assert sorted(table.nearest(42, 3)) == [(0, "a"), (0, "b"), (1, "c")]
+    assert table.nearest(42, 3, predicate=lambda item: item != "a") == [(0, "b"), (1, "c")]
+    assert table.nearest(42, 0) == [] and MultiIndexHashTable().nearest(42, 1) == []
@@ -0,0 +1,137 @@
+import math
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+from app.utils import tiles
+from app.utils.tiles import DZI_DESCRIPTOR, DZI_TILES, build_dzi_pyramid
+
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def _write_png(path, pixels: np.ndarray, filters=(0,), idat_size: int = 997) -> None:
+    """행마다 filters 를 돌려 쓰는 8비트 RGB/RGBA PNG (IDAT 를 잘게 나눔)"""
+    height, width, channels = pixels.shape
+    raw = bytearray()
+    previous = np.zeros(width * channels, dtype=np.uint8)
+    for y in range(height):
+        row = pixels[y].reshape(-1)
+        kind = filters[y % len(filters)]
+        if kind == 1:
+            encoded = row.copy()
+            encoded[channels:] = row[channels:] - row[:-channels]
+        elif kind == 2:
+            encoded = row - previous
+        elif kind == 3:
+            left = np.concatenate([np.zeros(channels, dtype=np.uint8), row[:-channels]])
+            encoded = row - ((left.astype(np.uint16) + previous) // 2).astype(np.uint8)
+        else:
+            encoded = row
+        raw += bytes([kind]) + encoded.tobytes()
+        previous = row
+    data = zlib.compress(bytes(raw))
+    color_type = 2 if channels == 3 else 6
+    with open(path, "wb") as file:
+        file.write(b"\x89PNG\r\n\x1a\n")
+        file.write(_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0)))
+        for start in range(0, len(data), idat_size):
+            file.write(_chunk(b"IDAT", data[start:start + idat_size]))
+        file.write(_chunk(b"IEND", b""))
+
+
+def _pixels(width: int, height: int, channels: int = 3) -> np.ndarray:
+    return np.random.default_rng(width * height).integers(0, 256, (height, width, channels), dtype=np.uint8)
+
+
+def _expected_levels(pixels: np.ndarray):
+    level = pixels[:, :, :3]
+    levels = [level]
+    while max(level.shape[:2]) > 1:
+        if level.shape[0] % 2:
+            level = np.concatenate([level, level[-1:]])
+        level = tiles._half(level)
+        levels.append(level)
+    return levels[::-1]
+
+
+def _assert_pyramid(output_dir, pixels: np.ndarray, tile_size: int, overlap: int) -> None:
+    expected = _expected_levels(pixels)
+    assert sorted(int(p.name) for p in (output_dir / DZI_TILES).iterdir()) == list(range(len(expected)))
+    for number, level in enumerate(expected):
+        height, width = level.shape[:2]
+        level_dir = output_dir / DZI_TILES / str(number)
+        rows, cols = math.ceil(height / tile_size), math.ceil(width / tile_size)
+        assert len(list(level_dir.iterdir())) == rows * cols
+        for row in range(rows):
+            for col in range(cols):
+                top, left = max(0, row * tile_size - overlap), max(0, col * tile_size - overlap)
+                bottom = min(height, (row + 1) * tile_size + overlap)
+                right = min(width, (col + 1) * tile_size + overlap)
+                with Image.open(level_dir / f"{col}_{row}.png") as tile:
+                    assert np.array_equal(np.asarray(tile.convert("RGB")), level[top:bottom, left:right])
+
+
+def _build(source, output_dir, tile_size=16, overlap=1):
+    return build_dzi_pyramid(source, output_dir, tile_size=tile_size, overlap=overlap, tile_format="png")
+
+
+def test_pyramid_streams_strip_png_without_full_decode(tmp_path, monkeypatch):
+    pixels = _pixels(37, 301)
+    source = tmp_path / "page.png"
+    _write_png(source, pixels, filters=(0, 1, 2))
+
+    def full_decode(*args):
+        raise AssertionError("전체 디코딩을 사용함")
+
+    monkeypatch.setattr(tiles, "_decoded_bands", full_decode)
+    monkeypatch.setattr(tiles, "_BAND_ROWS", 7)
+    result = _build(source, tmp_path / "out")
+
+    assert (result["width"], result["height"], result["levels"]) == (37, 301, 10)
+    assert 'Width="37" Height="301"' in (tmp_path / "out" / DZI_DESCRIPTOR).read_text()
+    _assert_pyramid(tmp_path / "out", pixels, 16, 1)
+
+
+def test_pyramid_drops_alpha_channel(tmp_path):
+    pixels = _pixels(20, 9, channels=4)
+    source = tmp_path / "page.png"
+    _write_png(source, pixels, filters=(1, 2))
+
+    _build(source, tmp_path / "out", tile_size=8, overlap=2)
+    _assert_pyramid(tmp_path / "out", pixels, 8, 2)
+
+
+def test_pyramid_falls_back_to_full_decode(tmp_path, monkeypatch):
+    pixels = _pixels(33, 70)
+    monkeypatch.setattr(tiles, "_BAND_ROWS", 5)
+
+    # 중간에 Average 필터 행이 나오는 PNG 는 처음부터 전체 디코딩으로 다시 만듦
+    rows = [0] * 40 + [3] * 30
+    _write_png(tmp_path / "average.png", pixels, filters=rows)
+    Image.fromarray(pixels).save(tmp_path / "page.webp", lossless=True)
+
+    for name in ("average.png", "page.webp"):
+        output_dir = tmp_path / name.replace(".", "_")
+        _build(tmp_path / name, output_dir)
+        _assert_pyramid(output_dir, pixels, 16, 1)
+
+
+def test_pyramid_handles_existing_and_concurrent_targets(tmp_path):
+    pixels = _pixels(40, 40)
+    source = tmp_path / "page.png"
+    _write_png(source, pixels)
+    output_dir = tmp_path / "tiles" / "page"
+
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(lambda _: _build(source, output_dir), range(4)))
+    assert all(result == results[0] for result in results)
+    assert _build(source, output_dir) == results[0]
+
+    _assert_pyramid(output_dir, pixels, 16, 1)
+    # 임시 디렉터리가 남지 않음
+    assert [p.name for p in output_dir.parent.iterdir()] == ["page"]
@@ -0,0 +1,68 @@
+import pytest
+
+from app.utils.crawl import CrawlScope, crawl_key, link_keys
+from app.utils.url import canonicalize_url, validate_url
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("HTTP://Example.COM", "http://example.com/"),
+    ("https://example.com:443/a/", "https://example.com/a"),
+    ("http://example.com:8080/a", "http://example.com:8080/a"),
+    ("https://example.com/a?b=2&a=1#section", "https://example.com/a?a=1&b=2"),
+    ("example.com/path", "https://example.com/path"),
+    ("https://user:pw@example.com/", "https://user:pw@example.com/"),
+    ("http://[::1]:8080/a/", "http://[::1]:8080/a"),
+    ("https://[2001:DB8::1]/", "https://[2001:db8::1]/"),
+])
+def test_canonicalize_url(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+def test_canonicalize_url_is_idempotent():
+    url = canonicalize_url("https://[2001:db8::1]:8443/x/?b=1&a=2")
+    assert canonicalize_url(url) == url
+
+
+@pytest.mark.parametrize("url", ["http://[::1", "http://example.com:99999/", "http://example.com:abc/"])
+def test_canonicalize_url_rejects_malformed_host(url):
+    with pytest.raises(ValueError):
+        canonicalize_url(url)
+
+
+def test_crawl_key_removes_tracking_params():
+    assert crawl_key("https://example.com/?utm_source=x&utm_medium=y&id=3&gclid=abc") == "https://example.com/?id=3"
+
+
+def test_validate_url():
+    assert validate_url("https://example.com")
+    assert not validate_url("")
+    assert not validate_url("example.com")
+    assert not validate_url("http://[::1")
+    assert not validate_url("http://example.com:99999/")
+
+
+def test_filter_links_skips_malformed_and_out_of_scope_links():
+    scope = CrawlScope("https://example.com/", exclude_patterns=[r"/logout"])
+    links = [
+        "https://example.com/a#top",
+        "http://[::1",
+        "https://example.com/a?utm_source=newsletter",
+        "https://example.com:99999/b",
+        "https://www.example.com/b",
+        "https://other.com/",
+        "mailto:someone@example.com",
+        "https://example.com/logout",
+    ]
+    assert scope.filter_links(links) == ["https://example.com/a", "https://www.example.com/b"]
+
+
+def test_filter_links_same_domain_off():
+    scope = CrawlScope("https://example.com/", same_domain=False, include_patterns=[r"/docs/"])
+    links = ["https://other.com/docs/x", "https://example.com/blog"]
+    assert scope.filter_links(links) == ["https://other.com/docs/x"]
+
+
+def test_link_keys_keeps_http_links_in_order():
+    links = ["https://b.com/", "javascript:void(0)", "https://a.com/?utm_source=x", "https://B.com", "http://[::1"]
+    assert link_keys(links) == ["https://b.com/", "https://a.com/"]
+    assert link_keys(links, limit=1) == ["https://b.com/"]
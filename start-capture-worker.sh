@@ -0,0 +1,6 @@
+#!/bin/bash
+cd fastapi_backend
+# 데이터베이스 URL 환경변수가 이미 설정되어 있음을 확인
+echo "Using DATABASE_URL: ${DATABASE_URL}"
+# 캡처 워커 실행 (여러 노드에서 동시에 실행 가능)
+python -m app.worker